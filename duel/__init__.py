@@ -6,7 +6,9 @@ Created on Tue Jan 25 14:09:46 2022
 @author: Christopher Corbell
 """
 
-__all__ = ["duelist", "duel"]
+__all__ = ["duelist", "duel", "montecarlo", "sweep"]
 
 from duel.duelist import Duelist
-from duel.duel import Duel
+from duel.duel import Duel, NeverFiresException, Strategy
+from duel.montecarlo import MonteCarloDuel
+from duel.sweep import StrategySweep
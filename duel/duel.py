@@ -8,8 +8,16 @@ Created on Tue Jan 25 14:12:37 2022
 
 from duel.duelist import Duelist
 from prob.pfunc import PFunc, LinearRangePFunc
+import random
 import time
 
+class NeverFiresException(Exception):
+    """
+    Raised by Duel.evaluateStrategy when neither player fires before
+    they meet, so the duel never ends.
+    """
+    pass
+
 class Strategy:
     """
     A duel.Strategy dictates how players will decide to step vs. fire in a game.
@@ -19,11 +27,15 @@ class Strategy:
     
     In threshold strategy, each player has a (possibly different) probability
     threshold for when they will choose to fire.
+    
+    In mixed strategy, each player fires on each of their turns with a 
+    (possibly different) fixed probability, regardless of aim.
     """
 
     # Type constants:
     OPTIMAL = 1 # fire when sum of aim probabiities is 1
     THRESHOLD = 2 # fire with per-player probability threshold is crossed
+    MIXED = 3 # fire with per-player probability on each turn
     
     def __init__(self, strategyType:int, 
                  player1value=None, 
@@ -40,6 +52,24 @@ class Strategy:
                 return player1chance >= self.player1value
             elif playerIndex == 1:
                 return player2chance >= self.player2value
+        elif self.type == Strategy.MIXED:
+            return random.uniform(0, 1) < self.fireProbability(player1chance, player2chance, playerIndex)
+    
+    def fireProbability(self, player1chance, player2chance, playerIndex):
+        """
+        Get the probability that a player fires on their turn, given both
+        players' aim chances: 0 or 1 for the deterministic strategies.
+        """
+        if self.type == Strategy.MIXED:
+            if playerIndex == 0:
+                return self.player1value
+            return self.player2value
+        if self.shouldFire(player1chance, player2chance, playerIndex):
+            return 1.0
+        return 0.0
+    
+    def isDeterministic(self):
+        return not self.type == Strategy.MIXED
     
 class Duel:
     
@@ -55,7 +85,10 @@ class Duel:
     
     """
     
-    
+    # players who pass each other keep stepping, so a game can end after
+    # they meet; a game that has gone this many times the starting
+    # distance without a shot is counted as never ending
+    ROUND_LIMIT_FACTOR = 8
             
     def __init__(self, 
                  distance=20,
@@ -165,6 +198,93 @@ class Duel:
                 "gameRound": self.gameRound}
     
         
+    def evaluateStrategy(self, strategy):
+        """
+        Compute the exact outcome of a duel played with a strategy, 
+        without simulating it. 
+        
+        The players' decisions depend only on the distance between them,
+        so a game is deterministic up to the one shot fired: this walks
+        the game's turns once, looking up each player's compiled aim table
+        (see Duelist.compileAim) at each turn's distance, to find the round
+        and the player who fires, whose chance of hitting (see 
+        hitProbability) is then the probability that they win. As in
+        runGameWithStrategy, players who pass each other keep stepping, so
+        the distance grows again after they meet; the walk goes on for
+        up to ROUND_LIMIT_FACTOR times the starting distance.
+
+        Parameters
+        ----------
+        strategy : Strategy
+            The strategy the players follow.
+
+        Raises
+        ------
+        Exception
+            If the strategy is not deterministic (see 
+            duel.montecarlo.MonteCarloDuel for sampling those).
+        NeverFiresException
+            If neither player fires within the turns walked, in which case
+            the game is taken not to end.
+
+        Returns
+        -------
+        A dictionary with the keys:
+            "player1winChance" - the probability that player 1 wins
+            "firingPlayer" - the index (0 or 1) of the player who fires
+            "gameRound" - the number of turns the game lasts, 
+                          including the firing turn; the length is the
+                          same in every game, so this is also the
+                          expected length
+            "distance" - the distance at which the shot is fired
+
+        """
+        if not strategy.isDeterministic():
+            raise Exception("Only deterministic strategies can be evaluated exactly")
+        startDistance = self.maxPos - self.minPos
+        maxRounds = Duel.ROUND_LIMIT_FACTOR * startDistance + 1
+        maxDistance = max(startDistance, maxRounds - 1 - startDistance)
+        player1chances = self.players[0].compileAim(maxDistance).table
+        player2chances = self.players[1].compileAim(maxDistance).table
+        for gameRound in range(0, maxRounds):
+            playerIndex = gameRound % 2
+            distance = abs(startDistance - gameRound)
+            player1chance = player1chances[distance]
+            player2chance = player2chances[distance]
+            if strategy.shouldFire(player1chance, player2chance, playerIndex):
+                if playerIndex == 0:
+                    player1winChance = Duel.hitProbability(player1chance)
+                else:
+                    player1winChance = 1.0 - Duel.hitProbability(player2chance)
+                return {"player1winChance": player1winChance,
+                        "firingPlayer": playerIndex,
+                        "gameRound": gameRound + 1,
+                        "distance": distance}
+        raise NeverFiresException(f"Neither player fires within {maxRounds} turns with this strategy, so the duel never ends")
+    
+    def hitProbability(chance):
+        """
+        Return the probability that a shot with an aim chance hits. Aim
+        functions aren't limited to [0, 1] (LinearRangePFunc's default
+        minProb is 100.0), and as in Duelist.fire a chance above 1 always
+        hits and one below 0 never does.
+        """
+        return min(1.0, max(0.0, chance))
+    
+    def evaluateAimThresholdStrategy(self, player1Threshold=0.6, player2Threshold=0.5):
+        """
+        Compute the exact outcome of a duel with the aim-threshold 
+        strategy; see evaluateStrategy.
+        """
+        return self.evaluateStrategy(Strategy(Strategy.THRESHOLD, player1Threshold, player2Threshold))
+    
+    def evaluateOptimalStrategy(self):
+        """
+        Compute the exact outcome of a duel with the optimal strategy;
+        see evaluateStrategy.
+        """
+        return self.evaluateStrategy(Strategy(Strategy.OPTIMAL))
+        
     def runAimChanceThresholdGame(self, player1Threshold = 0.6, player2Threshold = 0.5):
         strategy = Strategy(Strategy.THRESHOLD, player1Threshold, player2Threshold)
         return self.runGameWithStrategy(strategy)
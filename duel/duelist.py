@@ -18,6 +18,21 @@ class Duelist:
     def __repr__(self):
         return f"{self.name} is at {self.position}"
     
+    def compileAim(self, maxDistance:int):
+        """
+        Tabulate the aim function for distances 0..maxDistance (see
+        prob.pfunc.CompiledPFunc). Tables are kept by the aim function
+        (see PFunc.compile), so they are reused until it is changed or
+        replaced; compile again rather than holding on to the result.
+
+        Returns
+        -------
+        CompiledPFunc
+            The compiled aim function.
+
+        """
+        return self.aimfunction.compile(maxDistance)
+    
     def currentChance(self, targetPosition):
         distance = abs(self.position - targetPosition)
         #print (f"DEBUG: currentChance for {self.name}, distance is {distance}")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 01:08:25 2026
+
+@author: Christopher Corbell
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from duel.duel import Duel, Strategy
+
+class MonteCarloDuel:
+    """
+    MonteCarloDuel samples the outcomes of many duels at once with NumPy,
+    as a fast alternative to looping Duel.runGameWithStrategy (and with
+    no verbose output or drama timing). It handles mixed strategies,
+    which Duel.evaluateStrategy can't evaluate exactly.
+
+    The round in which a duel's shot is fired and the firing player's
+    chance to hit only depend on the strategy and the aim functions, so
+    they are tabulated once per strategy (see roundTable). Each batch of
+    trials then takes a single (N, 2) draw from the random generator:
+    the first column picks each trial's firing round from the
+    distribution of firing rounds, the second decides whether the
+    shot hits.
+
+    The same seed gives the same results. NumPy is needed for this class
+    only; it is not otherwise a dependency of this package.
+    """
+
+    DEFAULT_BATCH_SIZE = 100000
+
+    # a game that has gone this many times the starting distance is
+    # counted as unfinished (see Duel.evaluateStrategy)
+    ROUND_LIMIT_FACTOR = Duel.ROUND_LIMIT_FACTOR
+
+    def __init__(self, duel:Duel, seed=None, batchSize=DEFAULT_BATCH_SIZE):
+        """
+        Parameters
+        ----------
+        duel : Duel
+            The duel (distance and aim functions) to sample; it is not changed.
+        seed : int, optional
+            Seed for the random generator.
+        batchSize : int, optional
+            The number of trials drawn at once.
+
+        """
+        MonteCarloDuel.requireNumpy()
+        self.duel = duel
+        self.batchSize = batchSize
+        self.rng = np.random.default_rng(seed)
+
+    def roundTable(self, strategy:Strategy, maxRounds=None):
+        """
+        Tabulate the rounds of a duel played with a strategy.
+
+        As in Duel.runGameWithStrategy, players alternate turns starting
+        with player 1, the distance drops by one with each step, and
+        players who pass each other keep stepping (so the distance
+        grows again).
+
+        Parameters
+        ----------
+        strategy : Strategy
+            The strategy the players follow.
+        maxRounds : int, optional
+            The number of rounds to tabulate; by default ROUND_LIMIT_FACTOR
+            times the starting distance (plus 1). Fewer are tabulated if
+            the shot is certain to have been fired sooner.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            For each round: the index of the player on turn, the probability
+            that the shot has been fired by the end of the round, and the
+            player on turn's chance to hit (see Duel.hitProbability).
+
+        """
+        distance = self.duel.maxPos - self.duel.minPos
+        if None == maxRounds:
+            maxRounds = MonteCarloDuel.ROUND_LIMIT_FACTOR * distance + 1
+        maxDistance = max(distance, maxRounds - 1 - distance)
+        player1func = self.duel.players[0].compileAim(maxDistance)
+        player2func = self.duel.players[1].compileAim(maxDistance)
+
+        players = []
+        fired = []
+        hitChances = []
+        notFired = 1.0
+        for gameRound in range(0, maxRounds):
+            playerIndex = gameRound % 2
+            currentDistance = abs(distance - gameRound)
+            player1chance = player1func.evaluate(currentDistance)
+            player2chance = player2func.evaluate(currentDistance)
+            notFired *= 1.0 - strategy.fireProbability(player1chance, player2chance, playerIndex)
+            players.append(playerIndex)
+            fired.append(1.0 - notFired)
+            hitChances.append(Duel.hitProbability(player1chance if playerIndex == 0 else player2chance))
+            if notFired <= 0.0:
+                break
+        return np.array(players, dtype=np.int8), np.array(fired), np.array(hitChances)
+
+    def runTrials(self, strategy:Strategy, numberOfTrials=1000000, z=1.96):
+        """
+        Sample a number of duels played with a strategy.
+
+        Parameters
+        ----------
+        strategy : Strategy
+            The strategy the players follow.
+        numberOfTrials : int, optional
+            The number of duels to sample. The default is 1000000.
+        z : float, optional
+            The normal quantile for the confidence interval; the default
+            gives 95% confidence.
+
+        Returns
+        -------
+        A dictionary with the keys:
+            "count" - total duels sampled
+            "player1wins" - total number of player 1 wins
+            "player2wins" - total number of player 2 wins
+            "unfinished" - duels in which no one fired within the
+                           tabulated rounds (see roundTable)
+            "player1winRate" - player 1 wins over finished duels
+            "confidenceInterval" - Wilson score interval for player1winRate
+            "lengthHistogram" - array of the number of finished duels
+                                by game length (turns, including the
+                                firing turn)
+            "meanGameRound" - mean length of the finished duels
+
+        """
+        players, fired, hitChances = self.roundTable(strategy)
+        player1wins = 0
+        unfinished = 0
+        histogram = np.zeros(len(fired) + 1, dtype=np.int64)
+
+        remaining = numberOfTrials
+        while remaining > 0:
+            count = min(remaining, self.batchSize)
+            remaining -= count
+            draws = self.rng.random((count, 2))
+            rounds = np.searchsorted(fired, draws[:, 0], side='right')
+            finished = rounds < len(fired)
+            unfinished += count - int(np.count_nonzero(finished))
+            rounds = rounds[finished]
+            hits = draws[finished, 1] < hitChances[rounds]
+            # player 1 wins if they hit, or if player 2 misses
+            player1wins += int(np.count_nonzero(hits == (players[rounds] == 0)))
+            histogram += np.bincount(rounds + 1, minlength=len(histogram))
+
+        finishedCount = numberOfTrials - unfinished
+        if finishedCount > 0:
+            winRate = player1wins / finishedCount
+            meanRound = float(np.dot(np.arange(0, len(histogram)), histogram)) / finishedCount
+        else:
+            winRate = None
+            meanRound = None
+        return {"count": numberOfTrials,
+                "player1wins": player1wins,
+                "player2wins": finishedCount - player1wins,
+                "unfinished": unfinished,
+                "player1winRate": winRate,
+                "confidenceInterval": MonteCarloDuel.wilsonInterval(player1wins, finishedCount, z),
+                "lengthHistogram": histogram,
+                "meanGameRound": meanRound}
+
+    def wilsonInterval(successes, count, z=1.96):
+        """
+        Return the Wilson score interval (low, high) for a proportion of
+        successes in count trials, or None if count is 0.
+        """
+        if count <= 0:
+            return None
+        rate = successes / count
+        zz = z * z
+        denominator = 1.0 + zz / count
+        center = (rate + zz / (2 * count)) / denominator
+        halfWidth = z * math.sqrt(rate * (1.0 - rate) / count + zz / (4 * count * count)) / denominator
+        return max(0.0, center - halfWidth), min(1.0, center + halfWidth)
+
+    def requireNumpy():
+        if None == np:
+            raise ImportError("duel.montecarlo.MonteCarloDuel requires numpy")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 01:44:37 2026
+
+@author: Christopher Corbell
+"""
+
+from duel.duel import Duel, NeverFiresException, Strategy
+from duel.montecarlo import MonteCarloDuel
+from prob.pfunc import PFunc
+from treegen.parallel import ParallelExpander
+
+class StrategySweep:
+    """
+    A StrategySweep evaluates a grid of strategy parameters for a duel
+    (a player 1 value against a player 2 value in every cell), giving the
+    payoff matrix of player 1's win chances and the players' best
+    responses and minimax choices over the grid.
+
+    Threshold strategies are deterministic, so their cells are computed
+    exactly with Duel.evaluateStrategy. Mixed strategies (fire
+    probabilities) are sampled with MonteCarloDuel, spreading the rows of
+    the grid over worker processes if workers is more than 1.
+
+    Cell results are cached by the duel configuration (distance and aim
+    functions), strategy type and values, and for sampled cells the
+    number of trials and seed, so repeated or overlapping sweeps of a
+    configuration only evaluate new cells. Sweeps can share
+    a cache by passing the same dict.
+    """
+
+    DEFAULT_TRIALS = 100000
+
+    def __init__(self, workers=1, seed=None, cache:dict=None):
+        """
+        Parameters
+        ----------
+        workers : int, optional
+            The number of worker processes for sampled sweeps.
+        seed : int, optional
+            Seed for sampled sweeps; each row of a grid is sampled with
+            its own generator seeded from this and the row's value.
+        cache : dict, optional
+            The cell cache to use; by default a new one.
+
+        """
+        if None == cache:
+            cache = {}
+        self.cache = cache
+        self.workers = workers
+        self.seed = seed
+
+    def sweep(self, player1Values, player2Values,
+              distance=20,
+              player1func:PFunc=None,
+              player2func:PFunc=None,
+              strategyType=Strategy.THRESHOLD,
+              numberOfTrials=DEFAULT_TRIALS):
+        """
+        Evaluate every pair of player 1 and player 2 strategy values.
+
+        Parameters
+        ----------
+        player1Values : list of float
+            Player 1's strategy values (thresholds, or fire probabilities
+            for mixed strategies); the rows of the grid.
+        player2Values : list of float
+            Player 2's strategy values; the columns of the grid.
+        distance, player1func, player2func
+            The duel configuration, as for Duel.
+        strategyType : int, optional
+            Strategy.THRESHOLD (the default) or Strategy.MIXED.
+        numberOfTrials : int, optional
+            The number of duels sampled per cell for mixed strategies.
+
+        Returns
+        -------
+        A dictionary with the keys:
+            "payoff" - the matrix (list of rows) of player 1's win chance
+                       for each player 1 value (row) and player 2 value
+                       (column)
+            "player1BestResponses" - player 1's best value against each
+                                     player 2 value
+            "player2BestResponses" - player 2's best value against each
+                                     player 1 value
+            "maximin" - (player 1 value, the win chance it guarantees
+                        player 1 over the grid)
+            "minimax" - (player 2 value, the win chance it holds
+                        player 1 to over the grid)
+            "saddlePoint" - (player 1 value, player 2 value), a pure
+                            equilibrium, if maximin and minimax meet;
+                            otherwise None
+
+        """
+        duel = Duel(distance, player1func, player2func, verbose=False, dramaTiming=False)
+        config = StrategySweep.configKey(duel)
+        if strategyType == Strategy.MIXED:
+            # a sampled cell also depends on its sample
+            config = (config, numberOfTrials, self.seed)
+
+        missingRows = []
+        for value1 in player1Values:
+            missing = [value2 for value2 in player2Values
+                       if not (config, strategyType, value1, value2) in self.cache]
+            if len(missing) > 0:
+                missingRows.append((value1, missing))
+
+        if strategyType == Strategy.MIXED:
+            tasks = [(distance, duel.players[0].aimfunction, duel.players[1].aimfunction,
+                      value1, missing, numberOfTrials, self.rowSeed(value1))
+                     for value1, missing in missingRows]
+            with ParallelExpander(self.workers, chunkSize=1) as expander:
+                rowResults = expander.map(StrategySweep.sampleRows, tasks)
+        else:
+            rowResults = [[StrategySweep.evaluateCell(duel, Strategy(strategyType, value1, value2))
+                           for value2 in missing]
+                          for value1, missing in missingRows]
+
+        for n in range(0, len(missingRows)):
+            value1, missing = missingRows[n]
+            for m in range(0, len(missing)):
+                self.cache[(config, strategyType, value1, missing[m])] = rowResults[n][m]
+
+        payoff = [[self.cache[(config, strategyType, value1, value2)] for value2 in player2Values]
+                  for value1 in player1Values]
+        return StrategySweep.analyze(payoff, player1Values, player2Values)
+
+    def analyze(payoff, player1Values, player2Values):
+        """
+        Find the best responses and minimax choices of a payoff matrix
+        of player 1 win chances (see sweep).
+        """
+        rows = range(0, len(player1Values))
+        columns = range(0, len(player2Values))
+
+        player1Best = [player1Values[max(rows, key=lambda i: payoff[i][j])] for j in columns]
+        player2Best = [player2Values[min(columns, key=lambda j: payoff[i][j])] for i in rows]
+
+        rowMinimums = [min(payoff[i]) for i in rows]
+        columnMaximums = [max([payoff[i][j] for i in rows]) for j in columns]
+        maximinRow = max(rows, key=lambda i: rowMinimums[i])
+        minimaxColumn = min(columns, key=lambda j: columnMaximums[j])
+
+        saddlePoint = None
+        if rowMinimums[maximinRow] == columnMaximums[minimaxColumn]:
+            saddlePoint = (player1Values[maximinRow], player2Values[minimaxColumn])
+
+        return {"payoff": payoff,
+                "player1BestResponses": player1Best,
+                "player2BestResponses": player2Best,
+                "maximin": (player1Values[maximinRow], rowMinimums[maximinRow]),
+                "minimax": (player2Values[minimaxColumn], columnMaximums[minimaxColumn]),
+                "saddlePoint": saddlePoint}
+
+    def evaluateCell(duel:Duel, strategy:Strategy):
+        """
+        Return player 1's exact win chance for a deterministic strategy;
+        a duel in which neither player ever fires counts as even (0.5).
+        """
+        try:
+            return duel.evaluateStrategy(strategy)["player1winChance"]
+        except NeverFiresException:
+            return 0.5
+
+    def sampleRows(tasks):
+        """
+        Sample rows of a mixed-strategy grid; this is the unit of work for
+        parallel sweeps. Each task is (distance, player1func, player2func,
+        player 1 value, player 2 values, trials, seed).
+        """
+        results = []
+        for distance, player1func, player2func, value1, values2, numberOfTrials, seed in tasks:
+            duel = Duel(distance, player1func, player2func, verbose=False, dramaTiming=False)
+            sampler = MonteCarloDuel(duel, seed=seed)
+            row = []
+            for value2 in values2:
+                rate = sampler.runTrials(Strategy(Strategy.MIXED, value1, value2), numberOfTrials)["player1winRate"]
+                row.append(0.5 if None == rate else rate)
+            results.append(row)
+        return results
+
+    def rowSeed(self, value1):
+        if None == self.seed:
+            return None
+        return [self.seed, hash(value1) & 0xFFFFFFFF]
+
+    def configKey(duel:Duel):
+        """
+        Return a hashable key for a duel's distance and aim functions
+        (see PFunc.key).
+        """
+        return (duel.maxPos - duel.minPos,
+                duel.players[0].aimfunction.key(),
+                duel.players[1].aimfunction.key())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 00:52:40 2026
+
+@author: Christopher Corbell
+"""
+
+import random
+import unittest
+
+from duel.duel import Duel, NeverFiresException, Strategy
+from prob.pfunc import LinearRangePFunc, PiecewiseLinearPFunc
+
+def RunAllDuelTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(DuelTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1DuelTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(DuelTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def dueltests_main():
+    unittest.main()
+
+class DuelTests(unittest.TestCase):
+
+    def testEvaluateStrategy(self):
+        duel = Duel(verbose=False, dramaTiming=False)
+
+        # at distance 9, player 1's chance is 11/19 and player 2's is 0.65 - 0.45 * 8/19
+        optimal = duel.evaluateOptimalStrategy()
+        self.assertEqual(1, optimal["firingPlayer"])
+        self.assertEqual(12, optimal["gameRound"])
+        self.assertEqual(9, optimal["distance"])
+        self.assertAlmostEqual(1.0 - (0.65 - 0.45 * 8 / 19), optimal["player1winChance"])
+
+        threshold = duel.evaluateAimThresholdStrategy(0.6, 0.5)
+        self.assertEqual(0, threshold["firingPlayer"])
+        self.assertEqual(8, threshold["distance"])
+        self.assertAlmostEqual(12 / 19, threshold["player1winChance"])
+
+        # the exact results agree with sampled games
+        random.seed(7)
+        trials = duel.runAimThresholdStrategyTrials(0.6, 0.5, numberOfTrials=4000)
+        self.assertAlmostEqual(threshold["player1winChance"], trials["player1wins"] / trials["count"], delta=0.03)
+        result = duel.runAimChanceThresholdGame(0.6, 0.5)
+        self.assertEqual(threshold["gameRound"], result["gameRound"])
+
+    def testChangedAimFunction(self):
+        aim = LinearRangePFunc(1, 20, 0.65, 0.2)
+        duel = Duel(player2func=aim, verbose=False, dramaTiming=False)
+        before = duel.evaluateAimThresholdStrategy(0.6, 0.5)
+        self.assertEqual(0, before["firingPlayer"])
+
+        # player 2 now aims well enough to fire first
+        aim.minProb = 0.95
+        aim.maxProb = 0.55
+        self.assertAlmostEqual(0.55, duel.players[1].currentChance(duel.players[0].position))
+        after = duel.evaluateAimThresholdStrategy(0.6, 0.5)
+        self.assertEqual(1, after["firingPlayer"])
+        self.assertEqual(19, after["distance"])
+        self.assertAlmostEqual(1.0 - (0.95 - 0.4 * 18 / 19), after["player1winChance"])
+
+        duel.players[1].aimfunction = LinearRangePFunc(1, 20, 0.65, 0.2)
+        self.assertEqual(before, duel.evaluateAimThresholdStrategy(0.6, 0.5))
+
+    def testAimOutsideUnitRange(self):
+        # LinearRangePFunc's default minProb is 100.0, so player 1's aim
+        # is 11.1 (a sure hit) at distance 9
+        duel = Duel(distance=10,
+                    player1func=LinearRangePFunc(1, 10),
+                    player2func=LinearRangePFunc(1, 10, 0.9, 0.3),
+                    verbose=False, dramaTiming=False)
+        threshold = duel.evaluateAimThresholdStrategy(5.0, 0.9)
+        self.assertEqual(0, threshold["firingPlayer"])
+        self.assertEqual(8, threshold["distance"])
+        self.assertEqual(1.0, threshold["player1winChance"])
+
+        # a chance below 0 never hits, so player 2's shot is a sure miss
+        swapped = Duel(distance=10,
+                       player1func=LinearRangePFunc(1, 10, 0.9, 0.3),
+                       player2func=LinearRangePFunc(1, 10, -50.0, 0.3),
+                       verbose=False, dramaTiming=False)
+        threshold = swapped.evaluateAimThresholdStrategy(0.9, -10.0)
+        self.assertEqual(1, threshold["firingPlayer"])
+        self.assertEqual(1.0, threshold["player1winChance"])
+
+    def testFiringAfterMeeting(self):
+        # aim improves with distance, so the players only reach their
+        # thresholds after passing each other
+        duel = Duel(distance=20,
+                    player1func=PiecewiseLinearPFunc([0, 40], [0.0, 1.0]),
+                    player2func=PiecewiseLinearPFunc([0, 40], [0.0, 1.0]),
+                    verbose=False, dramaTiming=False)
+        strategy = Strategy(Strategy.THRESHOLD, 0.6, 0.6)
+        exact = duel.evaluateStrategy(strategy)
+        self.assertEqual(0, exact["firingPlayer"])
+        self.assertEqual(24, exact["distance"])
+        self.assertEqual(45, exact["gameRound"])
+        self.assertAlmostEqual(0.6, exact["player1winChance"])
+
+        random.seed(5)
+        wins = 0
+        for n in range(0, 2000):
+            game = duel.runGameWithStrategy(strategy)
+            self.assertEqual(exact["gameRound"], game["gameRound"])
+            wins += game["winner"] == 0
+        self.assertAlmostEqual(exact["player1winChance"], wins / 2000, delta=0.04)
+
+    def testNeverFires(self):
+        duel = Duel(distance=6,
+                    player1func=LinearRangePFunc(1, 6, 0.5, 0.0),
+                    player2func=LinearRangePFunc(1, 6, 0.5, 0.0),
+                    verbose=False, dramaTiming=False)
+        with self.assertRaises(NeverFiresException):
+            duel.evaluateStrategy(Strategy(Strategy.THRESHOLD, 0.9, 0.9))
+
+if __name__ == "__main__":
+    dueltests_main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 01:26:14 2026
+
+@author: Christopher Corbell
+"""
+
+import random
+import unittest
+
+from duel.duel import Duel, Strategy
+from duel.montecarlo import MonteCarloDuel, np
+from prob.pfunc import LinearRangePFunc
+
+def RunAllMonteCarloTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(MonteCarloTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1MonteCarloTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(MonteCarloTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def montecarlotests_main():
+    unittest.main()
+
+@unittest.skipIf(None == np, "numpy is not installed")
+class MonteCarloTests(unittest.TestCase):
+
+    def testDeterministicStrategy(self):
+        duel = Duel(verbose=False, dramaTiming=False)
+        strategy = Strategy(Strategy.THRESHOLD, 0.6, 0.5)
+        exact = duel.evaluateStrategy(strategy)
+
+        results = MonteCarloDuel(duel, seed=11, batchSize=30000).runTrials(strategy, 100000)
+        self.assertEqual(100000, results["player1wins"] + results["player2wins"])
+        self.assertEqual(0, results["unfinished"])
+        self.assertEqual(100000, results["lengthHistogram"][exact["gameRound"]])
+        low, high = results["confidenceInterval"]
+        self.assertTrue(low < exact["player1winChance"] < high)
+
+        again = MonteCarloDuel(duel, seed=11, batchSize=30000).runTrials(strategy, 100000)
+        self.assertEqual(results["player1wins"], again["player1wins"])
+
+    def testMixedStrategy(self):
+        duel = Duel(distance=10, verbose=False, dramaTiming=False)
+        strategy = Strategy(Strategy.MIXED, 0.2, 0.3)
+        with self.assertRaises(Exception):
+            duel.evaluateStrategy(strategy)
+
+        results = MonteCarloDuel(duel, seed=2).runTrials(strategy, 200000)
+        random.seed(2)
+        wins = 0
+        rounds = 0
+        for n in range(0, 5000):
+            game = duel.runGameWithStrategy(strategy)
+            wins += game["winner"] == 0
+            rounds += game["gameRound"]
+        self.assertAlmostEqual(results["player1winRate"], wins / 5000, delta=0.03)
+        self.assertAlmostEqual(results["meanGameRound"], rounds / 5000, delta=0.2)
+        # the first shot is likeliest on turn 2: 0.8 * 0.3 > 0.2
+        self.assertEqual(2, results["lengthHistogram"].argmax())
+
+    def testAimOutsideUnitRange(self):
+        # player 1's aim is above 1 and player 2's below 0 at close range
+        duel = Duel(distance=10,
+                    player1func=LinearRangePFunc(1, 10),
+                    player2func=LinearRangePFunc(1, 10, -50.0, 0.3),
+                    verbose=False, dramaTiming=False)
+        sampler = MonteCarloDuel(duel, seed=3)
+        players, fired, hitChances = sampler.roundTable(Strategy(Strategy.MIXED, 0.5, 0.5))
+        self.assertTrue(all((hitChances >= 0.0) & (hitChances <= 1.0)))
+        self.assertEqual(1.0, hitChances[2])
+        self.assertEqual(0.0, hitChances[1])
+
+        strategy = Strategy(Strategy.THRESHOLD, 5.0, -10.0)
+        self.assertEqual(duel.evaluateStrategy(strategy)["player1winChance"],
+                         sampler.runTrials(strategy, 1000)["player1winRate"])
+
+    def testWilsonInterval(self):
+        low, high = MonteCarloDuel.wilsonInterval(50, 100)
+        self.assertAlmostEqual(0.4038, low, places=4)
+        self.assertAlmostEqual(0.5962, high, places=4)
+        self.assertEqual(0.0, MonteCarloDuel.wilsonInterval(0, 10)[0])
+        self.assertEqual(None, MonteCarloDuel.wilsonInterval(0, 0))
+
+if __name__ == "__main__":
+    montecarlotests_main()
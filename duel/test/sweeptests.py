@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 02:03:50 2026
+
+@author: Christopher Corbell
+"""
+
+import unittest
+
+from duel.duel import Duel, Strategy
+from duel.montecarlo import np
+from duel.sweep import StrategySweep
+from prob.pfunc import LinearRangePFunc
+
+def RunAllSweepTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(SweepTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1SweepTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(SweepTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def sweeptests_main():
+    unittest.main()
+
+class SweepTests(unittest.TestCase):
+
+    def testThresholdSweep(self):
+        thresholds = [round(0.05 * n, 2) for n in range(4, 20)]
+        sweep = StrategySweep()
+        results = sweep.sweep(thresholds, thresholds)
+        self.assertEqual(len(thresholds), len(results["payoff"]))
+        self.assertEqual(len(thresholds) ** 2, len(sweep.cache))
+
+        # the thresholds meet at the optimal strategy's firing point
+        optimal = Duel(verbose=False, dramaTiming=False).evaluateOptimalStrategy()
+        self.assertEqual((0.55, 0.45), results["saddlePoint"])
+        self.assertAlmostEqual(optimal["player1winChance"], results["maximin"][1])
+        self.assertAlmostEqual(optimal["player1winChance"], results["minimax"][1])
+        self.assertEqual(0.55, results["player1BestResponses"][thresholds.index(0.45)])
+        self.assertEqual(0.45, results["player2BestResponses"][thresholds.index(0.55)])
+
+        # a repeated configuration is served from the cache
+        sweep.cache[(StrategySweep.configKey(Duel(verbose=False)), Strategy.THRESHOLD, 0.2, 0.2)] = -1.0
+        self.assertEqual(-1.0, sweep.sweep([0.2], [0.2])["payoff"][0][0])
+        self.assertNotEqual(-1.0, sweep.sweep([0.2], [0.2], distance=19)["payoff"][0][0])
+
+    def testEvaluateCell(self):
+        duel = Duel(distance=6,
+                    player1func=LinearRangePFunc(1, 6, 0.5, 0.0),
+                    player2func=LinearRangePFunc(1, 6, 0.5, 0.0),
+                    verbose=False, dramaTiming=False)
+        # a duel in which no one fires is even
+        self.assertEqual(0.5, StrategySweep.evaluateCell(duel, Strategy(Strategy.THRESHOLD, 0.9, 0.9)))
+        # player 1 fires at distance 2
+        self.assertAlmostEqual(0.4, StrategySweep.evaluateCell(duel, Strategy(Strategy.THRESHOLD, 0.4, 0.9)))
+        # but other errors are not hidden
+        with self.assertRaises(Exception):
+            StrategySweep.evaluateCell(duel, Strategy(Strategy.MIXED, 0.5, 0.5))
+        with self.assertRaises(TypeError):
+            StrategySweep.evaluateCell(duel, Strategy(Strategy.THRESHOLD, None, 0.9))
+
+    def testAnalyze(self):
+        # no pure equilibrium: matching pennies
+        results = StrategySweep.analyze([[1, 0], [0, 1]], ["a", "b"], ["c", "d"])
+        self.assertEqual(None, results["saddlePoint"])
+        self.assertEqual(["a", "b"], results["player1BestResponses"])
+        self.assertEqual(["d", "c"], results["player2BestResponses"])
+        self.assertEqual(0, results["maximin"][1])
+        self.assertEqual(1, results["minimax"][1])
+
+    @unittest.skipIf(None == np, "numpy is not installed")
+    def testMixedSweep(self):
+        values = [0.1, 0.5]
+        results = StrategySweep(workers=2, seed=4).sweep(values, values, distance=10,
+                                                         strategyType=Strategy.MIXED,
+                                                         numberOfTrials=20000)
+        again = StrategySweep(seed=4).sweep(values, values, distance=10,
+                                            strategyType=Strategy.MIXED,
+                                            numberOfTrials=20000)
+        self.assertEqual(results["payoff"], again["payoff"])
+        # firing early from afar favors the opponent
+        self.assertTrue(results["payoff"][0][1] > results["payoff"][1][0])
+
+        # cells sampled with other trial counts or seeds are not reused
+        sweep = StrategySweep(seed=4)
+        rough = sweep.sweep(values, values, distance=10, strategyType=Strategy.MIXED, numberOfTrials=10)
+        self.assertEqual(results["payoff"], sweep.sweep(values, values, distance=10,
+                                                        strategyType=Strategy.MIXED,
+                                                        numberOfTrials=20000)["payoff"])
+        self.assertEqual(8, len(sweep.cache))
+        self.assertEqual(rough["payoff"], sweep.sweep(values, values, distance=10,
+                                                      strategyType=Strategy.MIXED,
+                                                      numberOfTrials=10)["payoff"])
+        sweep.seed = 5
+        self.assertNotEqual(results["payoff"], sweep.sweep(values, values, distance=10,
+                                                           strategyType=Strategy.MIXED,
+                                                           numberOfTrials=20000)["payoff"])
+        self.assertEqual(12, len(sweep.cache))
+
+if __name__ == "__main__":
+    sweeptests_main()
@@ -6,7 +6,15 @@ Created on Tue Jan 18 12:45:27 2022
 @author: Christopher Corbell
 """
 
-__all__ = ["hexboard", "hextree"]
+__all__ = ["hexboard", "hextree", "labelcache", "mcts", "mctsnode", "parallelmcts", "playouts", "pnnode", "pnsolver", "transposition"]
 
 from hex.hexboard import HexBoard
 from hex.hextree import HexTree
+from hex.labelcache import LabelCache
+from hex.mcts import MCTS
+from hex.mctsnode import MCTSNode
+from hex.parallelmcts import ParallelMCTS
+from hex.playouts import Playouts
+from hex.pnnode import PNNode
+from hex.pnsolver import PNSolver
+from hex.transposition import TranspositionTable
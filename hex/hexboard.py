@@ -6,8 +6,11 @@ Created on Tue Jan 18 12:44:53 2022
 @author: mathaes
 """
 import copy
+import random
 
-class HexBoard:
+from treegen.node import TreeNode
+
+class HexBoard(TreeNode):
     """
     The HexBoard class represents a state of a game of Hex on an
     n x n hexagonal-parallelogram board. 
@@ -17,21 +20,80 @@ class HexBoard:
     One player plays in the left-right (across columns) and
     the other in the top-bottom (across rows).  These can
     be changed but the default is that O plays first, in left-right direction.
+    
+    Tiles are stored in a flat bytearray in row-major order (index
+    row * size + col), holding 0 for empty tiles, 1 for X and 2 for O,
+    with X and O tile counts maintained as tiles are played.
+    
+    Connectivity is tracked incrementally in a disjoint-set (union-find)
+    structure as tiles are played. Each tile is a set element, indexed
+    row * size + col, and each player has 2 virtual elements for the 
+    two board sides they are connecting (the first and last rows for the
+    left-right player, the first and last columns for the other), which
+    are joined to that player's tiles along those sides. A player has won
+    when their two virtual side elements are in the same set.
+    
+    Boards also keep Zobrist hashes of their tiles, updated as tiles are
+    played: hash for the board itself, rotHash for the board rotated 180 
+    degrees, and swapHash and swapRotHash for the board (and its rotation)
+    transposed with the colors swapped. A board and its 180 degree rotation
+    are the same position (see canonicalKey). Transposing and swapping 
+    colors gives the same position for the other player, so those hashes 
+    are only comparable with the side to move included (see solverKey).
+    The hashes don't include the first or left-right players; solverKey
+    adds the left-right player, which changes who wins.
+    
+    Fields are held in __slots__ and child labels are made lazily from
+    the parent board (see treegen.node.TreeNode).
     """
     
     EMPTY_TOKEN = '-'
     X_TOKEN = 'X'
     O_TOKEN = 'O'
     
+    # tile values in the cells bytearray, and their tokens
+    EMPTY = 0
+    X = 1
+    O = 2
+    TOKENS = (EMPTY_TOKEN, X_TOKEN, O_TOKEN)
+    VALUES = {EMPTY_TOKEN: EMPTY, X_TOKEN: X, O_TOKEN: O}
+    
+    # offsets of each player's virtual side elements, after the tiles
+    X_SIDES = 0
+    O_SIDES = 2
+    
+    # tile neighbor index lists by board size, built on first use
+    NEIGHBORS = {}
+    
+    # Zobrist keys by board size, built on first use, and for the side to move
+    ZOBRIST = {}
+    SIDE_KEYS = (0, 0x3C6EF372FE94F82B, 0xA54FF53A5F1D36F1)
+    # and for the left-right player
+    LR_KEYS = {O_TOKEN: 0, X_TOKEN: 0x6A06E9AB85A0BCC1}
+    
+    __slots__ = ("size", "first_player", "_lr_player", "cells", "xcount", "ocount",
+                 "hash", "rotHash", "swapHash", "swapRotHash", "sets", "setSizes")
+    
     def __init__(self, 
                  size=11, 
                  first_player = O_TOKEN, 
                  lr_player = O_TOKEN):
+        TreeNode.__init__(self)
         self.size = size
         self.first_player = first_player
-        self.lr_player = lr_player
+        self._lr_player = lr_player
         self.label = '0'
         self.clear()
+        
+    @property
+    def lr_player(self):
+        return self._lr_player
+    
+    @lr_player.setter
+    def lr_player(self, token):
+        # the players' sides are swapped, so their sets must be rebuilt
+        self._lr_player = token
+        self.rebuildSets()
     
         
     def __repr__(self):
@@ -57,22 +119,59 @@ class HexBoard:
         return strrep
     
     def __copy__(self):
-        clone = HexBoard()
+        # skip __init__, which would allocate a new empty board
+        clone = HexBoard.__new__(HexBoard)
         clone.size = self.size
         clone.first_player = self.first_player
-        clone.lr_player = self.lr_player
-        clone.board = copy.deepcopy(self.board)
-        clone.label = self.label
+        clone._lr_player = self._lr_player
+        clone.cells = self.cells[:]
+        clone.xcount = self.xcount
+        clone.ocount = self.ocount
+        clone.copyLabel(self)
+        clone.hash = self.hash
+        clone.rotHash = self.rotHash
+        clone.swapHash = self.swapHash
+        clone.swapRotHash = self.swapRotHash
+        clone.sets = self.sets[:]
+        clone.setSizes = self.setSizes[:]
         return clone
         
     def copy(self):
         return copy.copy(self)
     
+    def toBytes(self):
+        """
+        Encode this board as a compact byte string, e.g. to pass it 
+        between processes: the size, first player and left-right player,
+        then the tile values (0 empty, 1 X, 2 O) in row-major order. 
+        The label is not included.
+        """
+        header = bytes([self.size, 
+                        HexBoard.VALUES[self.first_player], 
+                        HexBoard.VALUES[self._lr_player]])
+        return header + self.cells
+    
+    def fromBytes(data):
+        """
+        Create a new (unlabeled) HexBoard from a byte string made by toBytes.
+        """
+        board = HexBoard.__new__(HexBoard)
+        board.size = data[0]
+        board.first_player = HexBoard.TOKENS[data[1]]
+        board._lr_player = HexBoard.TOKENS[data[2]]
+        board.cells = bytearray(data[3:])
+        board.xcount = board.cells.count(HexBoard.X)
+        board.ocount = board.cells.count(HexBoard.O)
+        board.label = None
+        board.rebuildSets()
+        board.rehash()
+        return board
+    
     def getTileValue(self, row, col):
         if row < 0 or col < 0 or row >= self.size or col >= self.size:
             raise Exception(f"Coordinate ({row},{col}) is out of range for this board.")
         
-        return self.board[row][col]
+        return HexBoard.TOKENS[self.cells[row * self.size + col]]
     
     def playX(self, row, col):
         if self.getNextPlayer() != self.X_TOKEN:
@@ -82,7 +181,7 @@ class HexBoard:
         if not HexBoard.EMPTY_TOKEN == cur:
             raise Exception(f"Coordinate ({row},{col}) is {cur} (not unset).")
         
-        self.board[row][col] = HexBoard.X_TOKEN
+        self.place(row, col, HexBoard.X_TOKEN)
     
     def playO(self, row, col):
         if self.getNextPlayer() != self.O_TOKEN:
@@ -92,8 +191,216 @@ class HexBoard:
         if not HexBoard.EMPTY_TOKEN == cur:
             raise Exception(f"Coordinate ({row},{col}) is {cur} (not unset).")
         
-        self.board[row][col] = HexBoard.O_TOKEN
+        self.place(row, col, HexBoard.O_TOKEN)
+        
+    def playIndex(self, index):
+        """
+        Play the next player's token at a tile index (row * size + col).
+        """
+        nextPlayer = self.getNextPlayer()
+        if nextPlayer == HexBoard.EMPTY_TOKEN:
+            raise Exception("playIndex called but the game is over")
+        if index < 0 or index >= len(self.cells):
+            raise Exception(f"Index {index} is out of range for this board.")
+        if not self.cells[index] == HexBoard.EMPTY:
+            raise Exception(f"Index {index} is {HexBoard.TOKENS[self.cells[index]]} (not unset).")
+        self.placeIndex(index, nextPlayer)
+        
+    def place(self, row, col, token):
+        """
+        Set a tile to a player token, without checking whose turn it is,
+        and join it to that player's adjacent tiles and sides.
+        The tile is expected to be empty.
+        """
+        self.placeIndex(row * self.size + col, token)
+        
+    def placeIndex(self, index, token):
+        value = HexBoard.VALUES[token]
+        self.cells[index] = value
+        if value == HexBoard.X:
+            self.xcount += 1
+        else:
+            self.ocount += 1
+        self.joinTile(index, value)
+        self.hashTile(index, value)
+        
+    def joinTile(self, index, value):
+        size = self.size
+        if value == HexBoard.X:
+            sides = size * size + HexBoard.X_SIDES
+        else:
+            sides = size * size + HexBoard.O_SIDES
+        if HexBoard.TOKENS[value] == self._lr_player:
+            position = index // size
+        else:
+            position = index % size
+        if position == 0:
+            self.union(index, sides)
+        if position == size - 1:
+            self.union(index, sides + 1)
+        cells = self.cells
+        for neighbor in HexBoard.getNeighbors(size)[index]:
+            if cells[neighbor] == value:
+                self.union(index, neighbor)
+                
+    def sideIndex(self, token):
+        """
+        Return the set index of a player's first virtual side element.
+        """
+        if token == HexBoard.X_TOKEN:
+            return len(self.cells) + HexBoard.X_SIDES
+        return len(self.cells) + HexBoard.O_SIDES
+                
+    def findSet(self, index):
+        sets = self.sets
+        while sets[index] != index:
+            # path halving
+            sets[index] = sets[sets[index]]
+            index = sets[index]
+        return index
+    
+    def union(self, index1, index2):
+        root1 = self.findSet(index1)
+        root2 = self.findSet(index2)
+        if root1 == root2:
+            return
+        if self.setSizes[root1] < self.setSizes[root2]:
+            root1, root2 = root2, root1
+        self.sets[root2] = root1
+        self.setSizes[root1] += self.setSizes[root2]
+        
+    def hashTile(self, index, value):
+        """
+        Toggle a tile value at an index in this board's hashes.
+        """
+        size = self.size
+        keys = HexBoard.getZobristKeys(size)
+        swapKeys = keys[HexBoard.X + HexBoard.O - value]
+        keys = keys[value]
+        last = size * size - 1
+        transposed = (index % size) * size + index // size
+        self.hash ^= keys[index]
+        self.rotHash ^= keys[last - index]
+        self.swapHash ^= swapKeys[transposed]
+        self.swapRotHash ^= swapKeys[last - transposed]
+        
+    def rehash(self):
+        self.hash = 0
+        self.rotHash = 0
+        self.swapHash = 0
+        self.swapRotHash = 0
+        cells = self.cells
+        for index in range(0, len(cells)):
+            if not cells[index] == HexBoard.EMPTY:
+                self.hashTile(index, cells[index])
+                
+    def canonicalKey(self):
+        """
+        Return a hash key for this board which is the same for its 180
+        degree rotation.
+        """
+        return min(self.hash, self.rotHash)
+    
+    def solverKey(self):
+        """
+        Return a hash key for this position and side to move, which is
+        the same for its 180 degree rotation and for its transposition 
+        with the colors (and so the side to move) swapped. These positions
+        all have the same value for the side to move. The key includes
+        the left-right player, since the same tiles can be won by one
+        player with rows to connect and lost with columns.
+        """
+        nextValue = HexBoard.X + HexBoard.O - HexBoard.VALUES[self.getSelfPlayer()]
+        side = HexBoard.SIDE_KEYS[nextValue]
+        swapSide = HexBoard.SIDE_KEYS[HexBoard.X + HexBoard.O - nextValue]
+        return min(self.hash ^ side, self.rotHash ^ side,
+                   self.swapHash ^ swapSide, self.swapRotHash ^ swapSide) ^ HexBoard.LR_KEYS[self._lr_player]
+    
+    def getZobristKeys(size):
+        """
+        Return the Zobrist keys for a board size, indexed by tile value
+        and then tile index (the keys for HexBoard.EMPTY are all 0).
+        The keys are the same in every process.
+        """
+        keys = HexBoard.ZOBRIST.get(size)
+        if None == keys:
+            rng = random.Random(size)
+            tileCount = size * size
+            keys = ([0] * tileCount, 
+                    [rng.getrandbits(64) for n in range(0, tileCount)],
+                    [rng.getrandbits(64) for n in range(0, tileCount)])
+            HexBoard.ZOBRIST[size] = keys
+        return keys
+        
+    def getNeighbors(size):
+        """
+        Return a list, by tile index, of the indexes of each tile's 
+        adjacent tiles on a board of the given size.
+        """
+        neighbors = HexBoard.NEIGHBORS.get(size)
+        if None == neighbors:
+            neighbors = []
+            for row in range(0, size):
+                for col in range(0, size):
+                    adjacent = []
+                    for rowStep, colStep in [(0, -1), (0, 1), (-1, 0), (1, 0), (-1, 1), (1, -1)]:
+                        r = row + rowStep
+                        c = col + colStep
+                        if r >= 0 and c >= 0 and r < size and c < size:
+                            adjacent.append(r * size + c)
+                    neighbors.append(adjacent)
+            HexBoard.NEIGHBORS[size] = neighbors
+        return neighbors
         
+    def spansBoard(cells, size, value, acrossRows):
+        """
+        Flood-fill check whether the tiles of one value connect two
+        opposite sides of a board, without any union-find state.
+
+        Parameters
+        ----------
+        cells : bytearray
+            Tile values in row-major order, as in HexBoard.cells.
+        size : int
+            The board size.
+        value : int
+            The tile value (HexBoard.X or HexBoard.O) to check.
+        acrossRows : bool
+            If True, check for a connection from the first row to the
+            last row (as for the left-right player); otherwise from the
+            first column to the last column.
+
+        Returns
+        -------
+        bool
+            True if the tiles connect the two sides.
+
+        """
+        neighbors = HexBoard.getNeighbors(size)
+        if acrossRows:
+            starts = range(0, size)
+        else:
+            starts = range(0, size * size, size)
+        seen = bytearray(size * size)
+        stack = []
+        for index in starts:
+            if cells[index] == value:
+                seen[index] = 1
+                stack.append(index)
+        while len(stack) > 0:
+            index = stack.pop()
+            if acrossRows:
+                position = index // size
+            else:
+                position = index % size
+            if position == size - 1:
+                return True
+            for neighbor in neighbors[index]:
+                if cells[neighbor] == value and not seen[neighbor]:
+                    seen[neighbor] = 1
+                    stack.append(neighbor)
+        return False
+
     def getSelfPlayer(self):
         """
         Determine which player played last for the current board state.
@@ -146,36 +453,65 @@ class HexBoard:
         return HexBoard.EMPTY_TOKEN
     
     def clear(self):
-        self.board = []
-        for n in range(0, self.size):
-            self.board.append([HexBoard.EMPTY_TOKEN] * self.size)
+        self.cells = bytearray(self.size * self.size)
+        self.xcount = 0
+        self.ocount = 0
+        self.resetSets()
+        self.rehash()
+        
+    def resetSets(self):
+        elementCount = self.size * self.size + 4
+        self.sets = list(range(0, elementCount))
+        self.setSizes = [1] * elementCount
+        
+    def rebuildSets(self):
+        self.resetSets()
+        cells = self.cells
+        for index in range(0, len(cells)):
+            if not cells[index] == HexBoard.EMPTY:
+                self.joinTile(index, cells[index])
             
     def getTileCoordinatesOfValue(self, value):
-        coords = []
-        for i in range(0, self.size):
-            for j in range(0, self.size):
-                cur = self.getTileValue(i, j)
-                if cur == value:
-                    coords.append([i, j])
-        return coords
+        return [[index // self.size, index % self.size] for index in self.getIndexesOfValue(value)]
+    
+    def getIndexesOfValue(self, value):
+        code = HexBoard.VALUES[value]
+        cells = self.cells
+        return [index for index in range(0, len(cells)) if cells[index] == code]
+    
+    def getEmptyIndexes(self):
+        return self.getIndexesOfValue(HexBoard.EMPTY_TOKEN)
+    
+    def getEmptyIndex(self, ordinal):
+        """
+        Return the tile index of the ordinal'th (from 0) empty tile in
+        row-major order, which is the move to the child board with that
+        ordinal in HexTree labels; None if there are not that many.
+        """
+        if ordinal < 0 or ordinal >= self.countEmptyTiles():
+            return None
+        index = -1
+        for n in range(0, ordinal + 1):
+            index = self.cells.index(HexBoard.EMPTY, index + 1)
+        return index
     
     def countXTiles(self):
-        return self.countTiles(HexBoard.X_TOKEN)
+        return self.xcount
     
     def countOTiles(self):
-        return self.countTiles(HexBoard.O_TOKEN)
+        return self.ocount
     
     def countEmptyTiles(self):
-        return self.countTiles(HexBoard.EMPTY_TOKEN)
+        return len(self.cells) - self.xcount - self.ocount
     
     def countTiles(self, value):
-        count = 0
-        for i in range(0, self.size):
-            for j in range(0, self.size):
-                cur = self.getTileValue(i, j)
-                if cur == value:
-                    count += 1
-        return count
+        if value == HexBoard.X_TOKEN:
+            return self.xcount
+        if value == HexBoard.O_TOKEN:
+            return self.ocount
+        if value == HexBoard.EMPTY_TOKEN:
+            return self.countEmptyTiles()
+        return 0
     
     def getXTiles(self):
         return self.getTileCoordinatesOfValue(HexBoard.X_TOKEN)
@@ -256,30 +592,14 @@ class HexBoard:
         return adjacencies
     
     def isXWin(self):
-        check_lr = self.lr_player == HexBoard.X_TOKEN
-        xblocks = self.getConnectedXBlocks()
-        for xblock in xblocks:
-            if check_lr:
-                if self.block_spans_lr(xblock):
-                    return True
-            else:
-                if self.block_spans_tb(xblock):
-                    return True
-        
-        return False
+        return self.isWinFor(HexBoard.X_TOKEN)
     
     def isOWin(self):
-        check_lr = self.lr_player == HexBoard.O_TOKEN
-        oblocks = self.getConnectedOBlocks()
-        for oblock in oblocks:
-            if check_lr:
-                if self.block_spans_lr(oblock):
-                    return True
-            else:
-                if self.block_spans_tb(oblock):
-                    return True
-        
-        return False
+        return self.isWinFor(HexBoard.O_TOKEN)
+    
+    def isWinFor(self, token):
+        sides = self.sideIndex(token)
+        return self.findSet(sides) == self.findSet(sides + 1)
     
     def block_spans_lr(self, block):
         # we assume the block is connected, so we
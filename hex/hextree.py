@@ -6,7 +6,13 @@ Created on Tue Jan 18 12:45:15 2022
 @author: Christopher Corbell
 """
 
+import time
+
 from hex.hexboard import HexBoard
+from hex.labelcache import LabelCache
+from hex.transposition import TranspositionTable
+from treegen.parallel import ParallelExpander
+from treegen.stats import GenerationStats
 
 class HexTree:
     
@@ -18,76 +24,262 @@ class HexTree:
         if nextPlayer == HexBoard.EMPTY_TOKEN:
             raise Exception("Can't generate child boards, this board is game-over or in unexpected state")
             
-        emptyTiles = parent.getEmptyTiles()
+        # the tiles are known to be empty and nextPlayer is known to be 
+        # on turn, so the children can be placed without checking
         childBoards = []
         n = 0
-        for tile in emptyTiles:
+        for index in parent.getEmptyIndexes():
             childBoard = parent.copy()
-            if nextPlayer == HexBoard.X_TOKEN:
-                childBoard.playX(tile[0], tile[1])
-            else:
-                childBoard.playO(tile[0], tile[1])
+            childBoard.placeIndex(index, nextPlayer)
                 
             if assignLabels:
-                childBoard.label = parent.label + f".{n}"
+                childBoard.setParent(parent, n)
                 n += 1
             childBoards.append(childBoard)
         return childBoards
     
-    def generateTree(self, root:HexBoard, maxDepth=-1):
+    def generateTree(self, root:HexBoard, maxDepth=-1, stats:GenerationStats=None, workers=1, distinctOnly=False):
+        """
+        Generate the plies of the game tree below a root board,
+        breadth-first, into self.plies. Boards which are game-over 
+        are not expanded.
+
+        Parameters
+        ----------
+        root : HexBoard
+            The root board, canonically labeled.
+        maxDepth : int, optional
+            The number of plies to generate; by default, all of them.
+        stats : GenerationStats, optional
+            If given, generation counters and per-ply timing are added to it.
+        workers : int, optional
+            If more than 1, the parents of each ply are expanded across this
+            many processes, passing boards as byte strings (see 
+            HexBoard.toBytes). Children are merged in parent order, so the
+            result (including labels) is the same as with a single process.
+        distinctOnly : bool, optional
+            If True, a board which is the same position as an earlier board
+            of its ply, or its 180 degree rotation (see 
+            HexBoard.canonicalKey), is left out of the ply, so each distinct
+            position is expanded once. The other boards keep their labels.
+
+        Returns
+        -------
+        None.
+
+        """
         self.plies = []
+        for ply in self.generatePlies(root, maxDepth, stats, keepHistory=True, workers=workers, distinctOnly=distinctOnly):
+            pass
         
-        depth = 0
-        lastPly = [root]
-        currentPly = []
-        
+    def generatePlies(self, root:HexBoard, maxDepth=-1, stats:GenerationStats=None, keepHistory=False, workers=1, distinctOnly=False):
+        """
+        Generate the plies of the game tree below a root board one at
+        a time. Only the ply being expanded is held in memory, unless
+        keepHistory is set, in which case each ply is also appended
+        to self.plies. Without keepHistory, boards are given label 
+        strings rather than parent references (see TreeNode), so that 
+        earlier plies can be freed. Plies can be expanded across worker
+        processes, and limited to distinct positions, as for generateTree.
+
+        Yields
+        ------
+        [HexBoard]
+            The boards of each ply, in order (ply 1 first).
+
+        """
         if maxDepth == -1:
             maxDepth = root.countEmptyTiles()
             
-        while depth < maxDepth:
-            for parent in lastPly:
-                if parent.isGameOver():
-                    continue
-                children = HexTree.generateChildBoards(parent)
-                currentPly.extend(children)
+        expander = None
+        if workers > 1:
+            expander = ParallelExpander(workers)
+            
+        try:
+            depth = 0
+            lastPly = [root]
+            
+            while depth < maxDepth:
+                if not None == stats:
+                    stats.beginPly()
+                    
+                if None == expander:
+                    childLists = []
+                    for parent in lastPly:
+                        if parent.isGameOver():
+                            childLists.append(None)
+                        else:
+                            childLists.append(HexTree.generateChildBoards(parent, assignLabels=False))
+                else:
+                    encodedLists = expander.map(HexTree.expandEncoded, [parent.toBytes() for parent in lastPly])
+                    childLists = []
+                    for encodedChildren in encodedLists:
+                        if None == encodedChildren:
+                            childLists.append(None)
+                        else:
+                            childLists.append([HexBoard.fromBytes(data) for data in encodedChildren])
+                    
+                currentPly = []
+                # positions of a ply all have the same number of tiles, so
+                # a position can only recur within a ply
+                plyKeys = set()
+                for n in range(0, len(lastPly)):
+                    children = childLists[n]
+                    if None == children:
+                        if not None == stats:
+                            stats.winsPruned += 1
+                        continue
+                    # parent references would keep every earlier ply alive
+                    for index in range(0, len(children)):
+                        if keepHistory:
+                            children[index].setParent(lastPly[n], index)
+                        else:
+                            children[index].setChildLabel(lastPly[n], index)
+                    if not None == stats:
+                        stats.nodesExpanded += 1
+                        stats.childrenGenerated += len(children)
+                    if distinctOnly:
+                        for child in children:
+                            key = child.canonicalKey()
+                            if key in plyKeys:
+                                if not None == stats:
+                                    stats.aliasesFound += 1
+                                continue
+                            plyKeys.add(key)
+                            currentPly.append(child)
+                    else:
+                        currentPly.extend(children)
+                
+                if keepHistory:
+                    self.plies.append(currentPly)
+                if not None == stats:
+                    stats.endPly(len(currentPly))
+                yield currentPly
+                lastPly = currentPly
+                depth += 1
+        finally:
+            if not None == expander:
+                expander.shutdown()
+                
+    def expandEncoded(encodedBoards):
+        """
+        Given a list of boards encoded by HexBoard.toBytes, return for each 
+        the list of its encoded child boards, or None if it is game-over;
+        this is the unit of work for parallel generation.
+        """
+        results = []
+        for data in encodedBoards:
+            board = HexBoard.fromBytes(data)
+            if board.isGameOver():
+                results.append(None)
+            else:
+                children = HexTree.generateChildBoards(board, assignLabels=False)
+                results.append([child.toBytes() for child in children])
+        return results
             
-            self.plies.append(currentPly)
-            lastPly = currentPly
-            currentPly = []
-            depth += 1
+    def generateNodes(self, root:HexBoard, maxDepth=-1, stats:GenerationStats=None, depthFirst=False):
+        """
+        Generate the boards of the game tree below a root board one at a time.
         
+        By default boards come ply by ply, as from generatePlies. With
+        depthFirst=True, boards come in depth-first (pre-)order instead,
+        and only the sibling lists on the path to the current board are
+        held in memory.
+
+        Yields
+        ------
+        HexBoard
+            Each board of the tree, excluding the root.
+
+        """
+        if not depthFirst:
+            for ply in self.generatePlies(root, maxDepth, stats):
+                yield from ply
+            return
+        
+        if maxDepth == -1:
+            maxDepth = root.countEmptyTiles()
+            
+        stack = [iter([root])]
+        while len(stack) > 0:
+            parent = next(stack[-1], None)
+            if None == parent:
+                stack.pop()
+                continue
+            if len(stack) > 1:
+                yield parent
+            if len(stack) > maxDepth:
+                continue
+            if parent.isGameOver():
+                if not None == stats:
+                    stats.winsPruned += 1
+                continue
+            children = HexTree.generateChildBoards(parent)
+            if not None == stats:
+                stats.nodesExpanded += 1
+                stats.childrenGenerated += len(children)
+            stack.append(iter(children))
+    
     def generateBoardFromLabel(label, root):
-        boards = HexTree.getAllBoardsForLabel(label)
-        if len(boards) == 0:
-            return None
-        return boards.pop()
+        """
+        Make the board for a label below a root board, replaying one move
+        per label component (the k-th empty tile, for component k) on a 
+        single copy of the root rather than generating each ply.
+
+        Parameters
+        ----------
+        label : str
+            A label such as '0.3.1'; the first component is the root's.
+        root : HexBoard
+            The root board of the labels.
+
+        Returns
+        -------
+        HexBoard
+            A new board, labeled with label.
+
+        """
+        labelParts = label.split('.')
+        board = root.copy()
+        LabelCache.replay(board, labelParts, 1, len(labelParts))
+        board.label = label
+        return board
+    
+    def generateBoardsFromLabels(labels, root):
+        """
+        Make the boards for a list of labels below a root board, as for
+        generateBoardFromLabel, sharing the boards of common label prefixes
+        through a LabelCache.
+
+        Returns
+        -------
+        [HexBoard]
+            New boards, in the order of the labels.
+
+        """
+        return LabelCache(root).resolveAll(labels)
     
-        
     def getAllBoardsForLabel(label, root):
-        
+        """
+        Return the boards on the path from a root board (which is 
+        relabeled with the label's first component) to a label.
+        """
         labelParts = label.split('.')
         currentLabel = labelParts[0]
         root.label = currentLabel
         
         results = [root]
         nextRoot = root
-        
         for index in range(1, len(labelParts)):
-            
-            nextIndex = int(labelParts[index])
             currentLabel += f".{labelParts[index]}"
-            
-            children = HexTree.generateChildBoards(nextRoot)
-            if nextIndex < 0 or nextIndex >= len(children):
-                raise Exception(f"Could not get object for label {currentLabel} - bad index")
-            
-            nextRoot = children[nextIndex]
+            nextRoot = nextRoot.copy()
+            LabelCache.replay(nextRoot, labelParts, index, index + 1)
             nextRoot.label = currentLabel
             results.append(nextRoot)
         
         return results
     
-    def findWins(root, forPlayer=HexBoard.O_TOKEN, labelsOnly=False):
+    def findWins(root, forPlayer=HexBoard.O_TOKEN, labelsOnly=False, maxResults=None, maxDepth=None, timeLimit=None, distinctOnly=False, table:TranspositionTable=None):
         """
         Given a root hex board, find all winning boards for
         a player (token), or for either player if forPlayer is
@@ -96,50 +288,221 @@ class HexTree:
         The method returns a list of winning boards, unless
         labelsOnly is set to True.
         
-        The boards are found in a breadth-first generative search
-        of the game tree below root.
+        The boards are found in a depth-first search of the game 
+        tree below root; see iterWins.
 
         Parameters
         ----------
         root : HexBoard
             A valid HexBoard, canonically labeled.
+        maxResults, maxDepth, timeLimit, distinctOnly, table : optional
+            Limits on the search, as for iterWins.
 
         Returns
         -------
         A list of winning HexBoard objects, unless labelsOnly=True,
         then this method returns a list of label strings.
         """
-        resultBoards = []
-        resultLabels = []
-        children = HexTree.generateChildBoards(root)
-        for child in children:
-            childIsLeaf = child.isGameOver()
-            childIsWin = False
-            
-            if forPlayer == HexBoard.O_TOKEN:
-                childIsWin = child.isOWin()
-            elif childIsWin == HexBoard.X_TOKEN:
-                childIsWin == child.isXWin()
+        results = []
+        for label, moves in HexTree.searchWins(root, forPlayer, maxResults, maxDepth, timeLimit, distinctOnly, table):
+            if labelsOnly:
+                results.append(label)
             else:
-                childIsWin = childIsLeaf
+                board = root.copy()
+                for move in moves:
+                    board.playIndex(move)
+                board.label = label
+                results.append(board)
+        return results
+    
+    def iterWins(root, forPlayer=HexBoard.O_TOKEN, maxResults=None, maxDepth=None, timeLimit=None, distinctOnly=False, table:TranspositionTable=None):
+        """
+        Generate the labels of the winning boards below a root board
+        for a player (token), or for either player if forPlayer is None
+        or empty, one at a time in depth-first order.
+        
+        The search plays and takes back moves on a single array of tiles
+        and union-find sets rather than copying boards, and a board which
+        is won (by either player) is not searched below.
+
+        Parameters
+        ----------
+        root : HexBoard
+            A valid HexBoard, canonically labeled.
+        forPlayer : str, optional
+            HexBoard.O_TOKEN (the default), HexBoard.X_TOKEN, or None.
+        maxResults : int, optional
+            Stop after this many wins.
+        maxDepth : int, optional
+            Search no more than this many plies below root.
+        timeLimit : float, optional
+            Stop after this many seconds.
+        distinctOnly : bool, optional
+            If True, each position (up to 180 degree rotation) is visited
+            once, however many move orders reach it: only its first label
+            is generated and it is only searched below once.
+        table : TranspositionTable, optional
+            The table to record visited positions in if distinctOnly is 
+            set; by default a new one of the default capacity. Positions
+            which don't fit are visited again when reached again.
+
+        Yields
+        ------
+        str
+            The label of each winning board.
+
+        """
+        for label, moves in HexTree.searchWins(root, forPlayer, maxResults, maxDepth, timeLimit, distinctOnly, table):
+            yield label
             
-            if childIsWin:
-                if labelsOnly:
-                    resultLabels.append(child.label)
-                else:
-                    resultBoards.append(child)
-                    
-            if not childIsLeaf:
-                
-                childWins = HexTree.findWins(child, forPlayer, labelsOnly)
-                if labelsOnly:
-                    resultLabels.extend(childWins)
-                else:
-                    resultBoards.extend(childWins)
+    def searchWins(root, forPlayer, maxResults, maxDepth, timeLimit, distinctOnly=False, table:TranspositionTable=None):
+        """
+        The search of iterWins, yielding each winning label with the list
+        of tile indexes played from root to reach it (which is only valid
+        until the next label is generated).
         
-        if labelsOnly:
-            return resultLabels
-        else:
-            return resultBoards
-    
-        
\ No newline at end of file
+        Moves are made and unmade on one copy of the root's tiles and
+        union-find sets (see HexBoard.joinTile), without path compression
+        so that each union can be undone from a log, and a move wins if
+        it joins the mover's two sides. The boards on the search path are
+        kept as per-depth scan positions and child ordinals, and labels
+        are only put together for wins, so no objects are made per node.
+        """
+        if root.isGameOver():
+            return
+        anyPlayer = forPlayer in [None, '', HexBoard.EMPTY_TOKEN]
+        if not anyPlayer:
+            forValue = HexBoard.VALUES[forPlayer]
+        if None == maxDepth:
+            maxDepth = root.countEmptyTiles()
+        if maxDepth <= 0:
+            return
+        if not None == timeLimit:
+            deadline = time.perf_counter() + timeLimit
+            
+        if distinctOnly:
+            if None == table:
+                table = TranspositionTable()
+            keys = HexBoard.getZobristKeys(root.size)
+            boardHash = root.hash
+            rotHash = root.rotHash
+            last = root.size * root.size - 1
+            
+        size = root.size
+        cells = root.cells[:]
+        cellCount = len(cells)
+        neighbors = HexBoard.getNeighbors(size)
+        lrValue = HexBoard.VALUES[root.lr_player]
+        sets = root.sets[:]
+        setSizes = root.setSizes[:]
+        # the absorbed root of each union, in order, to undo them
+        unions = []
+        resultCount = 0
+        
+        def findSet(element):
+            while sets[element] != element:
+                element = sets[element]
+            return element
+        
+        def unite(element1, element2):
+            root1 = findSet(element1)
+            root2 = findSet(element2)
+            if root1 == root2:
+                return
+            if setSizes[root1] < setSizes[root2]:
+                root1, root2 = root2, root1
+            sets[root2] = root1
+            setSizes[root1] += setSizes[root2]
+            unions.append(root2)
+            
+        def undoUnions(mark):
+            while len(unions) > mark:
+                absorbed = unions.pop()
+                setSizes[sets[absorbed]] -= setSizes[absorbed]
+                sets[absorbed] = absorbed
+        
+        # for each board on the path being searched: the tile index to
+        # scan for its next empty tile, its next child ordinal, and the
+        # length of the union log before the move into it
+        nextTiles = [0] * (maxDepth + 1)
+        ordinals = [0] * (maxDepth + 1)
+        unionMarks = [0] * (maxDepth + 1)
+        depth = 0
+        moves = []
+        value = HexBoard.VALUES[root.getNextPlayer()]
+        while True:
+            if not None == timeLimit and time.perf_counter() >= deadline:
+                return
+            index = nextTiles[depth]
+            while index < cellCount and cells[index] != HexBoard.EMPTY:
+                index += 1
+            if index >= cellCount:
+                # take back the move into this board
+                if depth == 0:
+                    return
+                mark = unionMarks[depth]
+                depth -= 1
+                undoUnions(mark)
+                index = moves.pop()
+                cells[index] = HexBoard.EMPTY
+                value = HexBoard.X + HexBoard.O - value
+                if distinctOnly:
+                    boardHash ^= keys[value][index]
+                    rotHash ^= keys[value][last - index]
+                continue
+            nextTiles[depth] = index + 1
+            ordinals[depth] += 1
+            
+            if distinctOnly:
+                childHash = boardHash ^ keys[value][index]
+                childRotHash = rotHash ^ keys[value][last - index]
+                key = min(childHash, childRotHash)
+                # the number of plies which would be searched below it
+                remaining = maxDepth - depth - 1
+                entry = table.lookup(key)
+                if not None == entry and entry[1] >= remaining:
+                    continue
+                table.store(key, True, remaining)
+                
+            # make the move: join the tile to its sides and neighbors
+            cells[index] = value
+            mark = len(unions)
+            if value == HexBoard.X:
+                sides = cellCount + HexBoard.X_SIDES
+            else:
+                sides = cellCount + HexBoard.O_SIDES
+            if value == lrValue:
+                position = index // size
+            else:
+                position = index % size
+            if position == 0:
+                unite(index, sides)
+            if position == size - 1:
+                unite(index, sides + 1)
+            for neighbor in neighbors[index]:
+                if cells[neighbor] == value:
+                    unite(index, neighbor)
+                
+            if findSet(sides) == findSet(sides + 1):
+                if anyPlayer or value == forValue:
+                    moves.append(index)
+                    yield root.label + '.' + '.'.join([str(ordinals[n] - 1) for n in range(0, depth + 1)]), moves
+                    moves.pop()
+                    resultCount += 1
+                    if not None == maxResults and resultCount >= maxResults:
+                        return
+            elif depth + 1 < maxDepth:
+                moves.append(index)
+                depth += 1
+                nextTiles[depth] = 0
+                ordinals[depth] = 0
+                unionMarks[depth] = mark
+                value = HexBoard.X + HexBoard.O - value
+                if distinctOnly:
+                    boardHash = childHash
+                    rotHash = childRotHash
+                continue
+            
+            # take the move back at once
+            undoUnions(mark)
+            cells[index] = HexBoard.EMPTY
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:40:18 2026
+
+@author: Christopher Corbell
+"""
+
+from hex.hexboard import HexBoard
+
+class LabelCache:
+    """
+    A LabelCache resolves HexTree labels (e.g. '0.3.1.4') below a root
+    board into boards, keeping boards for label prefixes in a small trie
+    so that labels with a common prefix only replay the moves after it.
+
+    Each trie node is a list [board or None, {component: child node}],
+    keyed by label component below the root. The cache holds at most
+    maxEntries boards and is cleared when it fills up.
+
+    Resolved boards are always new copies, so they can be changed freely.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+
+    def __init__(self, root:HexBoard, maxEntries=DEFAULT_MAX_ENTRIES):
+        self.root = root
+        self.maxEntries = maxEntries
+        self.clear()
+
+    def clear(self):
+        self.trie = [self.root, {}]
+        self.entryCount = 0
+
+    def resolve(self, label):
+        """
+        Return a new board for a label, labeled with it.
+        """
+        labelParts = label.split('.')
+        board, depth = self.deepestPrefix(labelParts)
+        board = board.copy()
+        LabelCache.replay(board, labelParts, depth + 1, len(labelParts))
+        self.store(labelParts, len(labelParts) - 1, board)
+        result = board.copy()
+        result.label = label
+        return result
+
+    def resolveAll(self, labels):
+        """
+        Return new boards for a list of labels, in order. The labels are
+        resolved in sorted order, and the board at the end of the prefix
+        each label shares with the next one is kept in the cache first.
+        """
+        splitLabels = [label.split('.') for label in labels]
+        order = sorted(range(0, len(labels)), key=lambda n: [int(part) for part in splitLabels[n][1:]])
+        results = [None] * len(labels)
+        for position in range(0, len(order)):
+            labelParts = splitLabels[order[position]]
+            shared = 0
+            if position + 1 < len(order):
+                shared = LabelCache.commonDepth(labelParts, splitLabels[order[position + 1]])
+            board, depth = self.deepestPrefix(labelParts)
+            board = board.copy()
+            if shared > depth:
+                LabelCache.replay(board, labelParts, depth + 1, shared + 1)
+                self.store(labelParts, shared, board)
+                board = board.copy()
+                depth = shared
+            LabelCache.replay(board, labelParts, depth + 1, len(labelParts))
+            board.label = labels[order[position]]
+            results[order[position]] = board
+        return results
+
+    def deepestPrefix(self, labelParts):
+        """
+        Return the cached board for the longest cached prefix of a label's
+        components, and the number of components below the root in it.
+        """
+        node = self.trie
+        board = node[0]
+        depth = 0
+        for n in range(1, len(labelParts)):
+            node = node[1].get(labelParts[n])
+            if None == node:
+                break
+            if not None == node[0]:
+                board = node[0]
+                depth = n
+        return board, depth
+
+    def store(self, labelParts, depth, board):
+        """
+        Cache a board for the first depth components below the root of a label.
+        """
+        if depth < 1:
+            return
+        if self.entryCount >= self.maxEntries:
+            self.clear()
+        node = self.trie
+        for n in range(1, depth + 1):
+            child = node[1].get(labelParts[n])
+            if None == child:
+                child = [None, {}]
+                node[1][labelParts[n]] = child
+            node = child
+        if None == node[0]:
+            self.entryCount += 1
+        node[0] = board
+
+    def commonDepth(labelParts1, labelParts2):
+        """
+        Return the number of components below the root shared by two labels.
+        """
+        depth = 0
+        for n in range(1, min(len(labelParts1), len(labelParts2))):
+            if labelParts1[n] != labelParts2[n]:
+                break
+            depth = n
+        return depth
+
+    def replay(board:HexBoard, labelParts, start, end):
+        """
+        Play the moves for label components labelParts[start:end] on a board.
+        """
+        for n in range(start, end):
+            if board.isGameOver():
+                raise Exception(f"Could not get object for label {'.'.join(labelParts[:n+1])} - board is game-over")
+            index = board.getEmptyIndex(int(labelParts[n]))
+            if None == index:
+                raise Exception(f"Could not get object for label {'.'.join(labelParts[:n+1])} - bad index")
+            board.placeIndex(index, board.getNextPlayer())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:24:05 2026
+
+@author: Christopher Corbell
+"""
+
+import math
+import random
+import time
+
+from hex.hexboard import HexBoard
+from hex.mctsnode import MCTSNode
+
+class MCTS:
+    """
+    An MCTS chooses moves on a HexBoard by Monte Carlo tree search with
+    UCT (upper confidence bounds applied to trees) selection, so that
+    boards far too large for HexTree's exhaustive search (e.g. 11x11)
+    can be played within a fixed budget of playouts or time.
+
+    Each iteration walks the search tree from the root by UCT, expands one
+    untried move, plays the rest of the game out at random from there and
+    counts the result on the path back to the root. A random playout fills
+    every empty tile at once and checks for a winner once, since a full
+    Hex board always has exactly one winner and it is the same player who
+    would have won by playing those tiles in turn.
+
+    The search tree is kept between searches: call advance() with each
+    move played (by either player) and the subtree under that move is
+    reused for the next search.
+    """
+
+    EXPLORATION = math.sqrt(2)
+    DEFAULT_ITERATIONS = 1000
+
+    def __init__(self, exploration=EXPLORATION, seed=None):
+        self.exploration = exploration
+        self.random = random.Random(seed)
+        self.root = None
+        self.rootBoard = None
+        # results of the last search
+        self.playouts = 0
+        self.searchTime = 0.0
+
+    def search(self, board:HexBoard, iterations=None, timeLimit=None):
+        """
+        Search for the best next move on a board.
+
+        Parameters
+        ----------
+        board : HexBoard
+            The board to play on. If it is the board this search's tree
+            is rooted at (see advance), the tree is reused; otherwise a
+            new tree is started.
+        iterations : int, optional
+            The number of playouts to run.
+        timeLimit : float, optional
+            The number of seconds to search for. If both iterations and
+            timeLimit are given, the search stops at whichever comes first;
+            if neither is, MCTS.DEFAULT_ITERATIONS playouts are run.
+
+        Returns
+        -------
+        int
+            The tile index (row * size + col) of the most visited move,
+            or None if the game is over.
+
+        """
+        self.setBoard(board)
+        if self.rootBoard.isGameOver():
+            return None
+        if None == iterations and None == timeLimit:
+            iterations = MCTS.DEFAULT_ITERATIONS
+
+        start = time.perf_counter()
+        count = 0
+        while None == iterations or count < iterations:
+            if not None == timeLimit and time.perf_counter() - start >= timeLimit:
+                break
+            node, leafBoard = self.selectLeaf()
+            winner = MCTS.playout(leafBoard, self.random)
+            MCTS.backpropagate(node, 1, winner)
+            count += 1
+
+        self.playouts = count
+        self.searchTime = time.perf_counter() - start
+        return self.bestMove()
+
+    def setBoard(self, board:HexBoard):
+        """
+        Root the search tree at a board, keeping the current tree if
+        it is already rooted at the same position.
+        """
+        if not None == self.rootBoard and self.rootBoard.toBytes() == board.toBytes():
+            return
+        self.rootBoard = board.copy()
+        self.root = MCTSNode(player=HexBoard.VALUES[board.getSelfPlayer()])
+
+    def advance(self, move):
+        """
+        Play a move (a tile index) on the root board, keeping the subtree
+        below that move as the new search tree.
+        """
+        if None == self.rootBoard:
+            raise Exception("advance called before a board was searched or set")
+        player = HexBoard.VALUES[self.rootBoard.getNextPlayer()]
+        self.rootBoard.playIndex(move)
+        child = self.root.getChild(move)
+        if None == child:
+            child = MCTSNode(move, player)
+        child.parent = None
+        self.root = child
+
+    def selectLeaf(self):
+        """
+        Walk down the tree from the root by UCT and expand one untried
+        move, if the game isn't over there.
+
+        Returns
+        -------
+        (MCTSNode, HexBoard)
+            The node reached, and a new board with its moves played.
+
+        """
+        node = self.root
+        board = self.rootBoard.copy()
+        while not board.isGameOver():
+            if None == node.untriedMoves:
+                moves = board.getEmptyIndexes()
+                self.random.shuffle(moves)
+                node.untriedMoves = moves
+            player = board.getNextPlayer()
+            if len(node.untriedMoves) > 0:
+                move = node.untriedMoves.pop()
+                board.placeIndex(move, player)
+                return node.addChild(move, HexBoard.VALUES[player]), board
+            node = node.selectChild(self.exploration)
+            board.placeIndex(node.move, player)
+        return node, board
+
+    def backpropagate(node:MCTSNode, winsFor, value, visits=1):
+        """
+        Add the results of a number of playouts from a node to it and
+        each of its ancestors; winsFor is the number won by the player
+        with tile value 'value' (see MCTSNode.update).
+        """
+        while not None == node:
+            node.update(winsFor, value, visits)
+            node = node.parent
+
+    def playout(board:HexBoard, rng):
+        """
+        Play a board out at random and return the winner's tile value
+        (HexBoard.X or HexBoard.O). The board is not changed.
+
+        Parameters
+        ----------
+        board : HexBoard
+            The board to play out.
+        rng : random.Random
+            The random number generator to shuffle the empty tiles with.
+
+        """
+        lrValue = HexBoard.VALUES[board.lr_player]
+        otherValue = HexBoard.X + HexBoard.O - lrValue
+        if board.isGameOver():
+            if board.isWinFor(board.lr_player):
+                return lrValue
+            return otherValue
+
+        empty = board.getEmptyIndexes()
+        rng.shuffle(empty)
+        nextValue = HexBoard.VALUES[board.getNextPlayer()]
+        # in turn order the next player gets the odd moves, so the
+        # first half (rounded up) of the shuffled tiles
+        half = (len(empty) + 1) // 2
+        cells = board.cells[:]
+        for index in empty[:half]:
+            cells[index] = nextValue
+        for index in empty[half:]:
+            cells[index] = HexBoard.X + HexBoard.O - nextValue
+
+        if HexBoard.spansBoard(cells, board.size, lrValue, True):
+            return lrValue
+        return otherValue
+
+    def bestMove(self):
+        """
+        Return the most visited move from the root, or None if there are none.
+        """
+        if None == self.root:
+            return None
+        child = self.root.mostVisitedChild()
+        if None == child:
+            return None
+        return child.move
+
+    def getMoveStatistics(self):
+        """
+        Return a list of (move, visits, win rate) for each move searched
+        from the root, most visited first.
+        """
+        if None == self.root:
+            return []
+        statistics = [(child.move, child.visits, child.wins / child.visits)
+                      for child in self.root.children if child.visits > 0]
+        statistics.sort(key=lambda entry: -entry[1])
+        return statistics
+
+    def getPlayoutRate(self):
+        """
+        Return the playouts per second of the last search.
+        """
+        if self.searchTime <= 0.0:
+            return 0.0
+        return self.playouts / self.searchTime
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:10:37 2026
+
+@author: Christopher Corbell
+"""
+
+import math
+
+class MCTSNode:
+    """
+    An MCTSNode is a node of a Monte Carlo search tree (see hex.mcts.MCTS).
+
+    A node stands for the board reached by playing its move (a tile index)
+    from its parent's board; it does not hold the board itself. Its wins
+    are counted for the player who made that move, so a parent picks the
+    child with the best win rate for itself.
+
+    The moves not yet expanded into children are set on a node's first
+    expansion; until then untriedMoves is None.
+    """
+
+    def __init__(self, move=None, player=None, parent=None):
+        self.move = move
+        self.player = player # tile value (HexBoard.X or HexBoard.O) of the mover
+        self.parent = parent
+        self.children = []
+        self.untriedMoves = None
+        self.wins = 0
+        self.visits = 0
+
+    def __repr__(self):
+        return f"MCTSNode(move={self.move}, wins={self.wins}, visits={self.visits}, children={len(self.children)})"
+
+    def isExpanded(self):
+        return not None == self.untriedMoves and len(self.untriedMoves) == 0
+
+    def addChild(self, move, player):
+        child = MCTSNode(move, player, self)
+        self.children.append(child)
+        return child
+
+    def selectChild(self, exploration):
+        """
+        Return the child with the highest UCT (upper confidence bound)
+        score, or the first child with no visits yet (which can happen 
+        while playouts from it are still pending).
+        """
+        logVisits = math.log(max(self.visits, 1))
+        best = None
+        bestScore = -1.0
+        for child in self.children:
+            if child.visits == 0:
+                return child
+            score = child.wins / child.visits + exploration * math.sqrt(logVisits / child.visits)
+            if score > bestScore:
+                best = child
+                bestScore = score
+        return best
+
+    def getChild(self, move):
+        for child in self.children:
+            if child.move == move:
+                return child
+        return None
+
+    def mostVisitedChild(self):
+        best = None
+        for child in self.children:
+            if None == best or child.visits > best.visits:
+                best = child
+        return best
+
+    def update(self, winsFor, value, visits=1):
+        """
+        Add the results of a number of playouts through this node.
+
+        Parameters
+        ----------
+        winsFor : int
+            The number of the playouts won by the player with tile value
+            'value'.
+        value : int
+            HexBoard.X or HexBoard.O.
+        visits : int, optional
+            The number of playouts; 1 by default.
+
+        """
+        self.visits += visits
+        if self.player == value:
+            self.wins += winsFor
+        else:
+            self.wins += visits - winsFor
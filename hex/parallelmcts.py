@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:20:41 2026
+
+@author: Christopher Corbell
+"""
+
+import random
+import time
+
+from hex.hexboard import HexBoard
+from hex.mcts import MCTS
+from treegen.parallel import ParallelExpander
+
+class ParallelMCTS(MCTS):
+    """
+    A ParallelMCTS runs a Monte Carlo tree search (see hex.mcts.MCTS)
+    across a number of worker processes, in one of two modes:
+
+        ParallelMCTS.ROOT - each worker searches its own tree from the
+            board, with its own random seed, and their root move visit
+            and win counts are summed to choose the move.
+        ParallelMCTS.LEAF - one tree is searched in this process; each
+            round selects one leaf per worker and each worker runs a
+            batch of random playouts from its leaf, whose win count is
+            propagated back up the tree in one update. (Each selection
+            expands a new node, so the leaves of a round are distinct
+            unless the game is over there.)
+
+    Boards are sent to workers as HexBoard.toBytes byte strings and
+    results come back as counts. Root parallelism needs the least
+    communication and should be preferred on large boards; leaf
+    parallelism keeps a single, reusable tree.
+
+    After a search, playouts, searchTime and getPlayoutRate() report the
+    playouts run by all workers and the wall-clock time taken. In root mode
+    the tree left at the root holds only the merged root moves.
+
+    Use as a context manager, or call shutdown() when done, to stop the
+    worker processes.
+    """
+
+    ROOT = 'root'
+    LEAF = 'leaf'
+    DEFAULT_BATCH_SIZE = 32
+
+    def __init__(self, workers:int, mode=ROOT, exploration=MCTS.EXPLORATION, seed=None, batchSize=DEFAULT_BATCH_SIZE):
+        MCTS.__init__(self, exploration, seed)
+        if not mode in [ParallelMCTS.ROOT, ParallelMCTS.LEAF]:
+            raise Exception(f"Unknown parallel search mode: {mode}")
+        self.workers = workers
+        self.mode = mode
+        self.batchSize = batchSize
+        # one task per chunk, so each task can go to its own worker
+        self.expander = ParallelExpander(workers, chunkSize=1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.shutdown()
+
+    def shutdown(self):
+        self.expander.shutdown()
+
+    def search(self, board:HexBoard, iterations=None, timeLimit=None):
+        """
+        Search for the best next move on a board, as for MCTS.search;
+        iterations is the total number of playouts across all workers.
+        """
+        if None == iterations and None == timeLimit:
+            iterations = MCTS.DEFAULT_ITERATIONS
+        if self.mode == ParallelMCTS.ROOT:
+            return self.searchRoots(board, iterations, timeLimit)
+        return self.searchLeaves(board, iterations, timeLimit)
+
+    def searchRoots(self, board:HexBoard, iterations, timeLimit):
+        # root statistics are merged into a new tree for each search
+        self.rootBoard = None
+        self.setBoard(board)
+        if self.rootBoard.isGameOver():
+            return None
+
+        start = time.perf_counter()
+        data = board.toBytes()
+        tasks = []
+        for n in range(0, self.workers):
+            workerIterations = None
+            if not None == iterations:
+                # spread the remainder over the first workers
+                workerIterations = iterations // self.workers
+                if n < iterations % self.workers:
+                    workerIterations += 1
+            tasks.append((data, workerIterations, timeLimit, self.exploration, self.random.getrandbits(64)))
+        results = self.expander.map(ParallelMCTS.searchRootChunk, tasks)
+
+        player = HexBoard.VALUES[self.rootBoard.getNextPlayer()]
+        playouts = 0
+        for workerPlayouts, moveStatistics in results:
+            playouts += workerPlayouts
+            for move, visits, wins in moveStatistics:
+                child = self.root.getChild(move)
+                if None == child:
+                    child = self.root.addChild(move, player)
+                child.visits += visits
+                child.wins += wins
+        self.root.visits = playouts
+
+        self.playouts = playouts
+        self.searchTime = time.perf_counter() - start
+        return self.bestMove()
+
+    def searchLeaves(self, board:HexBoard, iterations, timeLimit):
+        self.setBoard(board)
+        if self.rootBoard.isGameOver():
+            return None
+
+        start = time.perf_counter()
+        count = 0
+        while None == iterations or count < iterations:
+            if not None == timeLimit and time.perf_counter() - start >= timeLimit:
+                break
+            leaves = []
+            tasks = []
+            for n in range(0, self.workers):
+                batchSize = self.batchSize
+                if not None == iterations:
+                    batchSize = min(batchSize, iterations - count - len(leaves) * self.batchSize)
+                    if batchSize <= 0:
+                        break
+                node, leafBoard = self.selectLeaf()
+                leaves.append((node, batchSize))
+                tasks.append((leafBoard.toBytes(), batchSize, self.random.getrandbits(64)))
+            xWinCounts = self.expander.map(ParallelMCTS.playoutChunk, tasks)
+            for n in range(0, len(leaves)):
+                node, batchSize = leaves[n]
+                MCTS.backpropagate(node, xWinCounts[n], HexBoard.X, batchSize)
+                count += batchSize
+
+        self.playouts = count
+        self.searchTime = time.perf_counter() - start
+        return self.bestMove()
+
+    def searchRootChunk(tasks):
+        """
+        Run an independent search for each task of (board bytes, iterations,
+        time limit, exploration, seed), returning for each the number of
+        playouts run and a list of (move, visits, wins) for the root moves;
+        this is the unit of work for root parallelism.
+        """
+        results = []
+        for data, iterations, timeLimit, exploration, seed in tasks:
+            mcts = MCTS(exploration, seed)
+            mcts.search(HexBoard.fromBytes(data), iterations, timeLimit)
+            moveStatistics = [(child.move, child.visits, child.wins) for child in mcts.root.children]
+            results.append((mcts.playouts, moveStatistics))
+        return results
+
+    def playoutChunk(tasks):
+        """
+        Run a batch of random playouts for each task of (board bytes,
+        playout count, seed), returning for each the number won by X;
+        this is the unit of work for leaf parallelism.
+        """
+        results = []
+        for data, count, seed in tasks:
+            board = HexBoard.fromBytes(data)
+            rng = random.Random(seed)
+            xWins = 0
+            for n in range(0, count):
+                if MCTS.playout(board, rng) == HexBoard.X:
+                    xWins += 1
+            results.append(xWins)
+        return results
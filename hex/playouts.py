@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:58:12 2026
+
+@author: Christopher Corbell
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from hex.hexboard import HexBoard
+
+class Playouts:
+    """
+    Playouts runs batches of random Hex playouts from one HexBoard
+    position with NumPy, filling every board of a batch at once as an
+    (N, size, size) int8 array of tile values (HexBoard.EMPTY, X or O)
+    and finding every winner with one vectorized flood fill over
+    bit-packed rows.
+
+    As in MCTS.playout, each playout fills all the empty tiles at once,
+    the next player taking a random half (rounded up) of them, and a full
+    board has exactly one winner: the left-right player if their tiles
+    connect the first and last rows, otherwise the other player.
+
+    NumPy is needed for this class only; it is not otherwise a
+    dependency of this package.
+    """
+
+    def run(board:HexBoard, seeds, ownership=False):
+        """
+        Run a batch of random playouts from a board.
+
+        Parameters
+        ----------
+        board : HexBoard
+            The position to play out from; it is not changed.
+        seeds : sequence of int
+            One seed per playout; len(seeds) playouts are run, from a
+            single random generator seeded with the whole sequence, so
+            the same seeds give the same results.
+        ownership : bool, optional
+            If True, also return per-tile ownership statistics.
+
+        Returns
+        -------
+        (int, int) or (int, int, numpy.ndarray)
+            The number of playouts won by X and by O and, if ownership is
+            set, a (size, size) float array of the fraction of playouts
+            in which each tile ended up X's.
+
+        """
+        Playouts.requireNumpy()
+        rng = np.random.default_rng(seeds)
+        boards = Playouts.fillBoards(board, len(seeds), rng)
+        winners = Playouts.winners(boards, HexBoard.VALUES[board.lr_player])
+        xWins = int(np.count_nonzero(winners == HexBoard.X))
+        oWins = len(seeds) - xWins
+        if not ownership:
+            return xWins, oWins
+        return xWins, oWins, (boards == HexBoard.X).mean(axis=0)
+
+    def fillBoards(board:HexBoard, count, rng):
+        """
+        Return a (count, size, size) int8 array of random fills of a
+        board's empty tiles, using a numpy.random.Generator.
+        """
+        Playouts.requireNumpy()
+        size = board.size
+        cells = np.frombuffer(bytes(board.cells), dtype=np.int8)
+        boards = np.tile(cells, (count, 1))
+        empty = np.flatnonzero(cells == HexBoard.EMPTY)
+        if len(empty) > 0 and count > 0:
+            nextValue = HexBoard.X + HexBoard.O - HexBoard.VALUES[board.getSelfPlayer()]
+            # a random permutation of the empty tiles for each board;
+            # the next player takes the first half, rounded up
+            order = np.argsort(rng.random((count, len(empty))), axis=1)
+            half = (len(empty) + 1) // 2
+            rows = np.arange(count)[:, None]
+            boards[rows, empty[order[:, :half]]] = nextValue
+            boards[rows, empty[order[:, half:]]] = HexBoard.X + HexBoard.O - nextValue
+        return boards.reshape(count, size, size)
+
+    def winners(boards, lrValue):
+        """
+        Find the winner of each of a batch of full boards.
+
+        Parameters
+        ----------
+        boards : numpy.ndarray
+            An (N, size, size) array of full boards' tile values.
+        lrValue : int
+            The tile value of the left-right player, who connects the
+            first and last rows.
+
+        Returns
+        -------
+        numpy.ndarray
+            An int8 array of the N winners' tile values.
+
+        """
+        Playouts.requireNumpy()
+        reached = Playouts.floodRows(boards == lrValue)
+        lrWins = reached[:, -1] != 0
+        return np.where(lrWins, lrValue, HexBoard.X + HexBoard.O - lrValue).astype(np.int8)
+
+    def floodRows(own):
+        """
+        Given an (N, size, size) bool array of one player's tiles, find
+        the tiles connected to the first row on every board at once.
+
+        Each board row is packed into a bit mask (bit c for column c),
+        so a flood fill step is a few shifts over N masks: down and up 
+        sweeps over the rows, spreading across each row as it goes, are
+        repeated until no board changes. Neighbors are as in 
+        HexBoard.getNeighbors; from row r-1 a tile reaches columns c and 
+        c-1 of row r, and from row r+1 columns c and c+1.
+
+        Returns
+        -------
+        numpy.ndarray
+            An (N, size) uint64 array of the reached tiles' row masks.
+
+        """
+        size = own.shape[1]
+        if size > 64:
+            raise Exception(f"Boards of size {size} are too large to flood fill (64 at most)")
+        weights = np.left_shift(np.uint64(1), np.arange(size, dtype=np.uint64))
+        rows = (own * weights).sum(axis=2, dtype=np.uint64)
+        reached = np.zeros_like(rows)
+        reached[:, 0] = Playouts.spreadRow(rows[:, 0], rows[:, 0])
+        one = np.uint64(1)
+        while True:
+            before = reached.copy()
+            for row in range(1, size):
+                above = reached[:, row - 1]
+                reached[:, row] = Playouts.spreadRow(reached[:, row] | ((above | (above >> one)) & rows[:, row]), rows[:, row])
+            for row in range(size - 2, -1, -1):
+                below = reached[:, row + 1]
+                reached[:, row] = Playouts.spreadRow(reached[:, row] | ((below | (below << one)) & rows[:, row]), rows[:, row])
+            if np.array_equal(before, reached):
+                return reached
+
+    def spreadRow(masks, rowMasks):
+        """
+        Spread reached tiles along their rows, through the player's 
+        tiles (rowMasks), until no row changes.
+        """
+        one = np.uint64(1)
+        while True:
+            spread = (masks | (masks << one) | (masks >> one)) & rowMasks
+            if np.array_equal(spread, masks):
+                return spread
+            masks = spread
+
+    def requireNumpy():
+        if None == np:
+            raise ImportError("hex.playouts.Playouts requires numpy")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:02:27 2026
+
+@author: Christopher Corbell
+"""
+
+class PNNode:
+    """
+    A PNNode is a node of a proof-number search tree (see
+    hex.pnsolver.PNSolver), for the board reached by playing its move
+    (a tile index) from its parent's board. Like MCTSNode, it does not
+    hold the board itself.
+
+    Proof and disproof numbers are from the point of view of the player
+    to move at the node: pn is (a lower bound on) the number of nodes
+    which must be expanded to prove that they win, dn the number to prove
+    that they lose. A node with pn 0 is a proven win for the player to
+    move, one with dn 0 a proven loss.
+
+    The key (HexBoard.solverKey) is set when the node is expanded, and
+    children is None until then.
+    """
+
+    def __init__(self, move=None, parent=None):
+        self.move = move
+        self.parent = parent
+        self.pn = 1
+        self.dn = 1
+        self.key = None
+        self.children = None
+
+    def __repr__(self):
+        return f"PNNode(move={self.move}, pn={self.pn}, dn={self.dn})"
+
+    def isProven(self):
+        return self.pn == 0 or self.dn == 0
+
+    def mostProvingChild(self):
+        """
+        Return the child whose disproof number is this node's proof number,
+        i.e. the child with the smallest disproof number.
+        """
+        best = None
+        for child in self.children:
+            if None == best or child.dn < best.dn:
+                best = child
+        return best
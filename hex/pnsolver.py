@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:10:52 2026
+
+@author: Christopher Corbell
+"""
+
+import json
+import os
+import time
+
+from hex.hexboard import HexBoard
+from hex.pnnode import PNNode
+from hex.transposition import TranspositionTable
+
+class PNSolver:
+    """
+    A PNSolver proves which player wins a Hex position, and finds a
+    winning first move, by proof-number search. It is meant for boards
+    up to about 5x5, where HexTree's exhaustive generation can't go.
+
+    Each iteration walks from the root to the most-proving unexpanded
+    node, expands it and updates proof and disproof numbers (see PNNode)
+    back up to the root. Win detection uses HexBoard's union-find sets,
+    and moves are pruned when a player can win at once:
+
+        - if the player to move has a winning move, only it is tried;
+        - if the opponent has two or more winning moves, the position
+          is lost;
+        - if the opponent has one winning move, only blocking it is tried.
+
+    Proven positions are kept in a TranspositionTable keyed by
+    HexBoard.solverKey, so positions reached by other move orders or in
+    symmetric forms are not proven again, and the subtrees of proven nodes
+    are dropped. The table's proven entries can be written to a JSON
+    checkpoint file as the search goes and read back to resume a solve.
+    """
+
+    INFINITY = 1 << 60
+    # version 1 keys left out the left-right player
+    CHECKPOINT_VERSION = 2
+    DEFAULT_CHECKPOINT_INTERVAL = 10000
+
+    def __init__(self, table:TranspositionTable=None, checkpointPath=None, checkpointInterval=DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        Parameters
+        ----------
+        table : TranspositionTable, optional
+            The table to keep proven positions in; by default a new one.
+        checkpointPath : str, optional
+            If given, proven positions are read from this file (if it
+            exists) and written to it every checkpointInterval expansions
+            and when a solve ends.
+        checkpointInterval : int, optional
+            The number of node expansions between checkpoints.
+
+        """
+        if None == table:
+            table = TranspositionTable()
+        self.table = table
+        self.checkpointPath = checkpointPath
+        self.checkpointInterval = checkpointInterval
+        self.nodesExpanded = 0
+        self.root = None
+        self.boardSize = None
+        if not None == checkpointPath and os.path.exists(checkpointPath):
+            self.loadCheckpoint(checkpointPath)
+
+    def solve(self, board:HexBoard, maxNodes=None, timeLimit=None):
+        """
+        Prove the winner of a board.
+
+        Parameters
+        ----------
+        board : HexBoard
+            The position to solve; it is not changed.
+        maxNodes : int, optional
+            Stop after expanding this many nodes.
+        timeLimit : float, optional
+            Stop after this many seconds.
+
+        Returns
+        -------
+        (str, int)
+            The winner's token and, if the winner is the player to move,
+            a winning move (tile index) for them (otherwise None); or None
+            if the search was stopped before the position was proven.
+
+        """
+        if not None == self.boardSize and not self.boardSize == board.size:
+            raise Exception(f"This solver's positions are for size {self.boardSize} boards, not {board.size}")
+        self.boardSize = board.size
+
+        if board.isGameOver():
+            if board.isXWin():
+                return HexBoard.X_TOKEN, None
+            return HexBoard.O_TOKEN, None
+
+        mover = board.getNextPlayer()
+        self.root = PNNode()
+        # the root is always searched, to find its winning move
+        self.expand(self.root, board, useTable=False)
+
+        start = time.perf_counter()
+        expansions = 0
+        while not self.root.isProven():
+            if not None == maxNodes and expansions >= maxNodes:
+                break
+            if not None == timeLimit and time.perf_counter() - start >= timeLimit:
+                break
+            node = self.root
+            nodeBoard = board.copy()
+            while not None == node.children:
+                node = node.mostProvingChild()
+                nodeBoard.placeIndex(node.move, nodeBoard.getNextPlayer())
+            self.expand(node, nodeBoard)
+            self.backup(node, nodeBoard.countEmptyTiles())
+            expansions += 1
+            if not None == self.checkpointPath and expansions % self.checkpointInterval == 0:
+                self.saveCheckpoint(self.checkpointPath)
+
+        if not None == self.checkpointPath:
+            self.saveCheckpoint(self.checkpointPath)
+        if self.root.pn == 0:
+            for child in self.root.children:
+                if child.dn == 0:
+                    return mover, child.move
+        if self.root.dn == 0:
+            return PNSolver.opponentOf(mover), None
+        return None
+
+    def expand(self, node:PNNode, board:HexBoard, useTable=True):
+        """
+        Expand a node, given its board: look it up in the table, or
+        apply the immediate-win pruning and make its children.
+        """
+        self.nodesExpanded += 1
+        node.key = board.solverKey()
+        if useTable:
+            entry = self.table.lookup(node.key)
+            if not None == entry:
+                PNSolver.setProven(node, entry[0])
+                node.children = []
+                return
+
+        mover = board.getNextPlayer()
+        wins = PNSolver.winningMoves(board, mover)
+        if len(wins) > 0:
+            child = PNNode(wins[0], node)
+            PNSolver.setProven(child, False)
+            node.children = [child]
+        else:
+            threats = PNSolver.winningMoves(board, PNSolver.opponentOf(mover))
+            if len(threats) > 1:
+                node.children = []
+                PNSolver.setProven(node, False)
+            elif len(threats) == 1:
+                node.children = [PNNode(threats[0], node)]
+            else:
+                node.children = [PNNode(move, node) for move in board.getEmptyIndexes()]
+        PNSolver.update(node)
+        if node.isProven():
+            self.table.store(node.key, node.pn == 0, board.countEmptyTiles())
+
+    def backup(self, node:PNNode, emptyCount):
+        """
+        Update the proof numbers of a node's ancestors after the node 
+        (with emptyCount empty tiles) has changed, recording newly proven
+        ones in the table and dropping their subtrees (except the root's
+        children). Proofs are stored with their empty tile count as depth,
+        so the table prefers to keep the proofs of earlier positions.
+        """
+        while not None == node.parent:
+            node = node.parent
+            emptyCount += 1
+            pn = node.pn
+            dn = node.dn
+            PNSolver.update(node)
+            if node.isProven():
+                self.table.store(node.key, node.pn == 0, emptyCount)
+                if not node is self.root:
+                    node.children = []
+            elif pn == node.pn and dn == node.dn:
+                return
+
+    def update(node:PNNode):
+        """
+        Set a node's proof numbers from its children's.
+        """
+        if None == node or None == node.children or len(node.children) == 0:
+            return
+        pn = PNSolver.INFINITY
+        dn = 0
+        for child in node.children:
+            if child.dn < pn:
+                pn = child.dn
+            dn += child.pn
+        node.pn = pn
+        node.dn = min(dn, PNSolver.INFINITY)
+
+    def setProven(node:PNNode, isWin):
+        if isWin:
+            node.pn = 0
+            node.dn = PNSolver.INFINITY
+        else:
+            node.pn = PNSolver.INFINITY
+            node.dn = 0
+
+    def opponentOf(token):
+        if token == HexBoard.X_TOKEN:
+            return HexBoard.O_TOKEN
+        return HexBoard.X_TOKEN
+
+    def winningMoves(board:HexBoard, token):
+        """
+        Return the empty tile indexes where a player would win at once,
+        found from the union-find sets: a tile wins if it touches (by its
+        position, or through a neighboring group) both of the player's sides.
+        """
+        size = board.size
+        cells = board.cells
+        value = HexBoard.VALUES[token]
+        sides = board.sideIndex(token)
+        firstSide = board.findSet(sides)
+        lastSide = board.findSet(sides + 1)
+        acrossRows = token == board.lr_player
+        neighbors = HexBoard.getNeighbors(size)
+        wins = []
+        for index in board.getEmptyIndexes():
+            if acrossRows:
+                position = index // size
+            else:
+                position = index % size
+            touchesFirst = position == 0
+            touchesLast = position == size - 1
+            for neighbor in neighbors[index]:
+                if cells[neighbor] == value:
+                    root = board.findSet(neighbor)
+                    if root == firstSide:
+                        touchesFirst = True
+                    elif root == lastSide:
+                        touchesLast = True
+            if touchesFirst and touchesLast:
+                wins.append(index)
+        return wins
+
+    def saveCheckpoint(self, path):
+        """
+        Write the table's proven positions to a JSON file, replacing it
+        only once the new file is complete.
+        """
+        table = self.table
+        entries = []
+        for slot in range(0, table.capacity):
+            if not None == table.keys[slot] and not None == table.values[slot]:
+                entries.append([table.keys[slot], table.values[slot], table.depths[slot]])
+        checkpoint = {"version": PNSolver.CHECKPOINT_VERSION,
+                      "size": self.boardSize,
+                      "entries": entries}
+        temporaryPath = path + ".tmp"
+        with open(temporaryPath, 'w') as file:
+            json.dump(checkpoint, file)
+        os.replace(temporaryPath, path)
+
+    def loadCheckpoint(self, path):
+        """
+        Read proven positions from a JSON file written by saveCheckpoint.
+        """
+        with open(path, 'r') as file:
+            checkpoint = json.load(file)
+        if not checkpoint.get("version") == PNSolver.CHECKPOINT_VERSION:
+            raise Exception(f"{path} is not a version {PNSolver.CHECKPOINT_VERSION} solver checkpoint")
+        self.boardSize = checkpoint["size"]
+        for key, isWin, depth in checkpoint["entries"]:
+            self.table.store(key, isWin, depth)
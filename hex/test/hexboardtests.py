@@ -161,6 +161,80 @@ class HexBoardTests(unittest.TestCase):
         self.assertFalse(hex5.isXWin())
         self.assertFalse(hex5.isOWin())
         self.assertFalse(hex5.isGameOver())
+        
+    def testCornersAndCopies(self):
+        hex3 = HexBoard(3)
+        
+        # corner tiles touch a row side and a column side; 
+        # these must not connect O's first and last rows
+        hex3.playO(0,0)
+        hex3.playX(1,1)
+        hex3.playO(2,0)
+        self.assertFalse(hex3.isOWin())
+        self.assertFalse(hex3.isGameOver())
+        
+        clone = hex3.copy()
+        hex3.playX(0,2)
+        hex3.playO(1,0)
+        self.assertTrue(hex3.isOWin())
+        self.assertFalse(clone.isOWin())
+        self.assertEqual(HexBoard.EMPTY_TOKEN, clone.getTileValue(1, 0))
+        
+        decoded = HexBoard.fromBytes(hex3.toBytes())
+        self.assertTrue(decoded.isOWin())
+        self.assertEqual(hex3.getOTiles(), decoded.getOTiles())
+        self.assertEqual(hex3.getXTiles(), decoded.getXTiles())
+
+    def testPlayIndexAndCounts(self):
+        hex4 = HexBoard(4)
+        self.assertEqual(16, hex4.countEmptyTiles())
+        self.assertEqual(list(range(0, 16)), hex4.getEmptyIndexes())
+
+        hex4.playIndex(5)
+        self.assertEqual(HexBoard.O_TOKEN, hex4.getTileValue(1, 1))
+        self.assertEqual(HexBoard.X_TOKEN, hex4.getNextPlayer())
+        hex4.playIndex(15)
+        self.assertEqual(HexBoard.X_TOKEN, hex4.getTileValue(3, 3))
+        self.assertEqual(1, hex4.countXTiles())
+        self.assertEqual(1, hex4.countOTiles())
+        self.assertEqual(14, hex4.countEmptyTiles())
+        self.assertFalse(5 in hex4.getEmptyIndexes())
+
+        with self.assertRaises(Exception):
+            hex4.playIndex(5)
+        with self.assertRaises(Exception):
+            hex4.playIndex(16)
+
+        decoded = HexBoard.fromBytes(hex4.toBytes())
+        self.assertEqual(1, decoded.countXTiles())
+        self.assertEqual(1, decoded.countOTiles())
+        self.assertEqual(HexBoard.O_TOKEN, decoded.getNextPlayer())
+
+    def testHashes(self):
+        hex4 = HexBoard(4)
+        rotated = HexBoard(4)
+        swapped = HexBoard(4, first_player=HexBoard.X_TOKEN)
+        self.assertEqual(hex4.canonicalKey(), rotated.canonicalKey())
+        
+        for row, col in [(0,1), (2,2), (3,0), (1,3)]:
+            token = hex4.getNextPlayer()
+            hex4.place(row, col, token)
+            rotated.place(3 - row, 3 - col, token)
+            if token == HexBoard.X_TOKEN:
+                swapped.place(col, row, HexBoard.O_TOKEN)
+            else:
+                swapped.place(col, row, HexBoard.X_TOKEN)
+                
+        self.assertEqual(hex4.rotHash, rotated.hash)
+        self.assertEqual(hex4.hash, rotated.rotHash)
+        self.assertEqual(hex4.canonicalKey(), rotated.canonicalKey())
+        self.assertEqual(hex4.swapHash, swapped.hash)
+        self.assertEqual(hex4.solverKey(), swapped.solverKey())
+        self.assertEqual(hex4.hash, HexBoard.fromBytes(hex4.toBytes()).hash)
+        self.assertEqual(hex4.hash, hex4.copy().hash)
+        
+        hex4.playIndex(5)
+        self.assertNotEqual(hex4.canonicalKey(), rotated.canonicalKey())
     
 if __name__ == "__main__":
     hexboardtests_main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:05:33 2026
+
+@author: Christopher Corbell
+"""
+
+import unittest
+
+from hex.hexboard import HexBoard
+from hex.hextree import HexTree
+from hex.labelcache import LabelCache
+from hex.transposition import TranspositionTable
+
+def RunAllHexTreeTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(HexTreeTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1HexTreeTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(HexTreeTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def hextreetests_main():
+    unittest.main()
+
+class HexTreeTests(unittest.TestCase):
+
+    def makeBoard(self):
+        # O (left-right, across rows) to move on a 3x3 board
+        hex3 = HexBoard(3)
+        hex3.playO(0,1)
+        hex3.playX(1,0)
+        hex3.playO(2,0)
+        hex3.playX(1,2)
+        return hex3
+
+    def testFindWins(self):
+        hex3 = self.makeBoard()
+        oWins = HexTree.findWins(hex3, HexBoard.O_TOKEN, labelsOnly=True)
+        xWins = HexTree.findWins(hex3, HexBoard.X_TOKEN, labelsOnly=True)
+        allWins = HexTree.findWins(hex3, None, labelsOnly=True)
+        self.assertTrue(len(oWins) > 0)
+        self.assertTrue(len(xWins) > 0)
+        self.assertEqual(sorted(oWins + xWins), sorted(allWins))
+        # O wins at once by playing the center, the 3rd empty tile
+        self.assertTrue('0.2' in oWins)
+
+        for board in HexTree.findWins(hex3, HexBoard.X_TOKEN):
+            self.assertTrue(board.isXWin())
+            self.assertEqual(board.label, xWins.pop(0))
+
+        # the search takes back its moves and unions on its own copies
+        self.assertEqual(self.makeBoard().toBytes(), hex3.toBytes())
+        self.assertEqual(self.makeBoard().sets, hex3.sets)
+        for board in HexTree.findWins(hex3, None):
+            self.assertTrue(board.isGameOver())
+
+        # wins are not searched below
+        for label in allWins:
+            for other in allWins:
+                self.assertFalse(other.startswith(label + '.'))
+
+    def testWinLimits(self):
+        hex3 = self.makeBoard()
+        allWins = HexTree.findWins(hex3, None, labelsOnly=True)
+        self.assertEqual(allWins[:3], list(HexTree.iterWins(hex3, None, maxResults=3)))
+        shallow = HexTree.findWins(hex3, None, labelsOnly=True, maxDepth=2)
+        self.assertEqual([label for label in allWins if label.count('.') <= 2], shallow)
+        self.assertEqual([], HexTree.findWins(HexBoard(5), None, maxDepth=4))
+
+        labels = list(HexTree.iterWins(HexBoard(5), None, timeLimit=0.05))
+        self.assertTrue(len(labels) > 0)
+
+    def testBoardsFromLabels(self):
+        root = HexBoard(3)
+        tree = HexTree()
+        tree.generateTree(root, maxDepth=3)
+        boards = {}
+        for ply in tree.plies:
+            for board in ply:
+                boards[board.label] = board
+        labels = sorted(boards.keys())[::5]
+
+        for label in labels:
+            board = HexTree.generateBoardFromLabel(label, root)
+            self.assertEqual(label, board.label)
+            self.assertEqual(boards[label].toBytes(), board.toBytes())
+
+        path = HexTree.getAllBoardsForLabel('0.4.2.0', root.copy())
+        self.assertEqual(['0', '0.4', '0.4.2', '0.4.2.0'], [board.label for board in path])
+        self.assertEqual(boards['0.4.2.0'].toBytes(), path[-1].toBytes())
+
+        resolved = HexTree.generateBoardsFromLabels(labels, root)
+        self.assertEqual(labels, [board.label for board in resolved])
+        for board in resolved:
+            self.assertEqual(boards[board.label].toBytes(), board.toBytes())
+
+        cache = LabelCache(root, maxEntries=4)
+        for label in labels:
+            self.assertEqual(boards[label].toBytes(), cache.resolve(label).toBytes())
+            self.assertTrue(cache.entryCount <= 4)
+
+        with self.assertRaises(Exception):
+            HexTree.generateBoardFromLabel('0.9', root)
+
+    def testStreamedPlies(self):
+        for distinctOnly in [False, True]:
+            tree = HexTree()
+            tree.generateTree(HexBoard(3), maxDepth=5, distinctOnly=distinctOnly)
+            expected = [[(board.label, board.toBytes()) for board in ply] for ply in tree.plies]
+            self.assertEqual(5, len(expected))
+
+            streamed = HexTree()
+            plies = streamed.generatePlies(HexBoard(3), maxDepth=5, distinctOnly=distinctOnly)
+            self.assertEqual(expected, [[(board.label, board.toBytes()) for board in ply] for ply in plies])
+            self.assertEqual([], streamed.plies)
+            for ply in streamed.generatePlies(HexBoard(3), maxDepth=3, distinctOnly=distinctOnly):
+                self.assertTrue(all([None == board.parent for board in ply]))
+
+    def testParallelGeneration(self):
+        for distinctOnly in [False, True]:
+            serial = HexTree()
+            serial.generateTree(HexBoard(3), maxDepth=6, distinctOnly=distinctOnly)
+
+            parallel = HexTree()
+            parallel.generateTree(HexBoard(3), maxDepth=6, workers=2, distinctOnly=distinctOnly)
+            self.assertEqual([[(board.label, board.toBytes()) for board in ply] for ply in serial.plies],
+                             [[(board.label, board.toBytes()) for board in ply] for ply in parallel.plies])
+
+    def testDistinctPositions(self):
+        tree = HexTree()
+        tree.generateTree(HexBoard(3), distinctOnly=True)
+        self.assertEqual([5, 36, 128, 384, 636, 760, 573, 213, 45], [len(ply) for ply in tree.plies])
+        for ply in tree.plies:
+            keys = set([board.canonicalKey() for board in ply])
+            self.assertEqual(len(ply), len(keys))
+            
+        hex3 = self.makeBoard()
+        allWins = HexTree.findWins(hex3, None)
+        distinctWins = HexTree.findWins(hex3, None, distinctOnly=True)
+        keys = [board.canonicalKey() for board in distinctWins]
+        self.assertEqual(len(keys), len(set(keys)))
+        self.assertEqual(set(keys), set([board.canonicalKey() for board in allWins]))
+        
+    def testTranspositionTable(self):
+        table = TranspositionTable(4)
+        self.assertEqual(4, table.capacity)
+        # keys 0, 2, 4 share a bucket
+        table.store(0, 'a', 3)
+        table.store(2, 'b', 1)
+        self.assertEqual(('a', 3), table.lookup(0))
+        self.assertEqual(('b', 1), table.lookup(2))
+        table.store(4, 'c', 2)
+        self.assertEqual(('a', 3), table.lookup(0))
+        self.assertEqual(('c', 2), table.lookup(4))
+        self.assertEqual(None, table.lookup(2))
+        table.store(2, 'd', 5)
+        self.assertEqual(('d', 5), table.lookup(2))
+        self.assertEqual(('a', 3), table.lookup(0))
+        self.assertFalse(4 in table)
+        self.assertEqual(2, len(table))
+        
+if __name__ == "__main__":
+    hextreetests_main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:52:16 2026
+
+@author: Christopher Corbell
+"""
+
+import random
+import unittest
+
+from hex.hexboard import HexBoard
+from hex.mcts import MCTS
+from hex.parallelmcts import ParallelMCTS
+
+def RunAllMCTSTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(MCTSTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1MCTSTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(MCTSTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def mctstests_main():
+    unittest.main()
+
+class MCTSTests(unittest.TestCase):
+
+    def testPlayoutWinner(self):
+        rng = random.Random(7)
+        for trial in range(0, 50):
+            board = HexBoard(5)
+            for n in range(0, trial % 12):
+                if board.isGameOver():
+                    break
+                board.playIndex(rng.choice(board.getEmptyIndexes()))
+            before = board.toBytes()
+            winner = MCTS.playout(board, rng)
+            self.assertTrue(winner in [HexBoard.X, HexBoard.O])
+            self.assertEqual(before, board.toBytes())
+
+        # a decided board always plays out to its winner
+        hex3 = HexBoard(3)
+        hex3.playO(0,0)
+        hex3.playX(1,1)
+        hex3.playO(1,0)
+        hex3.playX(0,1)
+        hex3.playO(2,0)
+        self.assertTrue(hex3.isOWin())
+        self.assertEqual(HexBoard.O, MCTS.playout(hex3, rng))
+
+    def testFindsOnlyWinningMove(self):
+        # O to move on a 4x4 board, where only tile 5 wins
+        board = HexBoard.fromBytes(bytes.fromhex("04020202000101000000010201020000000002"))
+        mcts = MCTS(seed=1)
+        self.assertEqual(5, mcts.search(board, iterations=2000))
+        self.assertEqual(2000, mcts.playouts)
+        self.assertEqual(2000, mcts.root.visits)
+        self.assertEqual(5, mcts.getMoveStatistics()[0][0])
+
+    def testTreeReuse(self):
+        board = HexBoard(5)
+        mcts = MCTS(seed=3)
+        move = mcts.search(board, iterations=500)
+        child = mcts.root.getChild(move)
+        visits = child.visits
+
+        mcts.advance(move)
+        self.assertTrue(mcts.root is child)
+        self.assertEqual(None, mcts.root.parent)
+        self.assertEqual(HexBoard.X_TOKEN, mcts.rootBoard.getNextPlayer())
+
+        board.playIndex(move)
+        mcts.search(board, iterations=100)
+        self.assertTrue(mcts.root is child)
+        self.assertEqual(visits + 100, mcts.root.visits)
+
+        # an unrelated board starts a new tree
+        mcts.search(HexBoard(5), iterations=10)
+        self.assertEqual(10, mcts.root.visits)
+
+    def testTimeLimit(self):
+        mcts = MCTS(seed=4)
+        move = mcts.search(HexBoard(7), timeLimit=0.05)
+        self.assertFalse(None == move)
+        self.assertTrue(mcts.playouts > 0)
+        self.assertTrue(mcts.getPlayoutRate() > 0.0)
+
+    def testParallelRoots(self):
+        board = HexBoard.fromBytes(bytes.fromhex("04020202000101000000010201020000000002"))
+        with ParallelMCTS(2, ParallelMCTS.ROOT, seed=1) as mcts:
+            self.assertEqual(5, mcts.search(board, iterations=2000))
+            self.assertEqual(2000, mcts.playouts)
+            self.assertEqual(2000, sum([child.visits for child in mcts.root.children]))
+            self.assertTrue(mcts.getPlayoutRate() > 0.0)
+
+    def testParallelLeaves(self):
+        board = HexBoard(5)
+        with ParallelMCTS(2, ParallelMCTS.LEAF, seed=2, batchSize=8) as mcts:
+            move = mcts.search(board, iterations=300)
+            self.assertFalse(None == move)
+            self.assertEqual(300, mcts.playouts)
+            self.assertEqual(300, mcts.root.visits)
+            
+            # the tree is reused as for a single process search
+            mcts.advance(move)
+            visits = mcts.root.visits
+            mcts.search(mcts.rootBoard, iterations=100)
+            self.assertEqual(visits + 100, mcts.root.visits)
+
+if __name__ == "__main__":
+    mctstests_main()
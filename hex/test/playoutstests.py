@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:31:09 2026
+
+@author: Christopher Corbell
+"""
+
+import unittest
+
+from hex.hexboard import HexBoard
+from hex.playouts import Playouts, np
+
+def RunAllPlayoutsTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(PlayoutsTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1PlayoutsTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(PlayoutsTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def playoutstests_main():
+    unittest.main()
+
+@unittest.skipIf(None == np, "numpy is not installed")
+class PlayoutsTests(unittest.TestCase):
+
+    def testFillBoards(self):
+        hex4 = HexBoard(4)
+        hex4.playO(1,1)
+        hex4.playX(2,2)
+        hex4.playO(0,3)
+        boards = Playouts.fillBoards(hex4, 50, np.random.default_rng(1))
+        self.assertEqual((50, 4, 4), boards.shape)
+        for board in boards:
+            # X is next, so takes 7 of the 13 empty tiles
+            self.assertEqual(8, np.count_nonzero(board == HexBoard.X))
+            self.assertEqual(8, np.count_nonzero(board == HexBoard.O))
+            self.assertEqual(HexBoard.O, board[1][1])
+            self.assertEqual(HexBoard.X, board[2][2])
+            self.assertEqual(HexBoard.O, board[0][3])
+
+    def testWinnersMatchFloodFill(self):
+        for size in [1, 2, 5, 11]:
+            hex = HexBoard(size)
+            boards = Playouts.fillBoards(hex, 200, np.random.default_rng(size))
+            winners = Playouts.winners(boards, HexBoard.O)
+            for n in range(0, len(boards)):
+                cells = bytearray(boards[n].astype(np.uint8).tobytes())
+                if HexBoard.spansBoard(cells, size, HexBoard.O, True):
+                    self.assertEqual(HexBoard.O, winners[n])
+                else:
+                    self.assertEqual(HexBoard.X, winners[n])
+                    self.assertTrue(HexBoard.spansBoard(cells, size, HexBoard.X, False))
+
+    def testRun(self):
+        hex3 = HexBoard(3)
+        hex3.playO(0,1)
+        hex3.playX(1,0)
+        hex3.playO(1,1)
+        hex3.playX(0,2)
+        # O has two ways to finish, so wins every playout
+        xWins, oWins = Playouts.run(hex3, list(range(0, 100)))
+        self.assertEqual(0, xWins)
+        self.assertEqual(100, oWins)
+
+        seeds = list(range(0, 500))
+        xWins, oWins, ownership = Playouts.run(HexBoard(5), seeds, ownership=True)
+        self.assertEqual(500, xWins + oWins)
+        self.assertEqual((5, 5), ownership.shape)
+        self.assertTrue((ownership > 0.3).all() and (ownership < 0.7).all())
+        self.assertEqual((xWins, oWins), Playouts.run(HexBoard(5), seeds))
+
+if __name__ == "__main__":
+    playoutstests_main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:48:30 2026
+
+@author: Christopher Corbell
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from hex.hexboard import HexBoard
+from hex.pnsolver import PNSolver
+
+def RunAllPNSolverTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(PNSolverTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1PNSolverTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(PNSolverTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def pnsolvertests_main():
+    unittest.main()
+
+class PNSolverTests(unittest.TestCase):
+
+    def testSolveSmallBoards(self):
+        # the first player wins on an empty board
+        for size in [1, 2, 3]:
+            winner, move = PNSolver().solve(HexBoard(size))
+            self.assertEqual(HexBoard.O_TOKEN, winner)
+            board = HexBoard(size)
+            board.playIndex(move)
+            if not board.isGameOver():
+                self.assertEqual((HexBoard.O_TOKEN, None), PNSolver().solve(board))
+
+        # O to move on a 4x4 board, where only tile 5 wins
+        board = HexBoard.fromBytes(bytes.fromhex("04020202000101000000010201020000000002"))
+        self.assertEqual((HexBoard.O_TOKEN, 5), PNSolver().solve(board))
+        board.playIndex(12)
+        winner, move = PNSolver().solve(board)
+        self.assertEqual(HexBoard.X_TOKEN, winner)
+        board.playIndex(move)
+        self.assertEqual((HexBoard.X_TOKEN, None), PNSolver().solve(board))
+
+    def testLeftRightPlayer(self):
+        # X to move; X wins with the center if O connects rows, but
+        # loses if X must connect them
+        board = HexBoard.fromBytes(bytes.fromhex("030202000002000001000002"))
+        flipped = board.copy()
+        flipped.lr_player = HexBoard.X_TOKEN
+        self.assertNotEqual(board.solverKey(), flipped.solverKey())
+
+        solver = PNSolver()
+        for first, second in [(board, flipped), (flipped, board)]:
+            self.assertEqual(PNSolver().solve(first), solver.solve(first))
+            self.assertEqual(PNSolver().solve(second), solver.solve(second))
+        self.assertEqual((HexBoard.X_TOKEN, 4), solver.solve(board))
+        self.assertEqual((HexBoard.O_TOKEN, None), solver.solve(flipped))
+
+    def testWinningMoves(self):
+        hex3 = HexBoard(3)
+        hex3.playO(0,1)
+        hex3.playX(1,0)
+        hex3.playO(1,1)
+        self.assertEqual([6, 7], PNSolver.winningMoves(hex3, HexBoard.O_TOKEN))
+        self.assertEqual([], PNSolver.winningMoves(hex3, HexBoard.X_TOKEN))
+        # so X, to move, has lost
+        self.assertEqual((HexBoard.O_TOKEN, None), PNSolver().solve(hex3))
+
+    def testCheckpoint(self):
+        board = HexBoard.fromBytes(bytes.fromhex("04020200000200000000010000000000000000"))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            solver = PNSolver(checkpointPath=path, checkpointInterval=100)
+            self.assertEqual(None, solver.solve(board, maxNodes=300))
+            self.assertTrue(os.path.exists(path))
+
+            resumed = PNSolver(checkpointPath=path)
+            self.assertTrue(len(resumed.table) > 0)
+            winner, move = resumed.solve(board)
+            self.assertEqual(winner, PNSolver().solve(board)[0])
+
+            again = PNSolver(checkpointPath=path)
+            self.assertEqual(winner, again.solve(board)[0])
+            self.assertTrue(again.nodesExpanded < resumed.nodesExpanded)
+
+            # the checkpoint's positions don't answer for the other
+            # left-right player
+            flipped = board.copy()
+            flipped.lr_player = HexBoard.X_TOKEN
+            self.assertEqual(PNSolver().solve(flipped), PNSolver(checkpointPath=path).solve(flipped))
+
+            # checkpoints from before left-right players were keyed are rejected
+            with open(path, 'w') as file:
+                json.dump({"version": 1, "size": 4, "entries": []}, file)
+            with self.assertRaises(Exception):
+                PNSolver(checkpointPath=path)
+
+if __name__ == "__main__":
+    pnsolvertests_main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:14:50 2026
+
+@author: Christopher Corbell
+"""
+
+class TranspositionTable:
+    """
+    A TranspositionTable is a fixed-size hash table of search results
+    for Hex positions, keyed by HexBoard hash keys (e.g. canonicalKey or
+    solverKey), so positions reached by different move orders (or in
+    symmetric forms) are searched once.
+
+    Each entry holds a value and a depth, the amount of search the value
+    stands for (e.g. the plies searched below the position). Each key maps
+    to a bucket (key modulo the bucket count) of two entries: a depth-
+    preferred entry, which is only replaced by an entry of at least the
+    same depth, and an always-replace entry, which takes whatever the 
+    depth-preferred entry doesn't (including an entry it displaces). So
+    the table never grows, keeps the most expensive results, and still
+    keeps the most recent ones.
+    """
+
+    DEFAULT_CAPACITY = 1 << 16
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Make a table of at most capacity entries (rounded up to even).
+        """
+        if capacity < 1:
+            raise Exception(f"capacity must be at least 1, not {capacity}")
+        self.buckets = (capacity + 1) // 2
+        self.capacity = self.buckets * 2
+        self.clear()
+
+    def __len__(self):
+        return self.entryCount
+
+    def __contains__(self, key):
+        slot = (key % self.buckets) * 2
+        return self.keys[slot] == key or self.keys[slot + 1] == key
+
+    def clear(self):
+        # entry 2n is bucket n's depth-preferred entry, 2n+1 its always-replace entry
+        self.keys = [None] * self.capacity
+        self.values = [None] * self.capacity
+        self.depths = [0] * self.capacity
+        self.entryCount = 0
+        self.hits = 0
+        self.misses = 0
+        self.replacements = 0
+
+    def lookup(self, key):
+        """
+        Look up a key.
+
+        Returns
+        -------
+        (object, int)
+            The stored value and depth, or None if the key is not stored.
+
+        """
+        slot = (key % self.buckets) * 2
+        if not self.keys[slot] == key:
+            slot += 1
+            if not self.keys[slot] == key:
+                self.misses += 1
+                return None
+        self.hits += 1
+        return self.values[slot], self.depths[slot]
+
+    def store(self, key, value, depth=0):
+        """
+        Store a value for a key, replacing any entry for the key.
+        """
+        slot = (key % self.buckets) * 2
+        keys = self.keys
+        if keys[slot + 1] == key:
+            # the key moves up if it is now deep enough
+            self.setEntry(slot + 1, None, None, 0)
+        if keys[slot] == key or depth >= self.depths[slot]:
+            if not keys[slot] == key and not None == keys[slot]:
+                self.setEntry(slot + 1, keys[slot], self.values[slot], self.depths[slot])
+            self.setEntry(slot, key, value, depth)
+        else:
+            self.setEntry(slot + 1, key, value, depth)
+
+    def setEntry(self, slot, key, value, depth):
+        storedKey = self.keys[slot]
+        if None == storedKey:
+            if not None == key:
+                self.entryCount += 1
+        elif None == key:
+            self.entryCount -= 1
+        elif not storedKey == key:
+            self.replacements += 1
+        self.keys[slot] = key
+        self.values[slot] = value
+        self.depths[slot] = depth
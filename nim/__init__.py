@@ -6,8 +6,9 @@ Created on Thu Jan  6 14:10:41 2022
 @author: Christopher Corbell
 """
 
-__all__ = ["nimstate", "nimtree"]
+__all__ = ["grundy", "nimstate", "nimtree"]
 
+from nim.grundy import GrundyEngine
 from nim.nimstate import NimState
 from nim.nimtree import NimTree
 
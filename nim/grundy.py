@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:53:41 2026
+
+@author: Christopher Corbell
+"""
+
+from functools import reduce
+from operator import xor
+
+from nim.nimstate import NimState
+
+class GrundyEngine:
+    """
+    A GrundyEngine computes Sprague-Grundy numbers for impartial
+    heap games: variants of Nim played on a list of heaps, where a move
+    changes a single heap, and the player who can't move loses.
+
+    The moves on a heap are given either as a subtraction set (a move
+    removes one of the amounts in the set from a heap) or as a move
+    function, which maps a heap size to its options: an iterable of
+    tuples of the heap sizes a move can replace it with, e.g. () to
+    remove it, (n-1,) to take one, or (a, b) to split it in two. With
+    neither, the game is plain Nim, where any amount can be removed.
+
+    By the Sprague-Grundy theorem the Grundy number of a list of heaps is
+    the XOR of the heaps' Grundy numbers, and the player to move wins if
+    and only if it is not 0. Heap Grundy numbers are memoized, so each
+    heap size is computed once per engine.
+    """
+
+    def __init__(self, subtraction_set=None, move_function=None):
+        if not None == subtraction_set and not None == move_function:
+            raise Exception("A GrundyEngine takes a subtraction set or a move function, not both")
+        if not None == subtraction_set:
+            self.subtraction_set = sorted(set(subtraction_set))
+            if len(self.subtraction_set) == 0 or self.subtraction_set[0] < 1:
+                raise Exception(f"Bad subtraction set {subtraction_set}: amounts must be positive")
+        else:
+            self.subtraction_set = None
+        self.move_function = move_function
+        self.memo = {0: 0} if None == move_function else {}
+
+    def options(self, heap):
+        """
+        Return the options of a heap: a list of tuples of the heap sizes
+        each move from it leaves in its place.
+        """
+        if not None == self.move_function:
+            return [tuple(option) for option in self.move_function(heap)]
+        if not None == self.subtraction_set:
+            return [(heap - amount,) for amount in self.subtraction_set if amount <= heap]
+        return [(size,) for size in range(0, heap)]
+
+    def grundy(self, heap):
+        """
+        Return the Grundy number of a single heap.
+        """
+        value = self.memo.get(heap)
+        if not None == value:
+            return value
+
+        # compute depth-first without recursion, so large heaps
+        # don't run into the recursion limit; each frame is
+        # [heap, options, sizes still to compute]
+        stack = [[heap, self.options(heap), None]]
+        on_path = {heap}
+        while len(stack) > 0:
+            frame = stack[-1]
+            if None == frame[2]:
+                frame[2] = [size for option in frame[1] for size in option]
+            pushed = False
+            while len(frame[2]) > 0:
+                size = frame[2].pop()
+                if size in self.memo:
+                    continue
+                if size in on_path:
+                    raise Exception(f"Heap {size} can be reached from itself; the game is not finite")
+                on_path.add(size)
+                stack.append([size, self.options(size), None])
+                pushed = True
+                break
+            if pushed:
+                continue
+            stack.pop()
+            on_path.discard(frame[0])
+            reachable = set([self.option_grundy(option) for option in frame[1]])
+            self.memo[frame[0]] = GrundyEngine.mex(reachable)
+        return self.memo[heap]
+
+    def option_grundy(self, option):
+        """
+        Return the Grundy number of an option, whose heaps are all computed.
+        """
+        return reduce(xor, [self.memo[size] for size in option], 0)
+
+    def grundy_of(self, heaps):
+        """
+        Return the Grundy number of a list of heaps (or a NimState).
+        """
+        if isinstance(heaps, NimState):
+            heaps = heaps.heaps
+        return reduce(xor, [self.grundy(heap) for heap in heaps], 0)
+
+    def is_winning(self, heaps):
+        """
+        Return True if the player to move wins from a list of heaps (or a NimState).
+        """
+        return self.grundy_of(heaps) != 0
+
+    def winning_move(self, heaps):
+        """
+        Find a winning move from a list of heaps (or a NimState).
+
+        Returns
+        -------
+        (int, tuple)
+            The (zero-based) index of the heap to move on and the heap
+            sizes to replace it with (for a subtraction set, a 1-tuple
+            of the size to reduce it to); or None if there is no
+            winning move.
+
+        """
+        if isinstance(heaps, NimState):
+            heaps = heaps.heaps
+        total = self.grundy_of(heaps)
+        if total == 0:
+            return None
+        for index in range(0, len(heaps)):
+            # a winning move leaves the heap's part of the sum
+            # equal to the rest of the sum
+            target = total ^ self.memo[heaps[index]]
+            for option in self.options(heaps[index]):
+                if self.option_grundy(option) == target:
+                    return index, option
+        return None
+
+    def mex(values):
+        """
+        Return the minimum excluded value of a set of non-negative integers.
+        """
+        value = 0
+        while value in values:
+            value += 1
+        return value
@@ -7,7 +7,12 @@ Created on Fri Jan 14 11:42:41 2022
 
 """
 
-class NimState:
+from functools import reduce
+from operator import xor
+
+from treegen.node import TreeNode
+
+class NimState(TreeNode):
     """
     A NimState is a specific game state (vertex of the game tree)
     in the game of Nim. 
@@ -22,12 +27,14 @@ class NimState:
     entry to zero.
     
     """
+    __slots__ = ("heaps", "alias")
+    
     def __init__(self, heaps:list):
         if None == heaps:
             raise Exception("heaps is a required parameter to NimState constructor")
+        TreeNode.__init__(self)
         self.heaps = heaps
         self.heaps.sort()
-        self.label = None
         self.alias = None
         
     def __repr__(self):
@@ -151,25 +158,34 @@ class NimState:
     
     def nim_sum(self):
         """
-        Calculate the nim sum of the current state.
+        Calculate the nim sum of the current state: the bitwise XOR
+        of the heap sizes.
 
         Returns
         -------
         int
 
         """
-        bstrings = self.get_binary_heap_strings()
-        sumstring = ""
-        for char_ix in range(0, len(bstrings[0])):
-            ones_in_column = 0
-            for str_ix in range(0, len(bstrings)):
-                if bstrings[str_ix][char_ix] == '1':
-                    ones_in_column += 1
-            #print(f"DEBUG: in column {char_ix} there are {ones_in_column} ones")
-            sumstring += f"{ones_in_column % 2}"
-        #print(f"DEBUG: sumstring is {sumstring}")
-        value = int(sumstring, 2)
-        #print(f"DEBUG: value is {value}")
-        return value
+        return reduce(xor, self.heaps, 0)
     
-        
\ No newline at end of file
+    def winning_move(self):
+        """
+        Find a winning move from the current state: one which leaves
+        the state balanced (with nim sum 0).
+
+        Returns
+        -------
+        (int, int)
+            The (zero-based) index of the heap to subtract from and the
+            number of items to subtract, as for move(); or None if the
+            state is balanced, so that there is no winning move.
+
+        """
+        total = self.nim_sum()
+        if total == 0:
+            return None
+        for heap in range(0, len(self.heaps)):
+            target = self.heaps[heap] ^ total
+            if target < self.heaps[heap]:
+                return heap, self.heaps[heap] - target
+        return None
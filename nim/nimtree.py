@@ -6,7 +6,10 @@ Created on Fri Jan 14 11:59:03 2022
 @author: Christopher Corbell
 """
 
+from collections import deque
+
 from nim.nimstate import NimState
+from treegen.stats import GenerationStats
 
 class NimTree:
     
@@ -14,8 +17,13 @@ class NimTree:
         self.plies = []
         self.states_by_label = {}
         self.leaf_nodes = []
+        self.dag_root = None
+        self.dag_states = {}
+        self.dag_edges = {}
+        self.path_counts = {}
+        self.label_index = {}
     
-    def generateChildStates(self, parent: NimState):
+    def generateChildStates(self, parent: NimState, verbose:bool=True, linkParent:bool=True):
         childStates = []
         
         heapIndices = []
@@ -23,23 +31,31 @@ class NimTree:
             if parent.heaps[n] > 0:
                 heapIndices.append(n)
                 
-        heapCheck = []
+        heapCheck = set()
         
-        print (f"DEBUG: heapIndices: {heapIndices}")
+        if verbose:
+            print (f"DEBUG: heapIndices: {heapIndices}")
         for heapIndex in heapIndices:
-            print(f"DEBUG parent: {parent}")
+            if verbose:
+                print(f"DEBUG parent: {parent}")
             heapSize = parent.heaps[heapIndex]
             for amount in range(1, heapSize+1):
                 child = NimState(heaps=parent.heaps.copy())
-                print(f"DEBUG: removing amount {amount} from index {heapIndex}; child: {child}")
+                if verbose:
+                    print(f"DEBUG: removing amount {amount} from index {heapIndex}; child: {child}")
                 child.move(heapIndex, amount)
-                if not child.heaps in heapCheck:
+                key = tuple(child.heaps)
+                if not key in heapCheck:
                     childStates.append(child)
-                    heapCheck.append(child.heaps.copy())
-                    print(f"DEBUG child: {child}")
+                    heapCheck.add(key)
+                    if verbose:
+                        print(f"DEBUG child: {child}")
         
         for i in range(0, len(childStates)):
-            childStates[i].label = f"{parent.label}.{i}"
+            if linkParent:
+                childStates[i].setParent(parent, i)
+            else:
+                childStates[i].setChildLabel(parent, i)
             
         return childStates
           
@@ -49,28 +65,260 @@ class NimTree:
                 return False
         return True
     
-    def generateGameTree(self, initialState: NimState):
+    def generateGameTree(self, initialState: NimState, verbose:bool=True, stats:GenerationStats=None):
+        """
+        Generate the plies of the game tree from an initial state,
+        until every state of the last ply is game-over.
+
+        Parameters
+        ----------
+        initialState : NimState
+            The root state; it is labeled '0' if it has no label.
+        verbose : bool, optional
+            If True (the default), print debug output for every move;
+            set False to generate with no per-node output.
+        stats : GenerationStats, optional
+            If given, generation counters and per-ply timing are added to it.
+
+        Returns
+        -------
+        None.
+
+        """
+        for ply in self.generatePlies(initialState, verbose, stats, keepHistory=True):
+            pass
+            
+    def generatePlies(self, initialState: NimState, verbose:bool=True, stats:GenerationStats=None, keepHistory:bool=False):
+        """
+        Generate the plies of the game tree from an initial state one at
+        a time, starting with the ply holding just the initial state.
+        Only the ply being expanded is held in memory, unless keepHistory
+        is set, in which case the plies, label index and leaf nodes of this
+        tree are filled in as by generateGameTree. Without keepHistory,
+        states are given label strings rather than parent references
+        (see TreeNode), so that earlier plies can be freed.
+
+        Yields
+        ------
+        [NimState]
+            The states of each ply, in order.
+
+        """
         if None == initialState.label:
             initialState.label = '0'
         
         currentPly = [initialState]
-        self.plies = [currentPly]
-        self.states_by_label = {initialState.label:initialState}
-        self.leaf_nodes = []
+        if keepHistory:
+            self.plies = [currentPly]
+            self.states_by_label = {initialState.label:initialState}
+            self.leaf_nodes = []
+            self.clearGameDAG()
+        yield currentPly
         
         while not self.gameOverInAllStates(currentPly):
+            if not None == stats:
+                stats.beginPly()
             parentPly = currentPly
             currentPly = []
             for parent in parentPly:
-                children = self.generateChildStates(parent)
+                if parent.is_game_over():
+                    if not None == stats:
+                        stats.winsPruned += 1
+                    continue
+                children = self.generateChildStates(parent, verbose, linkParent=keepHistory)
+                if not None == stats:
+                    stats.nodesExpanded += 1
+                    stats.childrenGenerated += len(children)
                 currentPly.extend(children)
-                for child in children:
-                    self.states_by_label[child.label] = child
-                    if child.is_game_over():
-                        self.leaf_nodes.append(child)
+                if keepHistory:
+                    for child in children:
+                        self.states_by_label[child.label] = child
+                        if child.is_game_over():
+                            self.leaf_nodes.append(child)
                         
-            self.plies.append(currentPly)
+            if keepHistory:
+                self.plies.append(currentPly)
+            if not None == stats:
+                stats.endPly(len(currentPly))
+            yield currentPly
+            
+    def generateStates(self, initialState: NimState, verbose:bool=True, stats:GenerationStats=None, depthFirst:bool=False):
+        """
+        Generate the states of the game tree from an initial state one at
+        a time, including the initial state.
+        
+        By default states come ply by ply, as from generatePlies. With
+        depthFirst=True, states come in depth-first (pre-)order instead,
+        and only the sibling lists on the path to the current state are
+        held in memory.
+
+        Yields
+        ------
+        NimState
+            Each state of the tree.
+
+        """
+        if not depthFirst:
+            for ply in self.generatePlies(initialState, verbose, stats):
+                yield from ply
+            return
+        
+        if None == initialState.label:
+            initialState.label = '0'
+            
+        stack = [iter([initialState])]
+        while len(stack) > 0:
+            parent = next(stack[-1], None)
+            if None == parent:
+                stack.pop()
+                continue
+            yield parent
+            if parent.is_game_over():
+                if not None == stats:
+                    stats.winsPruned += 1
+                continue
+            children = self.generateChildStates(parent, verbose)
+            if not None == stats:
+                stats.nodesExpanded += 1
+                stats.childrenGenerated += len(children)
+            stack.append(iter(children))
+
+    def generateGameDAG(self, initialState: NimState, stats:GenerationStats=None):
+        """
+        Generate the game as a directed acyclic graph rather than a tree:
+        states are keyed by their (sorted) heap tuple, so a state reached
+        by different move sequences is expanded and stored only once.
+        
+        The graph is kept in dag_states (heap tuple -> NimState, labeled 
+        with the first path found to it in breadth-first order), dag_edges
+        (heap tuple -> child heap tuples, in the order of
+        generateChildStates, so that label ordinals still apply) and 
+        path_counts (heap tuple -> number of distinct move sequences from
+        the initial state to it). Tree labels can be looked up with 
+        get_state_by_label and get_game_sequence as usual; they give a
+        new state for the label, with the label of the shared DAG state
+        as its alias if that is different.
+        
+        Any generated tree is cleared, so that its states don't answer
+        lookups for the DAG.
 
+        Parameters
+        ----------
+        initialState : NimState
+            The root state; it is labeled '0' if it has no label.
+        stats : GenerationStats, optional
+            If given, generation counters are added to it; states reached
+            again through another parent are counted as aliasesFound.
+
+        Returns
+        -------
+        None.
+
+        """
+        if None == initialState.label:
+            initialState.label = '0'
+            
+        self.plies = []
+        self.states_by_label = {}
+        self.leaf_nodes = []
+            
+        root = tuple(initialState.heaps)
+        self.dag_root = root
+        self.dag_states = {root:initialState}
+        self.dag_edges = {}
+        self.label_index = {initialState.label:root}
+        
+        pending = deque([root])
+        while len(pending) > 0:
+            key = pending.popleft()
+            parent = self.dag_states[key]
+            if parent.is_game_over():
+                self.dag_edges[key] = []
+                if not None == stats:
+                    stats.winsPruned += 1
+                continue
+            children = self.generateChildStates(parent, verbose=False)
+            edges = []
+            for child in children:
+                childKey = tuple(child.heaps)
+                if childKey in self.dag_states:
+                    if not None == stats:
+                        stats.aliasesFound += 1
+                else:
+                    self.dag_states[childKey] = child
+                    pending.append(childKey)
+                edges.append(childKey)
+            self.dag_edges[key] = edges
+            if not None == stats:
+                stats.nodesExpanded += 1
+                stats.childrenGenerated += len(children)
+                
+        # every move reduces the heap total, so decreasing totals
+        # are a topological order
+        self.path_counts = {key:0 for key in self.dag_states}
+        self.path_counts[root] = 1
+        for key in sorted(self.dag_edges, key=sum, reverse=True):
+            count = self.path_counts[key]
+            for childKey in self.dag_edges[key]:
+                self.path_counts[childKey] += count
+                
+    def clearGameDAG(self):
+        self.dag_root = None
+        self.dag_states = {}
+        self.dag_edges = {}
+        self.path_counts = {}
+        self.label_index = {}
+                
+    def get_path_count(self, heaps):
+        """
+        Get the number of distinct move sequences from the initial state of
+        the generated DAG to a state (given as a NimState or heap list), 
+        which is the number of times it would appear in the full tree.
+        """
+        if isinstance(heaps, NimState):
+            heaps = heaps.heaps
+        return self.path_counts.get(tuple(sorted(heaps)), 0)
+    
+    def resolve_label(self, label):
+        """
+        Resolve a tree label to the heap tuple of its state in the DAG by 
+        following its child ordinals along dag_edges, starting from the 
+        longest prefix already in the path index (label_index). 
+        Returns None if the label is not a path in the DAG.
+        """
+        key = self.label_index.get(label)
+        if not None == key or None == self.dag_root:
+            return key
+        
+        rootLabel = self.dag_states[self.dag_root].label
+        if not label.startswith(rootLabel + '.'):
+            return None
+        ordinals = label[len(rootLabel) + 1:].split('.')
+        
+        depth = len(ordinals) - 1
+        prefix = label
+        while depth > 0:
+            prefix = prefix[:prefix.rindex('.')]
+            key = self.label_index.get(prefix)
+            if not None == key:
+                break
+            depth -= 1
+        if depth == 0:
+            prefix = rootLabel
+            key = self.dag_root
+            
+        for ordinal in ordinals[depth:]:
+            if not ordinal.isdigit():
+                return None
+            edges = self.dag_edges.get(key, [])
+            index = int(ordinal)
+            if index >= len(edges):
+                return None
+            key = edges[index]
+            prefix = f"{prefix}.{ordinal}"
+            self.label_index[prefix] = key
+        return key
+            
     def print_ply(self, plyIndex):
         if plyIndex < 0 or plyIndex >= len(self.plies):
             raise Exception(f"Bad ply index: {plyIndex}")
@@ -99,7 +347,18 @@ class NimTree:
     def get_state_by_label(self, label):
         if label in self.states_by_label:
             return self.states_by_label[label]
-        return None
+        key = self.resolve_label(label)
+        if None == key:
+            return None
+        
+        # a DAG state is shared by all of the labels (paths) which reach
+        # it, so give a state of its own for this label
+        shared = self.dag_states[key]
+        state = NimState(shared.heaps.copy())
+        state.label = label
+        if not label == shared.label:
+            state.alias = shared.label
+        return state
     
     def get_game_sequence(self, leaf_label):
         sequence = []
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:58:06 2026
+
+@author: Christopher Corbell
+"""
+
+import unittest
+
+from nim.grundy import GrundyEngine
+from nim.nimstate import NimState
+
+def RunAllNimTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(NimTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1NimTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(NimTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def nimtests_main():
+    unittest.main()
+
+class NimTests(unittest.TestCase):
+
+    def testNimSumAndWinningMove(self):
+        state = NimState([3, 4, 5])
+        self.assertEqual(2, state.nim_sum())
+        self.assertFalse(state.is_balanced())
+
+        heap, count = state.winning_move()
+        state.move(heap, count)
+        self.assertTrue(state.is_balanced())
+        self.assertEqual(None, state.winning_move())
+        self.assertEqual(0, NimState([0, 0]).nim_sum())
+
+    def testNormalNim(self):
+        engine = GrundyEngine()
+        for heap in range(0, 20):
+            self.assertEqual(heap, engine.grundy(heap))
+        state = NimState([1, 2, 6])
+        self.assertEqual(state.nim_sum(), engine.grundy_of(state))
+        index, option = engine.winning_move(state)
+        self.assertEqual(0, engine.grundy_of(state.heaps[:index] + list(option) + state.heaps[index + 1:]))
+
+    def testSubtractionGame(self):
+        engine = GrundyEngine(subtraction_set=[1, 2, 3])
+        for heap in range(0, 3000):
+            self.assertEqual(heap % 4, engine.grundy(heap))
+        self.assertEqual(None, engine.winning_move([4, 8]))
+        self.assertEqual((0, (5,)), engine.winning_move([8, 9]))
+
+        with self.assertRaises(Exception):
+            GrundyEngine(subtraction_set=[0, 1])
+
+    def testSplittingGame(self):
+        # Lasker's Nim: remove any amount from a heap, or split it in two
+        def lasker_moves(heap):
+            for size in range(0, heap):
+                yield (size,) if size > 0 else ()
+            for size in range(1, heap // 2 + 1):
+                yield (size, heap - size)
+
+        engine = GrundyEngine(move_function=lasker_moves)
+        expected = [0, 1, 2, 4, 3, 5, 6, 8, 7, 9, 10, 12]
+        self.assertEqual(expected, [engine.grundy(heap) for heap in range(0, 12)])
+        self.assertFalse(engine.is_winning([1, 2, 4]))
+        self.assertTrue(engine.is_winning([3, 4]))
+
+        with self.assertRaises(Exception):
+            GrundyEngine(move_function=lambda heap: [(heap,)]).grundy(2)
+
+if __name__ == "__main__":
+    nimtests_main()
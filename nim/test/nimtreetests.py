@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 00:21:47 2026
+
+@author: Christopher Corbell
+"""
+
+import unittest
+
+from nim.nimstate import NimState
+from nim.nimtree import NimTree
+from treegen.stats import GenerationStats
+
+def RunAllNimTreeTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(NimTreeTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1NimTreeTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(NimTreeTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def nimtreetests_main():
+    unittest.main()
+
+class NimTreeTests(unittest.TestCase):
+
+    def testChildStates(self):
+        tree = NimTree()
+        parent = NimState([2, 2])
+        parent.label = '0'
+        children = tree.generateChildStates(parent, verbose=False)
+        self.assertEqual([[1, 2], [0, 2]], [child.heaps for child in children])
+        self.assertEqual(['0.0', '0.1'], [child.label for child in children])
+
+        # labels are made from the parent on demand
+        self.assertFalse(hasattr(children[0], '__dict__'))
+        grandchildren = tree.generateChildStates(children[1], verbose=False)
+        self.assertEqual('0.1.1', grandchildren[1].label)
+        parent.label = '5'
+        self.assertEqual('5.1.1', grandchildren[1].label)
+        grandchildren[1].label = 'x'
+        self.assertEqual('x', grandchildren[1].label)
+        self.assertEqual(None, grandchildren[1].parent)
+
+    def testStreamedPlies(self):
+        tree = NimTree()
+        tree.generateGameTree(NimState([1, 2, 3]), verbose=False)
+        expected = [[(state.label, state.heaps) for state in ply] for ply in tree.plies]
+
+        streamed = NimTree()
+        plies = streamed.generatePlies(NimState([1, 2, 3]), verbose=False)
+        self.assertEqual(expected, [[(state.label, state.heaps) for state in ply] for ply in plies])
+        self.assertEqual([], streamed.plies)
+        self.assertEqual({}, streamed.states_by_label)
+        for ply in streamed.generatePlies(NimState([1, 2, 3]), verbose=False):
+            self.assertTrue(all([None == state.parent for state in ply]))
+
+        states = streamed.generateStates(NimState([1, 2, 3]), verbose=False)
+        self.assertEqual([state for ply in expected for state in ply],
+                         [(state.label, state.heaps) for state in states])
+
+    def testGameDAG(self):
+        tree = NimTree()
+        tree.generateGameTree(NimState([1, 2, 3]), verbose=False)
+
+        dag = NimTree()
+        stats = GenerationStats()
+        dag.generateGameDAG(NimState([1, 2, 3]), stats=stats)
+        self.assertEqual(14, len(dag.dag_states))
+        self.assertEqual(13, stats.nodesExpanded)
+        self.assertTrue(stats.aliasesFound > 0)
+
+        # each tree state is a path through the DAG
+        self.assertEqual(len(tree.leaf_nodes), dag.get_path_count([0, 0, 0]))
+        aliases = 0
+        for label, state in tree.states_by_label.items():
+            dagState = dag.get_state_by_label(label)
+            self.assertEqual(state.heaps, dagState.heaps)
+            self.assertEqual(label, dagState.label)
+            self.assertEqual(state.get_ply(), dagState.get_ply())
+            self.assertEqual(state.isPlayer1Outcome(), dagState.isPlayer1Outcome())
+            self.assertEqual(state.isPlayer2Outcome(), dagState.isPlayer2Outcome())
+            if not None == dagState.alias:
+                aliases += 1
+                self.assertEqual(state.heaps, dag.get_state_by_label(dagState.alias).heaps)
+        self.assertEqual(len(tree.states_by_label) - len(dag.dag_states), aliases)
+        for leaf in tree.get_leaf_labels():
+            self.assertEqual([(state.label, state.heaps) for state in tree.get_game_sequence(leaf)],
+                             [(state.label, state.heaps) for state in dag.get_game_sequence(leaf)])
+
+        self.assertEqual(None, dag.get_state_by_label('0.9'))
+        self.assertEqual(None, dag.get_state_by_label('1.0'))
+
+        # a DAG replaces a tree generated before it, and vice versa
+        tree.generateGameDAG(NimState([2, 2]))
+        self.assertEqual([], tree.plies)
+        self.assertEqual([0, 2], tree.get_state_by_label('0.1').heaps)
+        self.assertEqual(None, tree.get_state_by_label('0.1.0.0.0'))
+        tree.generateGameTree(NimState([1, 2]), verbose=False)
+        self.assertEqual(None, tree.dag_root)
+        self.assertEqual(None, tree.get_state_by_label('0.3'))
+
+    def testLargeGameDAG(self):
+        dag = NimTree()
+        dag.generateGameDAG(NimState([3, 4, 5]))
+        self.assertEqual(48, len(dag.dag_states))
+        self.assertEqual(88412, dag.get_path_count([0, 0, 0]))
+        self.assertEqual([1, 4, 5], dag.get_state_by_label('0.0.0').heaps)
+
+if __name__ == "__main__":
+    nimtreetests_main()
@@ -6,9 +6,12 @@ Created on Tue Jan 18 23:01:38 2022
 @author: Christopher Corbell
 """
 
-__all__ = ["cointoss", "deck", "dice", "randomwalk"]
+__all__ = ["cointoss", "deck", "dice", "pfunc", "randomwalk"]
 
 from prob.cointoss import CoinToss
 from prob.deck import Deck
 from prob.dice import Dice
+from prob.pfunc import (PFunc, LinearRangePFunc, CompiledPFunc, PiecewiseLinearPFunc,
+                        LogisticPFunc, ExponentialDecayPFunc, TabulatedPFunc,
+                        CompositePFunc, ClampPFunc)
 from prob.randomwalk import RandomWalk
\ No newline at end of file
@@ -6,6 +6,14 @@ Created on Wed Jan 26 23:06:16 2022
 @author: mathaes
 """
 
+import bisect
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class PFunc:
     """
     A PFunc is a representation of a probability function.
@@ -13,6 +21,18 @@ class PFunc:
     A PFunc may be discrete or continuous but is expected to
     be able to produce a value in the interval [0,1] for any input,
     though subclasses may throw exceptions for unsupported inputs.
+
+    evaluateMany evaluates a sequence of inputs at once, returning a NumPy
+    array if NumPy is installed (otherwise a list); subclasses can
+    override it with vectorized arithmetic, and the PFuncs in this module
+    also accept a NumPy array in evaluate. compile tabulates the function
+    over the integers 0..maxInput (see CompiledPFunc); compiled tables
+    are kept with the function's key, so a function is only tabulated
+    once per maxInput until its parameters change. A CompiledPFunc
+    itself is a snapshot and does not follow later changes.
+    
+    PFuncs can be combined with minimum, maximum, product and clamp
+    (see CompositePFunc and ClampPFunc).
     """
     
     def __init__(self):
@@ -20,16 +40,80 @@ class PFunc:
     
     def evaluate(self, inputValue):
         return 0.0
+
+    def evaluateMany(self, inputValues):
+        values = [self.evaluate(inputValue) for inputValue in inputValues]
+        if None == np:
+            return values
+        return np.array(values, dtype=float)
+
+    def compile(self, maxInput:int):
+        """
+        Return a CompiledPFunc, which looks up this function's values
+        for integer inputs 0..maxInput in a table. Tables are reused
+        while this function's key (see key) is unchanged.
+        """
+        if maxInput < 0:
+            raise Exception(f"Can't compile a PFunc for maximum input {maxInput}")
+        key = self.key()
+        cache = self.__dict__.get('_compiled')
+        if None == cache or not cache[0] == key:
+            # new, or changed since its tables were made
+            cache = (key, {})
+            self._compiled = cache
+        compiled = cache[1]
+        if not maxInput in compiled:
+            covering = [table for table in compiled.values() if table.maxInput >= maxInput]
+            if len(covering) > 0:
+                return covering[0]
+            compiled[maxInput] = CompiledPFunc(self, maxInput)
+        return compiled[maxInput]
+    
+    def key(self):
+        """
+        Return a hashable key of this function's type and parameters,
+        e.g. to cache results by configuration.
+        """
+        fields = [(name, PFunc.keyOf(value)) for name, value in sorted(vars(self).items())
+                  if not name.startswith('_')]
+        return (type(self).__name__, tuple(fields))
+    
+    def keyOf(value):
+        if isinstance(value, PFunc):
+            return value.key()
+        if isinstance(value, (list, tuple)) or PFunc.isArray(value):
+            return tuple([PFunc.keyOf(item) for item in value])
+        if not None == np and isinstance(value, np.generic):
+            return value.item()
+        return value
+    
+    def isArray(value):
+        return not None == np and isinstance(value, np.ndarray)
     
-class LinearRangePFunc:
+    def minimum(self, *others):
+        return CompositePFunc(CompositePFunc.MIN, [self] + list(others))
+    
+    def maximum(self, *others):
+        return CompositePFunc(CompositePFunc.MAX, [self] + list(others))
+    
+    def product(self, *others):
+        return CompositePFunc(CompositePFunc.PRODUCT, [self] + list(others))
+    
+    def clamp(self, low=0.0, high=1.0):
+        return ClampPFunc(self, low, high)
+
+class LinearRangePFunc(PFunc):
     
     def __init__(self, minVal, maxVal, minProb=100.0, maxProb=0.0):
+        PFunc.__init__(self)
         self.minVal = minVal
         self.maxVal = maxVal
         self.minProb = minProb
         self.maxProb = maxProb
         
     def evaluate(self, inputValue):
+        if PFunc.isArray(inputValue):
+            return self.evaluateMany(inputValue)
         if inputValue <= self.minVal:
             return self.minProb
         elif inputValue >= self.maxVal:
@@ -39,5 +123,244 @@ class LinearRangePFunc:
             valueRange = self.maxVal - self.minVal
             probRange = self.maxProb - self.minProb
             return (offset / valueRange) * probRange + self.minProb
+
+    def evaluateMany(self, inputValues):
+        if None == np:
+            return PFunc.evaluateMany(self, inputValues)
+        inputs = np.asarray(inputValues, dtype=float)
+        # float, so that integer probabilities don't make an integer array
+        values = np.where(inputs <= self.minVal, self.minProb, self.maxProb).astype(float)
+        between = (inputs > self.minVal) & (inputs < self.maxVal)
+        if between.any():
+            offsets = inputs[between] - self.minVal
+            values[between] = (offsets / (self.maxVal - self.minVal)) * (self.maxProb - self.minProb) + self.minProb
+        return values
+
+class CompiledPFunc(PFunc):
+    """
+    A CompiledPFunc is a PFunc tabulated over the integers 0..maxInput,
+    so evaluating it for those inputs is a list lookup (or, with
+    evaluateMany, a NumPy array lookup). Other inputs are passed to the
+    source function.
+    """
+
+    def __init__(self, source:PFunc, maxInput:int):
+        PFunc.__init__(self)
+        if maxInput < 0:
+            raise Exception(f"Can't compile a PFunc for maximum input {maxInput}")
+        self.source = source
+        self.maxInput = maxInput
+        self.table = [source.evaluate(inputValue) for inputValue in range(0, maxInput + 1)]
+        if None == np:
+            self.array = None
+        else:
+            self.array = np.array(self.table, dtype=float)
+
+    def evaluate(self, inputValue):
+        if type(inputValue) is int and 0 <= inputValue <= self.maxInput:
+            return self.table[inputValue]
+        return self.source.evaluate(inputValue)
+
+    def evaluateMany(self, inputValues):
+        if None == np:
+            return [self.evaluate(inputValue) for inputValue in inputValues]
+        inputs = np.asarray(inputValues)
+        if not np.issubdtype(inputs.dtype, np.integer):
+            return self.source.evaluateMany(inputs)
+        inRange = (inputs >= 0) & (inputs <= self.maxInput)
+        if inRange.all():
+            return self.array[inputs]
+        values = np.empty(inputs.shape, dtype=float)
+        values[inRange] = self.array[inputs[inRange]]
+        values[~inRange] = self.source.evaluateMany(inputs[~inRange])
+        return values
+
+    def compile(self, maxInput:int):
+        if maxInput <= self.maxInput:
+            return self
+        return self.source.compile(maxInput)
+
+class PiecewiseLinearPFunc(PFunc):
+    """
+    A PiecewiseLinearPFunc interpolates linearly between sample points
+    (input, probability), e.g. measured values; it is constant below the
+    first input and above the last.
+    """
+    
+    def __init__(self, inputs, probabilities):
+        PFunc.__init__(self)
+        if len(inputs) == 0 or not len(inputs) == len(probabilities):
+            raise Exception("PiecewiseLinearPFunc needs the same (non-zero) number of inputs and probabilities")
+        samples = sorted(zip(inputs, probabilities))
+        self.inputs = [sample[0] for sample in samples]
+        self.probabilities = [sample[1] for sample in samples]
+        
+    def evaluate(self, inputValue):
+        if PFunc.isArray(inputValue):
+            return np.interp(inputValue, self.inputs, self.probabilities)
+        index = bisect.bisect_right(self.inputs, inputValue)
+        if index == 0:
+            return self.probabilities[0]
+        if index == len(self.inputs):
+            return self.probabilities[-1]
+        x0 = self.inputs[index - 1]
+        x1 = self.inputs[index]
+        p0 = self.probabilities[index - 1]
+        p1 = self.probabilities[index]
+        return p0 + (inputValue - x0) / (x1 - x0) * (p1 - p0)
+    
+    def evaluateMany(self, inputValues):
+        if None == np:
+            return PFunc.evaluateMany(self, inputValues)
+        return np.interp(np.asarray(inputValues, dtype=float), self.inputs, self.probabilities)
+
+class LogisticPFunc(PFunc):
+    """
+    A LogisticPFunc is a logistic (S-shaped) curve from startProb (for
+    low inputs) to endProb (for high inputs), crossing halfway at the
+    midpoint; steepness is the logistic rate, so it changes by about
+    a quarter of the range per unit at the midpoint when it is 1.
+    """
+    
+    def __init__(self, midpoint, steepness=1.0, startProb=1.0, endProb=0.0):
+        PFunc.__init__(self)
+        self.midpoint = midpoint
+        self.steepness = steepness
+        self.startProb = startProb
+        self.endProb = endProb
         
-    
\ No newline at end of file
+    def evaluate(self, inputValue):
+        # 1 / (1 + exp(z)) as a tanh, which doesn't overflow
+        if PFunc.isArray(inputValue):
+            z = self.steepness * (np.asarray(inputValue, dtype=float) - self.midpoint)
+            weight = 0.5 * (1.0 - np.tanh(0.5 * z))
+        else:
+            z = self.steepness * (inputValue - self.midpoint)
+            weight = 0.5 * (1.0 - math.tanh(0.5 * z))
+        return self.endProb + (self.startProb - self.endProb) * weight
+    
+    def evaluateMany(self, inputValues):
+        if None == np:
+            return PFunc.evaluateMany(self, inputValues)
+        return self.evaluate(np.asarray(inputValues, dtype=float))
+
+class ExponentialDecayPFunc(PFunc):
+    """
+    An ExponentialDecayPFunc is startProb up to the start input, then
+    decays exponentially toward endProb at a rate per unit of input.
+    """
+    
+    def __init__(self, rate, startProb=1.0, endProb=0.0, start=0):
+        PFunc.__init__(self)
+        self.rate = rate
+        self.startProb = startProb
+        self.endProb = endProb
+        self.start = start
+        
+    def evaluate(self, inputValue):
+        if PFunc.isArray(inputValue):
+            offsets = np.maximum(np.asarray(inputValue, dtype=float) - self.start, 0.0)
+            decay = np.exp(-self.rate * offsets)
+        else:
+            decay = math.exp(-self.rate * max(inputValue - self.start, 0))
+        return self.endProb + (self.startProb - self.endProb) * decay
+    
+    def evaluateMany(self, inputValues):
+        if None == np:
+            return PFunc.evaluateMany(self, inputValues)
+        return self.evaluate(np.asarray(inputValues, dtype=float))
+
+class TabulatedPFunc(PFunc):
+    """
+    A TabulatedPFunc takes its probabilities from a table, for the inputs
+    firstInput, firstInput + 1, ...; an input between two entries takes
+    the lower one, and inputs beyond the table take its first or last
+    entry.
+    """
+    
+    def __init__(self, probabilities, firstInput=0):
+        PFunc.__init__(self)
+        if len(probabilities) == 0:
+            raise Exception("TabulatedPFunc needs at least one probability")
+        self.probabilities = list(probabilities)
+        self.firstInput = firstInput
+        
+    def evaluate(self, inputValue):
+        if PFunc.isArray(inputValue):
+            return self.evaluateMany(inputValue)
+        index = math.floor(inputValue - self.firstInput)
+        index = min(max(index, 0), len(self.probabilities) - 1)
+        return self.probabilities[index]
+    
+    def evaluateMany(self, inputValues):
+        if None == np:
+            return PFunc.evaluateMany(self, inputValues)
+        indexes = np.floor(np.asarray(inputValues, dtype=float) - self.firstInput)
+        indexes = np.clip(indexes, 0, len(self.probabilities) - 1).astype(np.int64)
+        return np.asarray(self.probabilities, dtype=float)[indexes]
+
+class CompositePFunc(PFunc):
+    """
+    A CompositePFunc combines PFuncs by taking the minimum, the maximum or
+    the product of their values; see PFunc.minimum, maximum and product.
+    """
+    
+    MIN = 1
+    MAX = 2
+    PRODUCT = 3
+    
+    def __init__(self, operation:int, funcs):
+        PFunc.__init__(self)
+        if not operation in [CompositePFunc.MIN, CompositePFunc.MAX, CompositePFunc.PRODUCT]:
+            raise Exception(f"Unknown PFunc composition {operation}")
+        if len(funcs) == 0:
+            raise Exception("CompositePFunc needs at least one PFunc")
+        self.operation = operation
+        self.funcs = list(funcs)
+        
+    def evaluate(self, inputValue):
+        if PFunc.isArray(inputValue):
+            return self.evaluateMany(inputValue)
+        return self.combine([func.evaluate(inputValue) for func in self.funcs], min, max)
+    
+    def evaluateMany(self, inputValues):
+        if None == np:
+            return PFunc.evaluateMany(self, inputValues)
+        inputs = np.asarray(inputValues)
+        values = [np.asarray(func.evaluateMany(inputs), dtype=float) for func in self.funcs]
+        return self.combine(values, np.minimum, np.maximum)
+    
+    def combine(self, values, minimum, maximum):
+        result = values[0]
+        for value in values[1:]:
+            if self.operation == CompositePFunc.MIN:
+                result = minimum(result, value)
+            elif self.operation == CompositePFunc.MAX:
+                result = maximum(result, value)
+            else:
+                result = result * value
+        return result
+
+class ClampPFunc(PFunc):
+    """
+    A ClampPFunc limits another PFunc's values to the interval [low, high];
+    see PFunc.clamp.
+    """
+    
+    def __init__(self, func:PFunc, low=0.0, high=1.0):
+        PFunc.__init__(self)
+        if low > high:
+            raise Exception(f"Can't clamp to an empty interval [{low}, {high}]")
+        self.func = func
+        self.low = low
+        self.high = high
+        
+    def evaluate(self, inputValue):
+        if PFunc.isArray(inputValue):
+            return self.evaluateMany(inputValue)
+        return min(max(self.func.evaluate(inputValue), self.low), self.high)
+    
+    def evaluateMany(self, inputValues):
+        if None == np:
+            return [min(max(value, self.low), self.high) for value in self.func.evaluateMany(inputValues)]
+        return np.clip(np.asarray(self.func.evaluateMany(inputValues), dtype=float), self.low, self.high)
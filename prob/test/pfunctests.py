@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 02:24:09 2026
+
+@author: Christopher Corbell
+"""
+
+import math
+import unittest
+
+from prob.pfunc import (PFunc, LinearRangePFunc, CompiledPFunc, PiecewiseLinearPFunc,
+                        LogisticPFunc, ExponentialDecayPFunc, TabulatedPFunc,
+                        CompositePFunc, ClampPFunc, np)
+
+def RunAllPFuncTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(PFuncTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1PFuncTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(PFuncTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def pfunctests_main():
+    unittest.main()
+
+class PFuncTests(unittest.TestCase):
+
+    def testCompile(self):
+        linear = LinearRangePFunc(1, 20, 0.65, 0.2)
+        self.assertTrue(isinstance(linear, PFunc))
+        compiled = linear.compile(20)
+        self.assertTrue(isinstance(compiled, CompiledPFunc))
+        self.assertEqual(21, len(compiled.table))
+        for distance in range(0, 25):
+            self.assertEqual(linear.evaluate(distance), compiled.evaluate(distance))
+        self.assertEqual(linear.evaluate(7.5), compiled.evaluate(7.5))
+        self.assertTrue(compiled.compile(10) is compiled)
+        self.assertEqual(31, len(compiled.compile(30).table))
+
+        # compiled tables are kept per function
+        self.assertTrue(linear.compile(20) is compiled)
+        self.assertTrue(linear.compile(12) is compiled)
+        self.assertEqual(linear.key(), LinearRangePFunc(1, 20, 0.65, 0.2).key())
+
+        with self.assertRaises(Exception):
+            linear.compile(-1)
+
+        # changing the function makes new tables; old ones are snapshots
+        linear.maxProb = 0.3
+        recompiled = linear.compile(20)
+        self.assertFalse(recompiled is compiled)
+        self.assertEqual(0.3, recompiled.evaluate(20))
+        self.assertEqual(0.2, compiled.evaluate(20))
+        self.assertTrue(linear.compile(10) is recompiled)
+
+    @unittest.skipIf(None == np, "numpy is not installed")
+    def testEvaluateMany(self):
+        linear = LinearRangePFunc(1, 20, 0.65, 0.2)
+        compiled = linear.compile(20)
+        inputs = np.arange(-2, 25)
+        expected = [linear.evaluate(int(value)) for value in inputs]
+        self.assertTrue(np.allclose(expected, linear.evaluateMany(inputs)))
+        self.assertTrue(np.allclose(expected, compiled.evaluateMany(inputs)))
+        self.assertTrue(np.allclose(expected, PFunc.evaluateMany(linear, inputs)))
+        self.assertEqual(linear.evaluate(3.25), compiled.evaluateMany(np.array([3.25]))[0])
+
+        # integer probabilities still give fractional values between them
+        integral = LinearRangePFunc(0, 10, 1, 0)
+        self.assertTrue(np.allclose([0.5, 0.8, 1.0, 0.0], integral.evaluateMany([5, 2, -1, 12])))
+        self.assertTrue(np.allclose([0.5], integral.evaluate(np.array([5]))))
+        self.assertTrue(np.allclose([0.5, 0.8], integral.compile(10).evaluateMany(np.array([5, 2]))))
+
+    def testCurves(self):
+        piecewise = PiecewiseLinearPFunc([20, 0, 10], [0.1, 0.9, 0.5])
+        self.assertEqual(0.9, piecewise.evaluate(-5))
+        self.assertAlmostEqual(0.7, piecewise.evaluate(5))
+        self.assertAlmostEqual(0.3, piecewise.evaluate(15))
+        self.assertEqual(0.1, piecewise.evaluate(30))
+
+        logistic = LogisticPFunc(10, 0.5, 0.95, 0.05)
+        self.assertAlmostEqual(0.5, logistic.evaluate(10))
+        self.assertTrue(logistic.evaluate(0) > 0.9)
+        self.assertAlmostEqual(0.05, logistic.evaluate(1e9))
+
+        decay = ExponentialDecayPFunc(0.1, 0.9, 0.1, start=2)
+        self.assertEqual(0.9, decay.evaluate(1))
+        self.assertAlmostEqual(0.1 + 0.8 * math.exp(-1.0), decay.evaluate(12))
+
+        table = TabulatedPFunc([0.9, 0.8, 0.5], firstInput=1)
+        self.assertEqual([0.9, 0.9, 0.8, 0.8, 0.5, 0.5],
+                         [table.evaluate(value) for value in [0, 1, 2, 2.5, 3, 7]])
+
+        with self.assertRaises(Exception):
+            PiecewiseLinearPFunc([1, 2], [0.5])
+
+    def testComposition(self):
+        near = LinearRangePFunc(0, 10, 1.0, 0.0)
+        far = LinearRangePFunc(0, 10, 0.2, 0.6)
+        self.assertAlmostEqual(0.2, near.minimum(far).evaluate(0))
+        self.assertAlmostEqual(0.0, near.minimum(far).evaluate(10))
+        self.assertAlmostEqual(0.6, near.maximum(far).evaluate(10))
+        self.assertAlmostEqual(1.0, near.maximum(far).evaluate(0))
+        self.assertAlmostEqual(0.5 * 0.4, near.product(far).evaluate(5))
+        self.assertAlmostEqual(0.3, near.clamp(0.3, 0.8).evaluate(9))
+        self.assertTrue(isinstance(near.clamp(), ClampPFunc))
+        self.assertTrue(isinstance(near.product(far), CompositePFunc))
+        self.assertEqual(near.product(far).key(), near.product(far).key())
+
+        with self.assertRaises(Exception):
+            near.clamp(0.8, 0.3)
+
+    @unittest.skipIf(None == np, "numpy is not installed")
+    def testArrays(self):
+        inputs = np.array([-3, 0, 1, 1.5, 2, 5, 9.7, 10, 12, 20, 25])
+        curves = [PiecewiseLinearPFunc([20, 1, 10], [0.1, 0.9, 0.5]),
+                  LogisticPFunc(10, 0.5, 0.95, 0.05),
+                  ExponentialDecayPFunc(0.1, 0.9, 0.1, start=2),
+                  TabulatedPFunc([0.9, 0.8, 0.5, 0.2], firstInput=1)]
+        curves.append(curves[0].minimum(curves[1]).product(curves[2]).clamp(0.1, 0.4))
+        for curve in curves:
+            expected = [curve.evaluate(float(value)) for value in inputs]
+            self.assertTrue(np.allclose(expected, curve.evaluate(inputs)))
+            self.assertTrue(np.allclose(expected, curve.evaluateMany(list(inputs))))
+            compiled = curve.compile(20)
+            self.assertTrue(np.allclose(curve.evaluate(np.arange(0, 21)), compiled.array))
+
+if __name__ == "__main__":
+    pfunctests_main()
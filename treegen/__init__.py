@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:40:31 2026
+
+@author: Christopher Corbell
+"""
+
+__all__ = ["node", "parallel", "stats"]
+
+from treegen.node import TreeNode
+from treegen.parallel import ParallelExpander
+from treegen.stats import GenerationStats
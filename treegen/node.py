@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 00:34:12 2026
+
+@author: Christopher Corbell
+"""
+
+class TreeNode:
+    """
+    TreeNode is the base class of the game states stored in the game
+    trees (tttoe.Board, hex.HexBoard and nim.NimState). It gives them
+    slot-based storage and lazily made labels.
+
+    Labels are dot-separated paths from the root, such as '0.4.2'.
+    Rather than storing a label string for every node, a generated child
+    keeps a reference to its parent and its ordinal among the parent's
+    children (see setParent), and its label is put together from those
+    when it is asked for. A label can still be set directly, as for a
+    root, which also drops the parent reference.
+
+    A parent reference keeps the parent (and so all of its ancestors)
+    alive, which is only wanted when the whole tree is kept anyway.
+    Generators which hold one ply at a time label children with
+    setChildLabel instead, which stores the label string and no parent.
+
+    Subclasses declare their own fields in __slots__, so that nodes carry
+    no per-instance dict.
+    """
+
+    __slots__ = ("_label", "parent", "ordinal")
+
+    def __init__(self):
+        self._label = None
+        self.parent = None
+        self.ordinal = None
+
+    @property
+    def label(self):
+        if not None == self._label or None == self.parent:
+            return self._label
+
+        # walk up to the nearest node with a label of its own
+        ordinals = []
+        node = self
+        while None == node._label and not None == node.parent:
+            ordinals.append(str(node.ordinal))
+            node = node.parent
+        if None == node._label:
+            return None
+        ordinals.append(node._label)
+        ordinals.reverse()
+        return '.'.join(ordinals)
+
+    @label.setter
+    def label(self, label):
+        self._label = label
+        self.parent = None
+        self.ordinal = None
+
+    def setParent(self, parent, ordinal):
+        """
+        Label this node lazily as child (ordinal) of a parent node.
+        """
+        self._label = None
+        self.parent = parent
+        self.ordinal = ordinal
+
+    def setChildLabel(self, parent, ordinal):
+        """
+        Label this node eagerly as child (ordinal) of a parent node,
+        without keeping a reference to the parent.
+        """
+        self._label = f"{parent.label}.{ordinal}"
+        self.parent = None
+        self.ordinal = None
+
+    def copyLabel(self, other):
+        """
+        Give this node the same (possibly lazy) label as another node.
+        """
+        self._label = other._label
+        self.parent = other.parent
+        self.ordinal = other.ordinal
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:02:44 2026
+
+@author: Christopher Corbell
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+class ParallelExpander:
+    """
+    A ParallelExpander maps a function over a list of items in a pool of
+    worker processes, in chunks, returning the results in item order so
+    that callers can merge them deterministically.
+    
+    The function is given a list of items (a chunk) and must return a list
+    with one result per item. It must be picklable, i.e. a module-level
+    function or a plain function in a module-level class, and items and
+    results should be compact (codes or byte strings rather than objects),
+    since they are sent between processes.
+    
+    Use as a context manager, or call shutdown() when done:
+        
+        with ParallelExpander(4) as expander:
+            results = expander.map(function, items)
+    """
+    
+    def __init__(self, workers:int, chunkSize:int=None):
+        if workers < 1:
+            raise Exception(f"workers must be at least 1, not {workers}")
+        self.workers = workers
+        self.chunkSize = chunkSize
+        self.executor = None
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, excType, excValue, traceback):
+        self.shutdown()
+        
+    def shutdown(self):
+        if not None == self.executor:
+            self.executor.shutdown()
+            self.executor = None
+            
+    def map(self, function, items):
+        """
+        Apply function to items in chunks across the worker processes.
+
+        Parameters
+        ----------
+        function : function
+            A function taking a list of items and returning a list of
+            one result per item.
+        items : list
+            The items to process.
+
+        Returns
+        -------
+        list
+            The results, in the same order as items.
+
+        """
+        if len(items) == 0:
+            return []
+        
+        chunkSize = self.chunkSize
+        if None == chunkSize:
+            # a few chunks per worker evens out uneven chunk costs
+            chunkSize = max(1, -(-len(items) // (self.workers * 4)))
+        chunks = [items[n:n+chunkSize] for n in range(0, len(items), chunkSize)]
+        
+        if self.workers == 1 or len(chunks) == 1:
+            chunkResults = map(function, chunks)
+        else:
+            if None == self.executor:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            chunkResults = self.executor.map(function, chunks)
+            
+        results = []
+        for chunkResult in chunkResults:
+            results.extend(chunkResult)
+        return results
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:41:02 2026
+
+@author: Christopher Corbell
+"""
+
+import time
+
+class GenerationStats:
+    """
+    GenerationStats collects counters from a game tree generation run
+    (tttoe.GameTree, hex.HexTree or nim.NimTree), as an alternative to
+    printing progress for every node.
+    
+    Counters are accumulated over the whole run; per-ply sizes and wall
+    times are kept in lists indexed by ply (0 for the first generated ply).
+    Not every tree uses every counter: aliases and blocks are specific
+    to tic-tac-toe.
+    
+    If a callback is given, it is called at the end of each ply as
+    callback(stats, plyIndex), e.g. to report progress.
+    """
+    
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.reset()
+        
+    def __repr__(self):
+        rep = f"{self.nodesExpanded} nodes expanded, {self.childrenGenerated} children generated"
+        rep += f"\n{self.aliasesFound} aliases found, {self.aliasesSkipped} aliases skipped"
+        rep += f"\n{self.blocksFound} blocks found, {self.winsPruned} wins pruned"
+        for n in range(0, len(self.plyTimes)):
+            rep += f"\nply {n+1}: {self.plySizes[n]} nodes in {self.plyTimes[n]:.4f} s"
+        return rep
+        
+    def reset(self):
+        self.nodesExpanded = 0
+        self.childrenGenerated = 0
+        self.aliasesFound = 0
+        self.aliasesSkipped = 0
+        self.blocksFound = 0
+        self.winsPruned = 0
+        self.plySizes = []
+        self.plyTimes = []
+        self.plyStart = None
+        
+    def beginPly(self):
+        self.plyStart = time.perf_counter()
+        
+    def endPly(self, plySize):
+        """
+        Record the size and wall time of the ply just generated,
+        and report it to the callback if there is one.
+        """
+        elapsed = 0.0
+        if not None == self.plyStart:
+            elapsed = time.perf_counter() - self.plyStart
+        self.plyStart = None
+        self.plySizes.append(plySize)
+        self.plyTimes.append(elapsed)
+        if not None == self.callback:
+            self.callback(self, len(self.plyTimes) - 1)
+            
+    def totalTime(self):
+        return sum(self.plyTimes)
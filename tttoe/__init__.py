@@ -6,8 +6,12 @@ Created on Thu Jan  6 14:10:41 2022
 @author: Christopher Corbell
 """
 
-__all__ = ["board", "gametree"]
+__all__ = ["board", "gametree", "positiondb", "solver", "symmetry", "transposition"]
 
 from tttoe.board import Board
 from tttoe.gametree import GameTree
+from tttoe.positiondb import PositionDatabase
+from tttoe.solver import Solver
+from tttoe.symmetry import Symmetry
+from tttoe.transposition import TranspositionTable
 
@@ -8,21 +8,27 @@ Created on Thu Jan  6 14:11:39 2022
 
 import copy
 
-class Board:
+from treegen.node import TreeNode
+from tttoe.symmetry import Symmetry
+
+class Board(TreeNode):
     """
     Representation of a tic-tac-toe board, in a particular state.
     
-    The board is represented internally as an array of 9 characters with  
-    indexes corresponding to board grid positions as follows:
+    The board is represented internally as two 9-bit integers, one
+    for X plays and one for O plays, with bit indexes corresponding to
+    board grid positions as follows:
         
      012
-     349
+     345
      678
     
-    Values are represented as 'X', 'O', or '-' (unset)
+    The grid property presents the board as an array of 9 characters,
+    with values represented as 'X', 'O', or '-' (unset)
     
     The board supports label and alias fields. A label is typically a
-    unique string. An alias refers to another (isomorphic) board's label.
+    unique string, made lazily from the board's parent (see TreeNode). 
+    An alias refers to another (isomorphic) board's label.
     
     The board has makeCanonical() method which will rotate/reflect the
     board to a canonical form. Two isomorphic boards will have the same
@@ -53,16 +59,84 @@ class Board:
                 {0, 4, 8}, 
                 {6, 4, 2}]
     
+    def makeWinMasks(winsets):
+        masks = []
+        for winset in winsets:
+            mask = 0
+            for index in winset:
+                mask |= 1 << index
+            masks.append(mask)
+        return masks
+    
+    def makeWinTable(masks):
+        # for each of the 512 possible sets of one player's plays,
+        # precompute whether the set contains a win
+        table = []
+        for bits in range(0, 1 << 9):
+            isWin = False
+            for mask in masks:
+                if bits & mask == mask:
+                    isWin = True
+                    break
+            table.append(isWin)
+        return table
+    
+    FULL_MASK = (1 << 9) - 1
+    WIN_MASKS = makeWinMasks(WIN_SETS)
+    WIN_TABLE = makeWinTable(WIN_MASKS)
+    
+    # lexstrings by (xbits, obits), filled in as boards are seen
+    LEXSTRINGS = {}
+    
+    __slots__ = ("xbits", "obits", "alias", "block")
+    
     def __init__(self):
-        self.grid = ['-'] * 9
-        self.label = None
+        TreeNode.__init__(self)
+        self.xbits = 0
+        self.obits = 0
         self.alias = None
         self.block = False # is this board a win-block?
         
+    @property
+    def grid(self):
+        grid = [Board.EMPTY_TOKEN] * Board.GRID_SIZE
+        for index in range(0, Board.GRID_SIZE):
+            bit = 1 << index
+            if self.xbits & bit:
+                grid[index] = Board.X_TOKEN
+            elif self.obits & bit:
+                grid[index] = Board.O_TOKEN
+        return grid
+    
+    @grid.setter
+    def grid(self, values):
+        """
+        Assign the board from 9 grid values ('X', 'O' or '-'),
+        given as a list of characters or a lexstring.
+        """
+        xbits = 0
+        obits = 0
+        for index in range(0, Board.GRID_SIZE):
+            if values[index] == Board.X_TOKEN:
+                xbits |= 1 << index
+            elif values[index] == Board.O_TOKEN:
+                obits |= 1 << index
+        self.xbits = xbits
+        self.obits = obits
+        
+    def valueAt(self, index):
+        bit = 1 << index
+        if self.xbits & bit:
+            return Board.X_TOKEN
+        if self.obits & bit:
+            return Board.O_TOKEN
+        return Board.EMPTY_TOKEN
+        
     def prettyValue(self, index):
-        if self.grid[index] == Board.EMPTY_TOKEN:
+        value = self.valueAt(index)
+        if value == Board.EMPTY_TOKEN:
             return ' '
-        return self.grid[index]
+        return value
     
     def __repr__(self):
         
@@ -95,16 +169,18 @@ class Board:
     
     def __copy__(self):
         c = Board()
-        c.grid = self.grid[:]
-        c.label = self.label
+        c.xbits = self.xbits
+        c.obits = self.obits
+        c.copyLabel(self)
         c.alias = self.alias
         c.block = self.block
         return c
         
-    def __deepcopy__(self):
+    def __deepcopy__(self, memo=None):
         c = Board()
-        c.grid = self.grid[:]
-        c.label = self.label
+        c.xbits = self.xbits
+        c.obits = self.obits
+        c.copyLabel(self)
         c.alias = self.alias
         c.block = self.block
         return c
@@ -169,19 +245,17 @@ class Board:
             if self.nextPlayer() != Board.X_TOKEN:
                 raise Exception(f"Invalid board state for X to play:\n{self}")
             
-            if self.grid[index] != Board.EMPTY_TOKEN:
+            if (self.xbits | self.obits) & (1 << index):
                 raise Exception(f"Invalid move; board entry {index} is not empty:\n{self}")
             
+        bit = 1 << index
         self.block = False
         if markBlock:
             # is this play blocking a win for O?
-            testWin = self.O_indices()
-            testWin.append(index)
-            for winset in Board.WIN_SETS:
-                if winset.issubset(testWin):
-                    self.block = True
+            self.block = Board.WIN_TABLE[self.obits | bit]
                     
-        self.grid[index] = Board.X_TOKEN
+        self.xbits |= bit
+        self.obits &= ~bit
         
     def oplay(self, index, enforceLegalMove=True, markBlock=True):
         if index < 0 or index >= Board.GRID_SIZE:
@@ -194,62 +268,47 @@ class Board:
             if self.nextPlayer() != Board.O_TOKEN:
                 raise Exception(f"Invalid board state for X to play:\n{self}")
                 
-            if self.grid[index] != Board.EMPTY_TOKEN:
+            if (self.xbits | self.obits) & (1 << index):
                 raise Exception(f"Invalid move; board entry {index} is not empty:\n{self}")
                 
+        bit = 1 << index
         self.block = False
         if markBlock:
             # is this play blocking a win for X?
-            testWin = self.X_indices()
-            testWin.append(index)
-            for winset in Board.WIN_SETS:
-                if winset.issubset(testWin):
-                    self.block = True
+            self.block = Board.WIN_TABLE[self.xbits | bit]
             
-        self.grid[index] = Board.O_TOKEN
+        self.obits |= bit
+        self.xbits &= ~bit
         
     def X_count(self):
-        return self.grid.count(Board.X_TOKEN)
+        return self.xbits.bit_count()
         
     def O_count(self):
-        return self.grid.count(Board.O_TOKEN)
+        return self.obits.bit_count()
     
     def ply_count(self):
-        return self.X_count() + self.O_count()
+        return (self.xbits | self.obits).bit_count()
         
     def empty_count(self):
-        return self.grid.count(Board.EMPTY_TOKEN)
+        return Board.GRID_SIZE - self.ply_count()
+    
+    def bit_indices(bits):
+        return [i for i in range(0, Board.GRID_SIZE) if bits & (1 << i)]
     
     def empty_indices(self):
-        return list(filter(lambda i: self.grid[i]==Board.EMPTY_TOKEN, range(len(self.grid))))
+        return Board.bit_indices(Board.FULL_MASK & ~(self.xbits | self.obits))
         
     def X_indices(self):
-        return list(filter(lambda i: self.grid[i]==Board.X_TOKEN, range(len(self.grid))))
+        return Board.bit_indices(self.xbits)
     
     def O_indices(self):
-        return list(filter(lambda i: self.grid[i]==Board.O_TOKEN, range(len(self.grid))))
+        return Board.bit_indices(self.obits)
         
     def isXWin(self):
-        xiset = set(self.X_indices())
-        if len(xiset) < 3:
-            return False
-        
-        for winset in Board.WIN_SETS:
-            if winset.issubset(xiset):
-                return True
-            
-        return False
+        return Board.WIN_TABLE[self.xbits]
     
     def isOWin(self):
-        oiset = set(self.O_indices())
-        if len(oiset) < 3:
-            return False
-        
-        for winset in Board.WIN_SETS:
-            if winset.issubset(oiset):
-                return True
-            
-        return False
+        return Board.WIN_TABLE[self.obits]
     
     def isWin(self):
         return self.isXWin() or self.isOWin()
@@ -281,14 +340,7 @@ class Board:
         None.
 
         """
-        tempgrid = self.grid.copy()
-        self.grid[0] = tempgrid[2]
-        self.grid[2] = tempgrid[0]
-        self.grid[3] = tempgrid[5]
-        self.grid[5] = tempgrid[3]
-        self.grid[6] = tempgrid[8]
-        self.grid[8] = tempgrid[6]
-        del tempgrid
+        self.transform(4)
     
     def rotate(self):
         """
@@ -299,16 +351,57 @@ class Board:
         None.
 
         """
-        tempgrid = self.grid.copy()
-        self.grid[0] = tempgrid[2]
-        self.grid[1] = tempgrid[5]
-        self.grid[2] = tempgrid[8]
-        self.grid[3] = tempgrid[1]
-        self.grid[5] = tempgrid[7]
-        self.grid[6] = tempgrid[0]
-        self.grid[7] = tempgrid[3]
-        self.grid[8] = tempgrid[6]
-        del tempgrid
+        self.transform(1)
+        
+    def transform(self, transformId):
+        """
+        Apply one of the 8 board symmetries, by Symmetry transform id.
+
+        Parameters
+        ----------
+        transformId : int
+            The id (0-7) of the rotation/reflection to apply;
+            see tttoe.symmetry.Symmetry.
+
+        Returns
+        -------
+        None.
+
+        """
+        table = Symmetry.BIT_TABLES[transformId]
+        self.xbits = table[self.xbits]
+        self.obits = table[self.obits]
+        
+    def code(self):
+        """
+        Return the ternary code of this board: each grid entry is a 
+        base-3 digit ('-'=0, 'O'=1, 'X'=2), with position 0 most significant.
+        Codes sort in the same order as lexstrings.
+        """
+        return 2 * Symmetry.TERNARY[self.xbits] + Symmetry.TERNARY[self.obits]
+    
+    def fromCode(code):
+        """
+        Create a new Board from a ternary board code.
+        """
+        board = Board()
+        board.xbits, board.obits = Symmetry.decode(code)
+        return board
+    
+    def canonicalForm(self):
+        """
+        Find the canonical form of this board without changing it.
+
+        Returns
+        -------
+        (int, int)
+            The ternary code of the canonical board, and the Symmetry 
+            transform id which maps this board to it. Grid indexes on the 
+            canonical board can be mapped back to this board with 
+            Symmetry.toOriginalIndex(index, transformId).
+
+        """
+        return Symmetry.canonicalCode(self.xbits, self.obits)
         
     def lexstring(self):
         """
@@ -324,14 +417,35 @@ class Board:
             lexical comparisons.
 
         """
-        return "".join(self.grid)
+        return Board.lexstringOf(self.xbits, self.obits)
+    
+    def lexstringOf(xbits, obits):
+        """
+        Return the lexstring (see lexstring) of the board with the given
+        X and O bit sets, without making a board.
+        """
+        key = (xbits, obits)
+        lex = Board.LEXSTRINGS.get(key)
+        if lex is None:
+            values = []
+            for index in range(0, Board.GRID_SIZE):
+                bit = 1 << index
+                if xbits & bit:
+                    values.append(Board.X_TOKEN)
+                elif obits & bit:
+                    values.append(Board.O_TOKEN)
+                else:
+                    values.append(Board.EMPTY_TOKEN)
+            lex = "".join(values)
+            Board.LEXSTRINGS[key] = lex
+        return lex
     
     def canonicalString(self):
         """
         Find the canonical string representation of this board.
-        This method gets the lexstring representation of all possible
-        rotations and reflections of this board, sorts them lexically,
-        and returns the first such lexstring.
+        This is the lexstring of whichever rotation or reflection of
+        this board sorts last lexically (it has the highest ternary code);
+        see tttoe.symmetry.Symmetry.
         
         Note, this does not change this board; use makeCanonical to
         convert this board to canonical ordering.
@@ -342,37 +456,22 @@ class Board:
             The canonical lexstring representation of this board.
 
         """
-        lexstrings = []
-        maker = Board()
-        maker.grid = self.grid.copy()
-        lexstrings.append(maker.lexstring())
-        for n in range(0, 3):
-            maker.rotate()
-            lexstrings.append(maker.lexstring())
-        maker.reflect()
-        lexstrings.append(maker.lexstring())
-        for n in range(0, 3):
-            maker.rotate()
-            lexstrings.append(maker.lexstring())
-        # the canonical string is the rotation/reflection
-        # which lexically sorts last
-        lexstrings.sort()
-        return lexstrings.pop()
+        canonical = Symmetry.canonicalize(self.xbits, self.obits)
+        return Board.lexstringOf(canonical[0], canonical[1])
     
     def makeCanonical(self):
         """
         Convert this board's grid to canonical rotation/reflection.
-        This uses canonicalString to find the initial lexical sort
-        based on character representation, then assigns the grid
-        based on the canonical string.
+        This is the same rotation/reflection found by canonicalString.
 
         Returns
         -------
-        None.
+        int
+            The Symmetry transform id that was applied.
 
         """
-        canstr = self.canonicalString()
-        self.grid = list(canstr)
+        self.xbits, self.obits, transformId = Symmetry.canonicalize(self.xbits, self.obits)
+        return transformId
         
     def isIsomorphic(self, otherBoard):
         """
@@ -392,18 +491,16 @@ class Board:
 
         """
         # fast up front checks
-        if self.grid == otherBoard.grid:
+        if self.xbits == otherBoard.xbits and self.obits == otherBoard.obits:
             return True
         
         if self.X_count() != otherBoard.X_count():
             return False
         if self.O_count() != otherBoard.O_count():
             return False
-        if self.grid[4] != otherBoard.grid[4]:
+        if self.valueAt(4) != otherBoard.valueAt(4):
             return False
         
-        can1 = self.canonicalString()
-        can2 = otherBoard.canonicalString()
-        return can1 == can2
+        return self.canonicalForm()[0] == otherBoard.canonicalForm()[0]
 
         
\ No newline at end of file
@@ -7,6 +7,10 @@ Created on Fri Jan  7 10:43:00 2022
 """
 
 from tttoe.board import Board
+from tttoe.solver import Solver
+from tttoe.transposition import TranspositionTable
+from treegen.parallel import ParallelExpander
+from treegen.stats import GenerationStats
 
 class GameTree:
     """
@@ -32,39 +36,188 @@ class GameTree:
         else:
             self.root = rootBoard
             self.plies = []
+        self.transpositions = TranspositionTable()
+        self.solver = None
             
-    def generateTree(self, skipAliases:bool):
-        
-        lastPly = [self.root]
-        currentPly = []
+    def generateTree(self, skipAliases:bool, verbose:bool=True, stats:GenerationStats=None, workers:int=1):
+        """
+        Generate the plies of this tree below the root, appending
+        them to self.plies.
+
+        Parameters
+        ----------
+        skipAliases : bool
+            If True, determine aliases in each ply and don't expand them.
+        verbose : bool, optional
+            If True (the default), print a progress line for every parent
+            and block; set False to generate with no per-node output.
+        stats : GenerationStats, optional
+            If given, generation counters and per-ply timing are added to it.
+        workers : int, optional
+            The number of processes to expand each ply with; see generatePlies.
+
+        Returns
+        -------
+        None.
+
+        """
+        for ply in self.generatePlies(skipAliases, verbose, stats, keepHistory=True, workers=workers):
+            pass
         
-        depth = 0
-        while depth < 9:
+    def generatePlies(self, skipAliases:bool, verbose:bool=True, stats:GenerationStats=None, keepHistory:bool=False, workers:int=1):
+        """
+        Generate the plies of this tree below the root one at a time.
+        Only the ply being expanded is held in memory, unless keepHistory
+        is set, so the whole tree can be counted, filtered or written out
+        ply by ply.
+
+        Parameters
+        ----------
+        skipAliases : bool
+            If True, determine aliases in each ply and don't expand them.
+        verbose : bool, optional
+            If True (the default), print a progress line for every parent
+            and block; set False to generate with no per-node output.
+        stats : GenerationStats, optional
+            If given, generation counters and per-ply timing are added to it.
+        keepHistory : bool, optional
+            If True, also append each ply to self.plies, as generateTree does.
+            Otherwise boards are given label strings rather than parent
+            references, so that earlier plies can be freed.
+        workers : int, optional
+            If more than 1, the parents of each ply are expanded across this
+            many processes, passing boards as codes. Children are merged in 
+            parent order, so the result (including labels) is the same as 
+            with a single process.
 
-            for parent in lastPly:
-                if True == skipAliases:
-                    if not (None == parent.alias):
-                        print (f"skipping parent {parent.label}, alias of {parent.alias}...")
+        Yields
+        ------
+        [Board]
+            The boards of each ply, in order (ply 1 first).
+
+        """
+        expander = None
+        if workers > 1:
+            expander = ParallelExpander(workers)
+        
+        try:
+            lastPly = [self.root]
+            
+            depth = 0
+            while depth < 9:
+                if not None == stats:
+                    stats.beginPly()
+                
+                parents = []
+                for parent in lastPly:
+                    if True == skipAliases:
+                        if not (None == parent.alias):
+                            if verbose:
+                                print (f"skipping parent {parent.label}, alias of {parent.alias}...")
+                            if not None == stats:
+                                stats.aliasesSkipped += 1
+                            continue
+                    
+                    if parent.isWin():
+                        if verbose:
+                            print (f"skipping parent {parent.label}, {parent.winString()}")
+                        if not None == stats:
+                            stats.winsPruned += 1
                         continue
+                    
+                    #if parent.isDraw():
+                    #    continue
+                    parents.append(parent)
                 
-                if parent.isWin():
-                    print (f"skipping parent {parent.label}, {parent.winString()}")
-                    continue
+                if None == expander:
+                    childCodeLists = [GameTree.childCodes(parent) for parent in parents]
+                else:
+                    childCodeLists = expander.map(GameTree.expandCodes, [parent.code() for parent in parents])
                 
-                #if parent.isDraw():
-                #    continue
-                children = GameTree.generateChildBoards(parent)
-                print (f"...generated {len(children)} child boards from parent {parent.label}")
-                currentPly.extend(children)
-            
-            if skipAliases:
-                GameTree.determineAliases(currentPly)
+                currentPly = []
+                for n in range(0, len(parents)):
+                    children = GameTree.makeChildBoards(parents[n], childCodeLists[n], verbose, stats, linkParent=keepHistory)
+                    if verbose:
+                        print (f"...generated {len(children)} child boards from parent {parents[n].label}")
+                    currentPly.extend(children)
                 
-            self.plies.append(currentPly)
-            lastPly = currentPly
-            currentPly = []
-            depth += 1
+                if skipAliases:
+                    aliasCount = GameTree.determineAliases(currentPly, self.transpositions)
+                    if not None == stats:
+                        stats.aliasesFound += aliasCount
+                    
+                if keepHistory:
+                    self.plies.append(currentPly)
+                if not None == stats:
+                    stats.endPly(len(currentPly))
+                yield currentPly
+                lastPly = currentPly
+                depth += 1
+        finally:
+            if not None == expander:
+                expander.shutdown()
+            
+    def generateNodes(self, skipAliases:bool, verbose:bool=True, stats:GenerationStats=None, depthFirst:bool=False):
+        """
+        Generate the boards of this tree below the root one at a time.
+        
+        By default boards come ply by ply, as from generatePlies. With 
+        depthFirst=True, boards come in depth-first (pre-)order instead, and
+        only the boards on the path to the current one are held in memory;
+        aliases can't be determined in this order, so skipAliases must be False.
+
+        Yields
+        ------
+        Board
+            Each board of the tree, excluding the root.
+
+        """
+        if not depthFirst:
+            for ply in self.generatePlies(skipAliases, verbose, stats):
+                yield from ply
+            return
+        
+        if skipAliases:
+            raise Exception("Aliases can't be skipped in depth-first generation")
         
+        stack = [iter([self.root])]
+        while len(stack) > 0:
+            parent = next(stack[-1], None)
+            if None == parent:
+                stack.pop()
+                continue
+            if len(stack) > 1:
+                yield parent
+            if parent.isWin():
+                if not None == stats:
+                    stats.winsPruned += 1
+                continue
+            if parent.empty_count() > 0:
+                stack.append(iter(GameTree.generateChildBoards(parent, verbose, stats)))
+    
+    def solve(self, board:Board=None):
+        """
+        Find the value and best moves of a board by depth-first search
+        (see tttoe.solver.Solver); this does not need or use the plies
+        built by generateTree. Solved positions are kept between calls.
+
+        Parameters
+        ----------
+        board : Board, optional
+            The board to solve; the root of this tree by default.
+
+        Returns
+        -------
+        (int, [int])
+            The value of the board for the player to move (Solver.WIN,
+            Solver.DRAW or Solver.LOSS) and the grid indexes of its best moves.
+
+        """
+        if None == self.solver:
+            self.solver = Solver()
+        if None == board:
+            board = self.root
+        return self.solver.solve(board)
     
     def print_tree_size(self):
         totalSize = 1
@@ -93,7 +246,7 @@ class GameTree:
             for board in self.plies[index - 1]:
                 print(f"{board}\n")
             
-    def generateChildBoards(parent: Board):
+    def generateChildBoards(parent: Board, verbose:bool=True, stats:GenerationStats=None):
         """
         Given a parent game board, generate all of its next-move boards
         up to isomorphism. Boards are canonical and are labeled
@@ -105,6 +258,10 @@ class GameTree:
         ----------
         parent : Board
             A parent board.
+        verbose : bool, optional
+            If True (the default), print a line for each block child.
+        stats : GenerationStats, optional
+            If given, the expansion is counted in it.
 
         Returns
         -------
@@ -113,8 +270,22 @@ class GameTree:
             from the parent board state) up to isomorphism.
 
         """
-        childBoardCanonicalStrings = []
-        blocks = set()
+        return GameTree.makeChildBoards(parent, GameTree.childCodes(parent), verbose, stats)
+    
+    def childCodes(parent: Board):
+        """
+        Find the canonical codes of a parent board's next-move boards,
+        up to isomorphism, in order of discovery (by play index).
+
+        Returns
+        -------
+        [(int, bool)]
+            The canonical code of each child board, and whether the child
+            is a block.
+
+        """
+        # canonical child codes in order of discovery, with block flags
+        childBlocks = {}
         
         isPlayingX = parent.nextPlayer() == Board.X_TOKEN
         emptyIndices = parent.empty_indices()
@@ -126,77 +297,103 @@ class GameTree:
             else:
                 childBoard.oplay(playIndex)
                 
-            childStr = childBoard.canonicalString()
+            childCode, transformId = childBoard.canonicalForm()
             if childBoard.block:
-                blocks.add(childStr)
-            if not childStr in childBoardCanonicalStrings:
-                childBoardCanonicalStrings.append(childStr)
+                childBlocks[childCode] = True
+            elif not childCode in childBlocks:
+                childBlocks[childCode] = False
             del childBoard
-        
+            
+        return list(childBlocks.items())
+    
+    def expandCodes(parentCodes):
+        """
+        Find the child codes (as from childCodes) of each of a list of
+        board codes; this is the unit of work for parallel generation.
+        """
+        return [GameTree.childCodes(Board.fromCode(code)) for code in parentCodes]
+    
+    def makeChildBoards(parent: Board, childCodes, verbose:bool=True, stats:GenerationStats=None, linkParent:bool=True):
+        """
+        Make the labeled child boards of a parent from its child codes
+        (as returned by childCodes). Children are labeled through a
+        reference to the parent (see TreeNode.setParent), unless
+        linkParent is False, in which case they are given label strings
+        and don't keep the parent alive.
+        """
         childBoards = []
         index = 0
-        for gridString in childBoardCanonicalStrings:
-            child = Board()
-            child.grid = list(gridString)
-            child.label = parent.label + "." + str(index)
-            if gridString in blocks:
-                print(f"- block played in board {child.label}")
+        blockCount = 0
+        for childCode, isBlock in childCodes:
+            child = Board.fromCode(childCode)
+            if linkParent:
+                child.setParent(parent, index)
+            else:
+                child.setChildLabel(parent, index)
+            if isBlock:
+                if verbose:
+                    print(f"- block played in board {child.label}")
                 child.block = True
+                blockCount += 1
             index += 1
             childBoards.append(child)
+            
+        if not None == stats:
+            stats.nodesExpanded += 1
+            stats.childrenGenerated += len(childBoards)
+            stats.blocksFound += blockCount
         return childBoards
     
-    def determineAliases(plyboards):
+    def determineAliases(plyboards, table:TranspositionTable=None):
         """
-        Given a list of child-board lists of the same ply,
-        determine aliases of isomorphic boards. This assumes
-        all boards are already canonical so we can simply compare
-        lexical string representation.
+        Given a list of boards of the same ply, determine aliases
+        of isomorphic boards. Boards are matched by canonical code
+        through a transposition table, in one pass over the list.
         
         As a subtle improvement, we use the block property of
         each board to prefer blocks as alias targets (so continuing
         isomorphic branches explicitly have blocking plays as parent nodes)
         (A block is a play which removes a winning next-move opportunity)
+        Block boards themselves are never made aliases.
 
         Parameters
         ----------
-        childBoardLists : [[Board]]
-            A list of Board lists, expected to be returned by
+        plyboards : [Board]
+            A list of Boards, expected to be returned by
             generateChildBoards for the same ply level (game-tree depth)
+        table : TranspositionTable, optional
+            A table to resolve aliases through, which may be shared
+            across plies and generateTree runs. If None, a new table
+            is used for this call.
 
         Returns
         -------
-        None; alias value is set on Board objects passed in
+        int
+            The number of aliases found; alias value is set on 
+            Board objects passed in
 
         """
-        
+        if None == table:
+            table = TranspositionTable()
+            
         # resolve aliases to block-play boards first
-        block_indices = [idx for idx, element in enumerate(plyboards) if element.block]
-        for block_index in block_indices:
-            target = plyboards[block_index]
-            for otherIndex in range(0, len(plyboards)):
-                if otherIndex in block_indices:
-                    continue
-                
-                other = plyboards[otherIndex]
-                if not None == other.alias: # already determined
-                    continue
-                if target.lexstring() == other.lexstring():
-                    other.alias = target.label
+        codes = [board.canonicalForm()[0] for board in plyboards]
+        for index in range(0, len(plyboards)):
+            if plyboards[index].block:
+                table.addBlock(codes[index], plyboards[index].label)
                     
         # now resolve everything else
-        targetIndex = 0
-        for targetIndex in range(0, len(plyboards) - 1):
-            target = plyboards[targetIndex]
-            if target.block: # already processed
+        aliasCount = 0
+        for index in range(0, len(plyboards)):
+            board = plyboards[index]
+            if board.block: # already processed
                 continue
-            if not None == target.alias: # already determined to be alias
+            if not None == board.alias: # already determined
                 continue
             
-            for laterIndex in range(targetIndex+1, len(plyboards)):
-                later = plyboards[laterIndex]
-                if not None == later.alias: # already determined
-                    continue
-                if target.lexstring() == later.lexstring():
-                    # found an alias
-                    later.alias = target.label
+            target = table.resolve(codes[index], board.label)
+            if not None == target:
+                board.alias = target
+                aliasCount += 1
+                
+        return aliasCount
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:48:10 2026
+
+@author: Christopher Corbell
+"""
+
+import mmap
+import struct
+
+from tttoe.board import Board
+from tttoe.solver import Solver
+from tttoe.symmetry import Symmetry
+
+class PositionDatabase:
+    """
+    A PositionDatabase is a solved table of every canonical tic-tac-toe
+    position reachable from the empty board, stored in a compact binary
+    file which is read through mmap, so opening it costs nothing beyond
+    mapping the file and queries read only the records they touch.
+
+    Use PositionDatabase.export(path) once to solve and write the file,
+    then PositionDatabase(path) in any process to answer queries.
+
+    The file is a header followed by fixed-size records sorted by
+    canonical board code (see tttoe.symmetry.Symmetry), little-endian:
+
+        header: magic b'TTTP', version (uint16), record count (uint16)
+        record: code (uint16), best-move mask (uint16), parent record
+                index (uint16), value (int8), distance to end (uint8),
+                child ordinal (uint8)
+
+    The value, distance and best-move mask (on the canonical board) are
+    as computed by Solver.analyze. Each position records the first parent
+    it was reached from (in breadth-first order) and its ordinal among
+    that parent's children, as in GameTree.generateChildBoards, so a
+    GameTree-style label can be rebuilt for any position.
+    """
+
+    MAGIC = b'TTTP'
+    VERSION = 1
+    HEADER_FORMAT = '<4sHH'
+    RECORD_FORMAT = '<HHHbBB'
+    HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+    RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+    NO_PARENT = 0xFFFF
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = struct.unpack_from(PositionDatabase.HEADER_FORMAT, self.data, 0)
+        if magic != PositionDatabase.MAGIC or version != PositionDatabase.VERSION:
+            self.close()
+            raise Exception(f"{path} is not a version {PositionDatabase.VERSION} tic-tac-toe position database")
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def close(self):
+        if not None == self.data:
+            self.data.close()
+            self.data = None
+        if not None == self.file:
+            self.file.close()
+            self.file = None
+
+    def export(path, solver:Solver=None):
+        """
+        Solve every reachable canonical position and write the database file.
+
+        Parameters
+        ----------
+        path : str
+            The file to write.
+        solver : Solver, optional
+            A Solver to use (and fill); a new one is used by default.
+
+        Returns
+        -------
+        int
+            The number of positions written.
+
+        """
+        if None == solver:
+            solver = Solver()
+
+        parents = PositionDatabase.enumeratePositions()
+        codes = sorted(parents.keys())
+        indexes = {}
+        for index in range(0, len(codes)):
+            indexes[codes[index]] = index
+
+        with open(path, 'wb') as file:
+            file.write(struct.pack(PositionDatabase.HEADER_FORMAT,
+                                   PositionDatabase.MAGIC,
+                                   PositionDatabase.VERSION,
+                                   len(codes)))
+            for code in codes:
+                parentCode, ordinal = parents[code]
+                parentIndex = PositionDatabase.NO_PARENT
+                if not None == parentCode:
+                    parentIndex = indexes[parentCode]
+                score, bestMask = solver.analyzeCode(code)
+                xbits, obits = Symmetry.decode(code)
+                distance = Solver.distanceOf(score, (xbits | obits).bit_count())
+                file.write(struct.pack(PositionDatabase.RECORD_FORMAT,
+                                       code,
+                                       bestMask,
+                                       parentIndex,
+                                       Solver.valueOf(score),
+                                       distance,
+                                       ordinal))
+        return len(codes)
+
+    def enumeratePositions():
+        """
+        Find every canonical position reachable from the empty board,
+        breadth-first.
+
+        Returns
+        -------
+        dict
+            A dictionary from canonical code to (parent code, child ordinal)
+            for the first parent each position was reached from; the
+            empty board maps to (None, 0).
+
+        """
+        rootCode = Board().code()
+        parents = {rootCode: (None, 0)}
+        currentPly = [rootCode]
+        while len(currentPly) > 0:
+            nextPly = []
+            for code in currentPly:
+                xbits, obits = Symmetry.decode(code)
+                if Solver.isGameOver(xbits, obits):
+                    continue
+                isPlayingX = xbits.bit_count() == obits.bit_count()
+                childCodes = []
+                for index in Board.bit_indices(Board.FULL_MASK & ~(xbits | obits)):
+                    bit = 1 << index
+                    if isPlayingX:
+                        childCode, transformId = Symmetry.canonicalCode(xbits | bit, obits)
+                    else:
+                        childCode, transformId = Symmetry.canonicalCode(xbits, obits | bit)
+                    if childCode in childCodes:
+                        continue
+                    if not childCode in parents:
+                        parents[childCode] = (code, len(childCodes))
+                        nextPly.append(childCode)
+                    childCodes.append(childCode)
+            currentPly = nextPly
+        return parents
+
+    def record(self, index):
+        """
+        Read a record by index.
+
+        Returns
+        -------
+        (int, int, int, int, int, int)
+            The record's code, best-move mask, parent index, value,
+            distance and child ordinal.
+        """
+        if index < 0 or index >= self.count:
+            raise Exception(f"Record index {index} out of range for {self.count} records")
+        offset = PositionDatabase.HEADER_SIZE + index * PositionDatabase.RECORD_SIZE
+        return struct.unpack_from(PositionDatabase.RECORD_FORMAT, self.data, offset)
+
+    def find(self, canonicalCode):
+        """
+        Binary search for a canonical code; returns its record index, or -1.
+        """
+        low = 0
+        high = self.count - 1
+        data = self.data
+        while low <= high:
+            middle = (low + high) // 2
+            offset = PositionDatabase.HEADER_SIZE + middle * PositionDatabase.RECORD_SIZE
+            # the code is the record's leading little-endian uint16
+            code = data[offset] | (data[offset + 1] << 8)
+            if code < canonicalCode:
+                low = middle + 1
+            elif code > canonicalCode:
+                high = middle - 1
+            else:
+                return middle
+        return -1
+
+    def lookup(self, board:Board):
+        """
+        Look up a board.
+
+        Returns
+        -------
+        (int, int, [int]) (or None)
+            The value of the board for the player to move (Solver.WIN,
+            Solver.DRAW or Solver.LOSS), the number of plies left under
+            best play and the grid indexes of the best moves on this board;
+            None if the board is not a reachable position.
+        """
+        canonicalCode, transformId = board.canonicalForm()
+        index = self.find(canonicalCode)
+        if index < 0:
+            return None
+        code, bestMask, parentIndex, value, distance, ordinal = self.record(index)
+        return value, distance, Board.bit_indices(Symmetry.toOriginalMask(bestMask, transformId))
+
+    def label(self, board:Board):
+        """
+        Return a GameTree-style label for a board's canonical position
+        (e.g. '0.2.0'), following first-parent links to the root;
+        None if the board is not a reachable position.
+        """
+        index = self.find(board.canonicalForm()[0])
+        if index < 0:
+            return None
+        ordinals = []
+        while True:
+            code, bestMask, parentIndex, value, distance, ordinal = self.record(index)
+            if parentIndex == PositionDatabase.NO_PARENT:
+                break
+            ordinals.append(str(ordinal))
+            index = parentIndex
+        ordinals.append('0')
+        ordinals.reverse()
+        return ".".join(ordinals)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 12:31:48 2026
+
+@author: Christopher Corbell
+"""
+
+from tttoe.board import Board
+from tttoe.symmetry import Symmetry
+
+class Solver:
+    """
+    A Solver finds the game-theoretic value and best moves of tic-tac-toe
+    boards, by depth-first negamax search with alpha-beta pruning.
+
+    Positions are memoized by canonical code, so each position is searched
+    once up to symmetry and repeated queries are answered from the memo.
+    A Solver can be kept around (e.g. one per process) and shared by
+    any number of queries.
+
+    Internally positions are scored from the point of view of the player
+    to move: a win which ends the game at ply p scores (10 - p), a loss
+    scores -(10 - p), and a draw scores 0. This prefers quicker wins and
+    slower losses among moves of the same value.
+    """
+
+    WIN = 1
+    DRAW = 0
+    LOSS = -1
+
+    # memo entry bound types
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+    INFINITY = 100
+
+    # try the center first, then corners, then edges
+    MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+    def __init__(self):
+        self.memo = {} # canonical code -> (score, bound type)
+        self.analyses = {} # canonical code -> (score, best move mask)
+
+    def solve(self, board:Board):
+        """
+        Solve a board.
+
+        Parameters
+        ----------
+        board : Board
+            A tic-tac-toe board in any (legal) state.
+
+        Returns
+        -------
+        (int, [int])
+            The value of the board for the player to move (Solver.WIN,
+            Solver.DRAW or Solver.LOSS) and the grid indexes of the
+            best moves on this board, which is empty if the game is over.
+
+        """
+        value, distance, bestMask = self.analyze(board)
+        return value, Board.bit_indices(bestMask)
+
+    def analyze(self, board:Board):
+        """
+        Solve a board, including its distance to the end of the game.
+
+        Parameters
+        ----------
+        board : Board
+            A tic-tac-toe board in any (legal) state.
+
+        Returns
+        -------
+        (int, int, int)
+            The value of the board for the player to move, the number
+            of plies left in the game under best play, and the bit set
+            of best-move grid indexes on this board.
+
+        """
+        canonicalCode, transformId = board.canonicalForm()
+        score, canonicalMask = self.analyzeCode(canonicalCode)
+        ply = board.ply_count()
+        return (Solver.valueOf(score),
+                Solver.distanceOf(score, ply),
+                Symmetry.toOriginalMask(canonicalMask, transformId))
+
+    def analyzeCode(self, canonicalCode):
+        """
+        Solve a canonical board by its code.
+
+        Returns
+        -------
+        (int, int)
+            The score of the board for the player to move, and the bit
+            set of best-move grid indexes on the canonical board.
+
+        """
+        analysis = self.analyses.get(canonicalCode)
+        if not None == analysis:
+            return analysis
+
+        xbits, obits = Symmetry.decode(canonicalCode)
+        isPlayingX = xbits.bit_count() == obits.bit_count()
+        bestScore = self.negamax(xbits, obits, -Solver.INFINITY, Solver.INFINITY)
+        bestMask = 0
+        if not Solver.isGameOver(xbits, obits):
+            empty = Board.FULL_MASK & ~(xbits | obits)
+            for index in Solver.MOVE_ORDER:
+                bit = 1 << index
+                if not empty & bit:
+                    continue
+                if isPlayingX:
+                    score = -self.negamax(xbits | bit, obits, -Solver.INFINITY, Solver.INFINITY)
+                else:
+                    score = -self.negamax(xbits, obits | bit, -Solver.INFINITY, Solver.INFINITY)
+                if score == bestScore:
+                    bestMask |= bit
+
+        analysis = (bestScore, bestMask)
+        self.analyses[canonicalCode] = analysis
+        return analysis
+
+    def score(self, board:Board):
+        """
+        Return the negamax score of a board for the player to move.
+        """
+        return self.negamax(board.xbits, board.obits, -Solver.INFINITY, Solver.INFINITY)
+
+    def negamax(self, xbits, obits, alpha, beta):
+        ply = (xbits | obits).bit_count()
+        isPlayingX = xbits.bit_count() == obits.bit_count()
+        mover = xbits if isPlayingX else obits
+        opponent = obits if isPlayingX else xbits
+        if Board.WIN_TABLE[opponent]:
+            return ply - 10
+        if Board.WIN_TABLE[mover]:
+            return 10 - ply
+        if ply == Board.GRID_SIZE:
+            return 0
+
+        key, transformId = Symmetry.canonicalCode(xbits, obits)
+        entry = self.memo.get(key)
+        if not None == entry:
+            score, bound = entry
+            if bound == Solver.EXACT:
+                return score
+            if bound == Solver.LOWER and score >= beta:
+                return score
+            if bound == Solver.UPPER and score <= alpha:
+                return score
+
+        originalAlpha = alpha
+        bestScore = -Solver.INFINITY
+        empty = Board.FULL_MASK & ~(xbits | obits)
+        for index in Solver.MOVE_ORDER:
+            bit = 1 << index
+            if not empty & bit:
+                continue
+            if isPlayingX:
+                score = -self.negamax(xbits | bit, obits, -beta, -alpha)
+            else:
+                score = -self.negamax(xbits, obits | bit, -beta, -alpha)
+            if score > bestScore:
+                bestScore = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if bestScore <= originalAlpha:
+            bound = Solver.UPPER
+        elif bestScore >= beta:
+            bound = Solver.LOWER
+        else:
+            bound = Solver.EXACT
+        self.memo[key] = (bestScore, bound)
+        return bestScore
+
+    def isGameOver(xbits, obits):
+        return (Board.WIN_TABLE[xbits] or Board.WIN_TABLE[obits]
+                or (xbits | obits) == Board.FULL_MASK)
+
+    def valueOf(score):
+        if score > 0:
+            return Solver.WIN
+        if score < 0:
+            return Solver.LOSS
+        return Solver.DRAW
+
+    def distanceOf(score, ply):
+        """
+        Return the number of plies left in a game from a board at
+        the given ply, given the board's score.
+        """
+        if score == 0:
+            # draws are only declared on a full board
+            return Board.GRID_SIZE - ply
+        return 10 - abs(score) - ply
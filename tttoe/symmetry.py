@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:02:17 2026
+
+@author: Christopher Corbell
+"""
+
+class Symmetry:
+    """
+    Symmetry holds precomputed tables for the 8 rotations and reflections
+    (the D4 symmetry group) of a tic-tac-toe grid, operating on the 9-bit
+    X and O sets used by tttoe.Board.
+
+    Transforms are identified by an integer id 0-7. Transform t reflects
+    the board around its vertical axis if t >= 4, then rotates it
+    counter-clockwise (t % 4) times; transform 0 is the identity.
+    Each transform is stored as a permutation: position i of the
+    transformed board takes the entry from position PERMUTATIONS[t][i]
+    of the original.
+
+    Boards are compared by their ternary code, with each grid entry
+    as a base-3 digit ('-'=0, 'O'=1, 'X'=2) and position 0 most
+    significant, so that code order matches lexstring order. The
+    canonical form of a board is its transform with the highest code,
+    i.e. the rotation/reflection whose lexstring sorts last.
+    """
+
+    GRID_SIZE = 3*3
+    TRANSFORM_COUNT = 8
+
+    IDENTITY = (0, 1, 2, 3, 4, 5, 6, 7, 8)
+    ROTATION = (2, 5, 8, 1, 4, 7, 0, 3, 6)
+    REFLECTION = (2, 1, 0, 5, 4, 3, 8, 7, 6)
+
+    def makePermutations(identity, reflection, rotation):
+        permutations = []
+        for permutation in [identity, reflection]:
+            for n in range(0, 4):
+                permutations.append(permutation)
+                permutation = tuple(permutation[rotation[i]] for i in range(0, 9))
+        return permutations
+
+    def makeInverseIds(permutations):
+        ids = []
+        for permutation in permutations:
+            inverse = [0] * 9
+            for index in range(0, 9):
+                inverse[permutation[index]] = index
+            ids.append(permutations.index(tuple(inverse)))
+        return ids
+
+    def makeBitTable(permutation):
+        # map each of the 512 possible bit sets to its permuted bit set
+        table = []
+        for bits in range(0, 1 << 9):
+            permuted = 0
+            for index in range(0, 9):
+                if bits & (1 << permutation[index]):
+                    permuted |= 1 << index
+            table.append(permuted)
+        return table
+
+    def makeTernaryTable():
+        # the base-3 place values of each bit set, position 0 most significant
+        table = []
+        for bits in range(0, 1 << 9):
+            value = 0
+            for index in range(0, 9):
+                if bits & (1 << index):
+                    value += 3 ** (8 - index)
+            table.append(value)
+        return table
+
+    PERMUTATIONS = makePermutations(IDENTITY, REFLECTION, ROTATION)
+    INVERSE_IDS = makeInverseIds(PERMUTATIONS)
+    INVERSES = list(map(PERMUTATIONS.__getitem__, INVERSE_IDS))
+    BIT_TABLES = list(map(makeBitTable, PERMUTATIONS))
+    TERNARY = makeTernaryTable()
+
+    def code(xbits, obits):
+        """
+        Return the ternary code of a board given its X and O bit sets.
+        """
+        return 2 * Symmetry.TERNARY[xbits] + Symmetry.TERNARY[obits]
+
+    def decode(code):
+        """
+        Return the (xbits, obits) pair for a ternary board code.
+        """
+        xbits = 0
+        obits = 0
+        for index in range(8, -1, -1):
+            digit = code % 3
+            code //= 3
+            if digit == 2:
+                xbits |= 1 << index
+            elif digit == 1:
+                obits |= 1 << index
+        return xbits, obits
+
+    def transform(xbits, obits, transformId):
+        """
+        Apply a transform to a board's X and O bit sets,
+        returning the transformed (xbits, obits) pair.
+        """
+        table = Symmetry.BIT_TABLES[transformId]
+        return table[xbits], table[obits]
+
+    def canonicalize(xbits, obits):
+        """
+        Find the canonical form of a board given its X and O bit sets.
+
+        Returns
+        -------
+        (int, int, int)
+            The canonical xbits and obits, and the id of the transform
+            which takes the board to its canonical form (the lowest such
+            id, if the board has symmetries of its own).
+        """
+        ternary = Symmetry.TERNARY
+        bestX = xbits
+        bestO = obits
+        bestCode = 2 * ternary[xbits] + ternary[obits]
+        bestId = 0
+        for transformId in range(1, 8):
+            table = Symmetry.BIT_TABLES[transformId]
+            tx = table[xbits]
+            to = table[obits]
+            code = 2 * ternary[tx] + ternary[to]
+            if code > bestCode:
+                bestX = tx
+                bestO = to
+                bestCode = code
+                bestId = transformId
+        return bestX, bestO, bestId
+
+    def canonicalCode(xbits, obits):
+        """
+        Return the canonical ternary code of a board and the id
+        of the transform which produces it.
+        """
+        cx, co, transformId = Symmetry.canonicalize(xbits, obits)
+        return 2 * Symmetry.TERNARY[cx] + Symmetry.TERNARY[co], transformId
+
+    def toOriginalIndex(index, transformId):
+        """
+        Map a grid index of a transformed board back to the grid index
+        of the original board (e.g. a move chosen on a canonical board).
+        """
+        return Symmetry.PERMUTATIONS[transformId][index]
+
+    def toTransformedIndex(index, transformId):
+        """
+        Map a grid index of an original board to the grid index
+        it moves to under a transform.
+        """
+        return Symmetry.INVERSES[transformId][index]
+
+    def toOriginalMask(mask, transformId):
+        """
+        Map a bit set of grid indexes on a transformed board back
+        to the corresponding bit set on the original board.
+        """
+        return Symmetry.BIT_TABLES[Symmetry.INVERSE_IDS[transformId]][mask]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:12:40 2026
+
+@author: Christopher Corbell
+"""
+
+import unittest
+
+from tttoe.board import Board
+from tttoe.symmetry import Symmetry
+
+def RunAllBoardTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(BoardTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1BoardTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(BoardTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def boardtests_main():
+    unittest.main()
+
+class BoardTests(unittest.TestCase):
+
+    def testPlayAndCounts(self):
+        board = Board()
+        self.assertEqual(Board.X_TOKEN, board.nextPlayer())
+        self.assertEqual(None, board.lastPlayer())
+
+        board.xplay(4)
+        board.oplay(0)
+        board.xplay(8)
+
+        self.assertEqual("O---X---X", board.lexstring())
+        self.assertEqual(['O', '-', '-', '-', 'X', '-', '-', '-', 'X'], board.grid)
+        self.assertEqual("O---X---X", Board.lexstringOf(board.xbits, board.obits))
+        self.assertEqual("-XO------", Board.lexstringOf(0b10, 0b100))
+        self.assertEqual(2, board.X_count())
+        self.assertEqual(1, board.O_count())
+        self.assertEqual(3, board.ply_count())
+        self.assertEqual(6, board.empty_count())
+        self.assertEqual([4, 8], board.X_indices())
+        self.assertEqual([0], board.O_indices())
+        self.assertEqual([1, 2, 3, 5, 6, 7], board.empty_indices())
+        self.assertEqual(Board.X_TOKEN, board.lastPlayer())
+        self.assertEqual(Board.O_TOKEN, board.nextPlayer())
+
+    def testBadPlayException(self):
+        board = Board()
+
+        with self.assertRaises(Exception):
+            board.oplay(0)
+
+        board.xplay(0)
+        with self.assertRaises(Exception):
+            board.oplay(0)
+
+        with self.assertRaises(Exception):
+            board.oplay(9)
+
+    def testWinsAndBlocks(self):
+        board = Board()
+        board.grid = "XX-OO----"
+        self.assertFalse(board.isWin())
+
+        blocked = board.copy()
+        blocked.xplay(5)
+        self.assertTrue(blocked.block)
+        self.assertFalse(blocked.isWin())
+
+        board.xplay(8)
+        self.assertFalse(board.block)
+        board.oplay(5)
+        self.assertFalse(board.block)
+        self.assertTrue(board.isOWin())
+        self.assertFalse(board.isXWin())
+        self.assertEqual("win for O", board.winString())
+
+        with self.assertRaises(Exception):
+            board.xplay(8)
+
+        draw = Board()
+        draw.grid = "XOXXOOOXX"
+        self.assertFalse(draw.isWin())
+        self.assertTrue(draw.isDraw())
+
+    def testCanonicalAndIsomorphic(self):
+        corner = Board()
+        corner.xplay(0)
+
+        otherCorner = Board()
+        otherCorner.xplay(8)
+
+        edge = Board()
+        edge.xplay(1)
+
+        self.assertTrue(corner.isIsomorphic(otherCorner))
+        self.assertFalse(corner.isIsomorphic(edge))
+        self.assertEqual("X--------", corner.canonicalString())
+        self.assertEqual(corner.canonicalString(), otherCorner.canonicalString())
+
+        otherCorner.makeCanonical()
+        self.assertEqual("X--------", otherCorner.lexstring())
+
+        rotated = corner.copy()
+        rotated.rotate()
+        self.assertEqual("------X--", rotated.lexstring())
+        rotated.reflect()
+        self.assertEqual("--------X", rotated.lexstring())
+
+    def testCanonicalFormAndMoveMapping(self):
+        board = Board()
+        board.xplay(6)
+        board.oplay(7)
+
+        canonicalCode, transformId = board.canonicalForm()
+        canonical = Board.fromCode(canonicalCode)
+        self.assertEqual(board.canonicalString(), canonical.lexstring())
+        self.assertEqual(canonicalCode, canonical.code())
+
+        transformed = board.copy()
+        transformed.transform(transformId)
+        self.assertEqual(canonical.lexstring(), transformed.lexstring())
+
+        # every canonical-board index maps back to the same entry of the original
+        for index in range(0, 9):
+            original = Symmetry.toOriginalIndex(index, transformId)
+            self.assertEqual(canonical.valueAt(index), board.valueAt(original))
+            self.assertEqual(index, Symmetry.toTransformedIndex(original, transformId))
+
+        emptyMask = Symmetry.toOriginalMask(Board.FULL_MASK & ~(canonical.xbits | canonical.obits), transformId)
+        self.assertEqual(board.empty_indices(), Board.bit_indices(emptyMask))
+
+if __name__ == "__main__":
+    boardtests_main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:05:18 2026
+
+@author: Christopher Corbell
+"""
+
+import gc
+import unittest
+
+from tttoe.board import Board
+from tttoe.gametree import GameTree
+from tttoe.transposition import TranspositionTable
+from treegen.stats import GenerationStats
+
+def RunAllGameTreeTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(GameTreeTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def Run1GameTreeTest(name):
+    suite = unittest.TestSuite()
+    suite.addTest(GameTreeTests(name))
+
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def gametreetests_main():
+    unittest.main()
+
+# ply sizes of the full tree with aliases skipped
+ALIASED_PLY_SIZES = [3, 12, 66, 198, 492, 584, 626, 303, 120]
+# ply sizes of the full tree with aliases expanded
+FULL_PLY_SIZES = [3, 12, 66, 360, 1710, 5992, 15878, 20964, 13538]
+
+def plySummary(ply):
+    return [(board.label, board.lexstring(), board.alias, board.block) for board in ply]
+
+class GameTreeTests(unittest.TestCase):
+
+    def testAliasesAndBlocks(self):
+        tree = GameTree()
+        tree.generateTree(True, verbose=False)
+        self.assertEqual(ALIASED_PLY_SIZES, [len(ply) for ply in tree.plies])
+        self.assertEqual([0, 0, 28, 90, 318, 341, 387, 115, 40],
+                         [len([board for board in ply if not None == board.alias]) for ply in tree.plies])
+        self.assertEqual([0, 0, 0, 20, 54, 184, 210, 187, 79],
+                         [len([board for board in ply if board.block]) for ply in tree.plies])
+
+        self.assertEqual([('0.0', 'X--------', None, False),
+                          ('0.1', '-X-------', None, False),
+                          ('0.2', '----X----', None, False)], plySummary(tree.plies[0]))
+        self.assertEqual(['XO-------', 'X-O------', 'X---O----', 'X----O---', 'X-------O',
+                          'OX-------', '-X-O-----', '-X--O----', 'O----X---', '-X-----O-',
+                          'O---X----', '-O--X----'], [board.lexstring() for board in tree.plies[1]])
+
+        boards = {}
+        for ply in tree.plies:
+            for board in ply:
+                boards[board.label] = board
+        self.assertEqual(('XO----X--', '0.0.0.4'), (boards['0.0.3.1'].lexstring(), boards['0.0.3.1'].alias))
+        self.assertEqual(('XX-O-----', '0.0.0.1'), (boards['0.1.1.0'].lexstring(), boards['0.1.1.0'].alias))
+        self.assertTrue(boards['0.0.0.1.0'].block)
+        self.assertEqual('XXOO-----', boards['0.0.0.1.0'].lexstring())
+
+        # every alias is isomorphic to its (unaliased) target, and
+        # aliases are not expanded
+        for label, board in boards.items():
+            if not None == board.alias:
+                target = boards[board.alias]
+                self.assertEqual(None, target.alias)
+                self.assertEqual(board.canonicalForm()[0], target.canonicalForm()[0])
+                self.assertFalse(label + '.0' in boards)
+
+    def testGenerationStats(self):
+        stats = GenerationStats()
+        tree = GameTree()
+        tree.generateTree(True, verbose=False, stats=stats)
+        self.assertEqual(ALIASED_PLY_SIZES, stats.plySizes)
+        self.assertEqual(9, len(stats.plyTimes))
+        self.assertEqual(sum(ALIASED_PLY_SIZES), stats.childrenGenerated)
+        self.assertEqual(1319, stats.aliasesFound)
+        self.assertEqual(734, stats.blocksFound)
+
+        # the root and every board of plies 1-8 is either an alias
+        # (skipped), a win (pruned) or expanded
+        parents = [board for ply in tree.plies[:8] for board in ply]
+        skipped = [board for board in parents if not None == board.alias]
+        wins = [board for board in parents if None == board.alias and board.isWin()]
+        self.assertEqual(1279, stats.aliasesSkipped)
+        self.assertEqual(len(skipped), stats.aliasesSkipped)
+        self.assertEqual(197, stats.winsPruned)
+        self.assertEqual(len(wins), stats.winsPruned)
+        self.assertEqual(1 + len(parents) - len(skipped) - len(wins), stats.nodesExpanded)
+
+        stats.reset()
+        GameTree().generateTree(False, verbose=False, stats=stats)
+        self.assertEqual(0, stats.aliasesFound + stats.aliasesSkipped)
+        self.assertEqual(58523, stats.childrenGenerated)
+        self.assertEqual(31694, stats.nodesExpanded)
+        self.assertEqual(29358, stats.blocksFound)
+        self.assertEqual(13292, stats.winsPruned)
+
+    def testStreamedPlies(self):
+        for skipAliases in [True, False]:
+            tree = GameTree()
+            tree.generateTree(skipAliases, verbose=False)
+            expected = [plySummary(ply) for ply in tree.plies]
+
+            streamed = GameTree()
+            summaries = [plySummary(ply) for ply in streamed.generatePlies(skipAliases, verbose=False)]
+            self.assertEqual(expected, summaries)
+            # without keepHistory no plies are kept
+            self.assertEqual([], streamed.plies)
+
+        self.assertEqual(FULL_PLY_SIZES, [len(ply) for ply in expected])
+
+    def testStreamedPliesAreFreed(self):
+        # streamed boards don't reference their parents, so only the
+        # last ply and the one being yielded are alive
+        lastSize = 1
+        for ply in GameTree().generatePlies(False, verbose=False):
+            self.assertTrue(all([None == board.parent for board in ply]))
+            gc.collect()
+            liveBoards = len([item for item in gc.get_objects() if isinstance(item, Board)])
+            self.assertTrue(liveBoards <= lastSize + len(ply) + 1)
+            lastSize = len(ply)
+
+        # boards of a kept tree are still labeled through their parents
+        tree = GameTree()
+        tree.generateTree(True, verbose=False)
+        self.assertTrue(tree.plies[3][0].parent is tree.plies[2][0])
+
+    def testParallelGeneration(self):
+        serial = GameTree()
+        serialStats = GenerationStats()
+        serial.generateTree(True, verbose=False, stats=serialStats)
+
+        parallel = GameTree()
+        parallelStats = GenerationStats()
+        parallel.generateTree(True, verbose=False, stats=parallelStats, workers=2)
+        self.assertEqual([plySummary(ply) for ply in serial.plies],
+                         [plySummary(ply) for ply in parallel.plies])
+        self.assertEqual(serialStats.plySizes, parallelStats.plySizes)
+        self.assertEqual(serialStats.nodesExpanded, parallelStats.nodesExpanded)
+        self.assertEqual(serialStats.aliasesFound, parallelStats.aliasesFound)
+        self.assertEqual(serialStats.blocksFound, parallelStats.blocksFound)
+
+    def testDetermineAliases(self):
+        ply = []
+        for lexstring, label, block in [('XO-------', 'a', False),
+                                        ('X--O-----', 'b', False),
+                                        ('-X-O-----', 'c', False),
+                                        ('XO-------', 'd', True)]:
+            board = Board()
+            board.grid = lexstring
+            board.label = label
+            board.block = block
+            ply.append(board)
+
+        table = TranspositionTable()
+        self.assertEqual(2, GameTree.determineAliases(ply, table))
+        # 'XO' and 'X--O' are the same position up to symmetry, and the
+        # block board is preferred as their target
+        self.assertEqual(['d', 'd', None, None], [board.alias for board in ply])
+        self.assertEqual(2, len(table))
+
+    def testTranspositionTable(self):
+        table = TranspositionTable()
+        self.assertEqual(0, len(table))
+
+        # a miss records the board as the target for its code
+        self.assertEqual(None, table.resolve(7, '0.1'))
+        self.assertEqual(1, len(table))
+        # a hit from another board gives the target, but not for the target itself
+        self.assertEqual('0.1', table.resolve(7, '0.2'))
+        self.assertEqual(None, table.resolve(7, '0.1'))
+        self.assertEqual(None, table.resolve(8, '0.3'))
+
+        # blocks are preferred as targets, and the first block is kept
+        table.addBlock(7, '0.4')
+        table.addBlock(7, '0.5')
+        self.assertEqual('0.4', table.resolve(7, '0.1'))
+        self.assertEqual(None, table.resolve(7, '0.4'))
+        self.assertEqual(3, len(table))
+
+        table.clear()
+        self.assertEqual(0, len(table))
+        self.assertEqual(None, table.resolve(7, '0.2'))
+
+if __name__ == "__main__":
+    gametreetests_main()
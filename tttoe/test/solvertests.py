@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:05:22 2026
+
+@author: Christopher Corbell
+"""
+
+import os
+import tempfile
+import unittest
+
+from tttoe.board import Board
+from tttoe.gametree import GameTree
+from tttoe.positiondb import PositionDatabase
+from tttoe.solver import Solver
+
+def RunAllSolverTests():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.makeSuite(SolverTests))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
+
+def solvertests_main():
+    unittest.main()
+
+class SolverTests(unittest.TestCase):
+
+    def testEmptyBoardIsDraw(self):
+        solver = Solver()
+        value, bestMoves = solver.solve(Board())
+        self.assertEqual(Solver.DRAW, value)
+        self.assertEqual(list(range(0, 9)), bestMoves)
+
+        value, distance, bestMask = solver.analyze(Board())
+        self.assertEqual(9, distance)
+
+    def testWinAndBlock(self):
+        solver = Solver()
+
+        # X to play can win immediately at 2
+        board = Board()
+        board.grid = "XX-OO----"
+        value, bestMoves = solver.solve(board)
+        self.assertEqual(Solver.WIN, value)
+        self.assertEqual([2], bestMoves)
+        self.assertEqual(1, solver.analyze(board)[1])
+
+        # O to play must block at 2 to hold the draw
+        board.grid = "XX--O----"
+        self.assertEqual((Solver.DRAW, [2]), solver.solve(board))
+
+        # O must not answer opposite corners with a corner
+        board.grid = "X---O---X"
+        self.assertEqual((Solver.DRAW, [1, 3, 5, 7]), solver.solve(board))
+
+        # a finished game has no moves
+        board.grid = "XXXOO----"
+        self.assertEqual((Solver.LOSS, []), solver.solve(board))
+        self.assertEqual(0, solver.analyze(board)[1])
+
+    def testSymmetricBoardsAgree(self):
+        solver = Solver()
+        board = Board()
+        board.xplay(0)
+        board.oplay(1)
+
+        rotated = board.copy()
+        rotated.rotate()
+
+        value, bestMoves = solver.solve(board)
+        rotatedValue, rotatedBestMoves = solver.solve(rotated)
+        self.assertEqual(Solver.WIN, value)
+        self.assertEqual(value, rotatedValue)
+
+        # rotating each best move gives the best moves of the rotated board
+        for move in bestMoves:
+            marker = Board()
+            marker.xplay(move, enforceLegalMove=False)
+            marker.rotate()
+            self.assertIn(marker.X_indices()[0], rotatedBestMoves)
+        self.assertEqual(len(bestMoves), len(rotatedBestMoves))
+
+    def testGameTreeSolve(self):
+        tree = GameTree()
+        self.assertEqual(Solver.DRAW, tree.solve()[0])
+        self.assertEqual(0, len(tree.plies))
+
+    def testPositionDatabase(self):
+        solver = Solver()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "positions.db")
+            self.assertEqual(765, PositionDatabase.export(path, solver))
+
+            with PositionDatabase(path) as database:
+                self.assertEqual(765, len(database))
+                self.assertEqual('0', database.label(Board()))
+
+                board = Board()
+                board.xplay(0)
+                board.oplay(4)
+                board.xplay(8)
+                value, distance, bestMask = solver.analyze(board)
+                self.assertEqual((value, distance, Board.bit_indices(bestMask)),
+                                 database.lookup(board))
+                self.assertEqual(3, database.label(board).count('.'))
+
+                unreachable = Board()
+                unreachable.grid = "XXXOOOX--"
+                self.assertEqual(None, database.lookup(unreachable))
+
+if __name__ == "__main__":
+    solvertests_main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:20:05 2026
+
+@author: Christopher Corbell
+"""
+
+class TranspositionTable:
+    """
+    A TranspositionTable records, for each canonical board code, the label
+    of the board which continues that position in a GameTree. Other boards
+    with the same canonical code are aliases of that board.
+
+    Block boards are kept separately so they can be preferred as alias
+    targets (see GameTree.determineAliases).
+
+    Boards of different plies never share a canonical code, so one table
+    can serve every ply of a tree. Since labels are assigned deterministically,
+    the table can also be kept across repeated generateTree runs from the
+    same root.
+    """
+
+    def __init__(self):
+        self.blockTargets = {}
+        self.targets = {}
+
+    def __len__(self):
+        return len(self.blockTargets) + len(self.targets)
+
+    def clear(self):
+        self.blockTargets.clear()
+        self.targets.clear()
+
+    def addBlock(self, code, label):
+        """
+        Record a block board as an alias target for its canonical code,
+        unless an earlier block board already holds that code.
+        """
+        if not code in self.blockTargets:
+            self.blockTargets[code] = label
+
+    def resolve(self, code, label):
+        """
+        Find the alias target for a (non-block) board.
+
+        Parameters
+        ----------
+        code : int
+            The canonical code of the board.
+        label : str
+            The label of the board.
+
+        Returns
+        -------
+        str (or None)
+            The label of the board this one is an alias of, or None if
+            this board is the target for its code (it is then recorded
+            as such if no target was known).
+
+        """
+        target = self.blockTargets.get(code)
+        if None == target:
+            target = self.targets.get(code)
+            if None == target:
+                self.targets[code] = label
+                return None
+        if target == label:
+            return None
+        return target